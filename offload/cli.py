@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
+import os
 import click
 from offload.photo_offloader import PhotoOffloader
 from offload.video_offloader import VideoOffloader
@@ -8,6 +9,9 @@ from offload.video_offloader import VideoOffloader
 CONTEXT_SETTINGS = {
     'help_option_names': ['-h', '--help']
 }
+# Metadata cache used when --metadata-cache is given without a path, following the XDG base directory spec
+DEFAULT_METADATA_CACHE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'offload', 'videos.sqlite')
 
 
 @click.command(context_settings=CONTEXT_SETTINGS)
@@ -26,7 +30,16 @@ CONTEXT_SETTINGS = {
                    ' instead of saving them to unknown directory')
 @click.option('--use-file-date', is_flag=True, default=False,
               help='Use file creation date as fallback when EXIF/metadata date is not available')
-def main(source, destination, archive, media_type, log_level, skip_unknown, use_file_date):
+@click.option('--workers', type=click.IntRange(min=1), default=1,
+              help='Number of parallel workers used to read photo and video metadata (default: 1)')
+@click.option('--hardlink', is_flag=True, default=False,
+              help='Hard link videos into the destination instead of copying them when it is on the same filesystem')
+@click.option('--metadata-cache', type=click.Path(file_okay=True, dir_okay=False), default=None,
+              is_flag=False, flag_value=DEFAULT_METADATA_CACHE,
+              help='SQLite file caching video metadata between runs; $XDG_CACHE_HOME/offload/videos.sqlite'
+                   ' if given without a path (default: no cache)')
+def main(source, destination, archive, media_type, log_level, skip_unknown, use_file_date, workers, hardlink,
+         metadata_cache):
     # Create a basic logger
     logger = logging.getLogger('offload')
 
@@ -44,14 +57,17 @@ def main(source, destination, archive, media_type, log_level, skip_unknown, use_
         photo_app = PhotoOffloader(logger)
         photo_app.offload_photos(
             source, destination, to_archive=archive,
-            keep_unknown=not skip_unknown, use_file_date=use_file_date)
+            keep_unknown=not skip_unknown, use_file_date=use_file_date, workers=workers)
 
     # Process videos if requested
     if media_type in ['videos', 'both']:
-        video_app = VideoOffloader(logger)
-        video_app.offload_videos(
-            source, destination, to_archive=archive,
-            keep_unknown=not skip_unknown, use_file_date=use_file_date)
+        video_app = VideoOffloader(logger, cache_path=metadata_cache)
+        try:
+            video_app.offload_videos(
+                source, destination, to_archive=archive,
+                keep_unknown=not skip_unknown, use_file_date=use_file_date, workers=workers, hardlink=hardlink)
+        finally:
+            video_app.close()
 
 
 if __name__ == '__main__':  # pragma: no cover
@@ -25,3 +25,23 @@ NEGATIVE_DIRECTIONS = ['S', 'W']  # Directions that make coordinates negative
 YEAR_MONTH_SEPARATOR = "-"
 YEAR_PREFIX = "year="
 MONTH_PREFIX = "month="
+
+# Metadata field names that can be extracted from a media file
+DATE_FIELD = "date"
+LOCATION_FIELD = "location"
+CAMERA_MAKE_FIELD = "camera_make"
+CAMERA_MODEL_FIELD = "camera_model"
+SOFTWARE_FIELD = "software"
+ALL_METADATA_FIELDS = frozenset({
+    DATE_FIELD, LOCATION_FIELD, CAMERA_MAKE_FIELD, CAMERA_MODEL_FIELD, SOFTWARE_FIELD,
+})
+
+# Metadata fields needed to compute the bucket/sort key for each GroupBy value
+GROUP_BY_FIELDS = {
+    GroupBy.SOFTWARE: frozenset({SOFTWARE_FIELD}),
+    GroupBy.CAMERA_MAKE: frozenset({CAMERA_MAKE_FIELD}),
+    GroupBy.CAMERA_MODEL: frozenset({CAMERA_MODEL_FIELD}),
+    GroupBy.YEAR: frozenset({DATE_FIELD}),
+    GroupBy.YEAR_MONTH: frozenset({DATE_FIELD}),
+    GroupBy.YEAR_MONTH_DAY: frozenset({DATE_FIELD}),
+}
@@ -1,22 +1,39 @@
 # -*- coding: utf-8 -*-
 import logging
+import math
+import multiprocessing
+import operator
+import os
+import re
 import shutil
+import stat
+import struct
 import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Callable, Iterable, Iterator, Optional
 
 from PIL import Image
 from PIL.ExifTags import GPS, TAGS
 from pillow_heif import register_heif_opener
 
 from offload.constants import (
+    ALL_METADATA_FIELDS,
+    CAMERA_MAKE_FIELD,
+    CAMERA_MODEL_FIELD,
+    DATE_FIELD,
     DEFAULT_LATITUDE_REF,
     DEFAULT_LONGITUDE_REF,
+    GROUP_BY_FIELDS,
     GroupBy,
+    LOCATION_FIELD,
     MONTH_PREFIX,
     NEGATIVE_DIRECTIONS,
+    SOFTWARE_FIELD,
     UNKNOWN_BUCKET_KEY,
     UNKNOWN_DIRECTORY,
     YEAR_MONTH_SEPARATOR,
@@ -26,7 +43,7 @@ from offload.constants import (
 register_heif_opener()
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotoMetadata:
     """Metadata extracted from a photo file."""
     path: Path
@@ -40,17 +57,23 @@ class PhotoMetadata:
 class PhotoOffloader:
     # Supported photo file extensions
     # TODO: Allow this to be configured via environment variable
-    PHOTO_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.heic', '.heif'}
+    PHOTO_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.heic', '.heif'})
 
     # EXIF tag ID for GPSInfo (GPS IFD)
     GPS_INFO_TAG_ID = 34853
 
     # Date field names in order of preference for extraction
-    DATE_FIELDS = ['DateTimeOriginal', 'DateTimeDigitized', 'DateTime']
+    DATE_FIELDS = ('DateTimeOriginal', 'DateTimeDigitized', 'DateTime')
+
+    # Pattern of a year-month bucket key (format: "YYYY-MM")
+    YEAR_MONTH_PATTERN = re.compile(rf'(\d+){re.escape(YEAR_MONTH_SEPARATOR)}(\d+)')
 
     # EXIF date format string
     EXIF_DATE_FORMAT = '%Y:%m:%d %H:%M:%S'
 
+    # Length of an EXIF date string in the canonical "YYYY:MM:DD HH:MM:SS" format
+    EXIF_DATE_LENGTH = 19
+
     # GPS tag IDs: 1=LatitudeRef, 2=Latitude, 3=LongitudeRef, 4=Longitude
     GPS_LATITUDE_REF_TAG_ID = 1
     GPS_LATITUDE_TAG_ID = 2
@@ -62,13 +85,70 @@ class PhotoOffloader:
     CAMERA_MODEL_TAG = 'Model'
     CAMERA_SOFTWARE_TAG = 'Software'
 
+    # Metadata fields that are parsed together by _parse_exif_camera_info
+    CAMERA_INFO_FIELDS = frozenset({CAMERA_MAKE_FIELD, CAMERA_MODEL_FIELD, SOFTWARE_FIELD})
+
+    # Date sort value for photos without a date, so they sort after every dated photo
+    UNKNOWN_DATE_SORT_VALUE = math.inf
+
+    # Time unit conversion constants for date sort values
+    MONTHS_PER_YEAR = 12
+    ONE_MICROSECOND = timedelta(microseconds=1)
+
     # DMS to decimal conversion constants
     MINUTES_PER_DEGREE = 60.0
     SECONDS_PER_DEGREE = 3600.0
 
+    # JPEG markers used to find the EXIF segment without opening the file in Pillow
+    JPEG_SIGNATURE = b'\xff\xd8'
+    JPEG_APP1_MARKER = 0xE1
+    JPEG_END_OF_HEADER_MARKERS = frozenset({0xDA, 0xD9})  # Start of scan, end of image
+    EXIF_HEADER = b'Exif\x00\x00'
+
+    # PNG chunks used to find the EXIF data without opening the file in Pillow
+    PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+    PNG_EXIF_CHUNK = b'eXIf'
+    PNG_END_CHUNK = b'IEND'
+    PNG_TEXT_CHUNKS = frozenset({b'tEXt', b'zTXt', b'iTXt'})
+    PNG_RAW_EXIF_KEYWORD = b'Raw profile type exif\x00'
+
+    # Number of bytes read from the start of a file to find its EXIF data
+    EXIF_READ_SIZE = 65536
+
+    # TIFF structure constants used to parse EXIF data
+    TIFF_BYTE_ORDERS = {b'II': '<', b'MM': '>'}
+    TIFF_MAGIC = 42
+    TIFF_ASCII_TYPE = 2
+    EXIF_IFD_POINTER_TAG_ID = 0x8769
+
+    # EXIF tag IDs read without Pillow, mapped to the tag names used in PIL.ExifTags.TAGS
+    FAST_EXIF_TAGS = {
+        0x010F: 'Make',
+        0x0110: 'Model',
+        0x0131: 'Software',
+        0x0132: 'DateTime',
+        0x9003: 'DateTimeOriginal',
+        0x9004: 'DateTimeDigitized',
+    }
+
     # Archive filename
     ARCHIVE_FILENAME = "photos.zip"
 
+    # Every supported photo format is already compressed, so deflating it again only costs CPU time
+    ARCHIVE_COMPRESSION = zipfile.ZIP_STORED
+
+    # Buffer size used when streaming photos into an archive
+    ARCHIVE_BUFFER_SIZE = 1024 * 1024
+
+    # Maximum number of threads used to copy photos concurrently
+    COPY_MAX_WORKERS = 32
+
+    # Number of photos handed to a worker process at a time when extracting metadata in parallel
+    METADATA_CHUNK_SIZE = 16
+    # Start method of the worker processes; forking a process that already runs threads may deadlock the
+    # children, so they are started from a clean server process where supported, or spawned otherwise
+    PROCESS_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
     def __init__(self, logger: logging.Logger):
         """
         Initialize the PhotoOffloader.
@@ -79,8 +159,13 @@ class PhotoOffloader:
         self.logger = logger
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _dms_to_decimal(dms: tuple, ref: str) -> float:
-        """Convert degrees, minutes, seconds to decimal degrees."""
+        """
+        Convert degrees, minutes, seconds to decimal degrees.
+
+        Results are cached, as photos taken at the same place share their coordinates.
+        """
         degrees = float(dms[0])
         minutes = float(dms[1]) / PhotoOffloader.MINUTES_PER_DEGREE
         seconds = float(dms[2]) / PhotoOffloader.SECONDS_PER_DEGREE
@@ -93,13 +178,32 @@ class PhotoOffloader:
         for field in PhotoOffloader.DATE_FIELDS:
             if field in exif_data:
                 try:
-                    date_str = exif_data[field]
-                    # EXIF date format: "YYYY:MM:DD HH:MM:SS"
-                    return datetime.strptime(date_str, PhotoOffloader.EXIF_DATE_FORMAT)
+                    return PhotoOffloader._parse_exif_date_str(exif_data[field])
                 except (ValueError, TypeError):
                     continue
         return None
 
+    @staticmethod
+    def _parse_exif_date_str(date_str: str) -> datetime:
+        """
+        Parse an EXIF date string in the "YYYY:MM:DD HH:MM:SS" format.
+
+        Canonical strings are sliced into their fields directly, which is much faster than strptime;
+        anything else goes through strptime.
+
+        Raises:
+            ValueError: If the string is not a valid EXIF date
+            TypeError: If the value is not a string
+        """
+        if (len(date_str) == PhotoOffloader.EXIF_DATE_LENGTH and date_str[4] == ':' and date_str[7] == ':'
+                and date_str[10] == ' ' and date_str[13] == ':' and date_str[16] == ':'):
+            try:
+                return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                                int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]))
+            except ValueError:
+                pass
+        return datetime.strptime(date_str, PhotoOffloader.EXIF_DATE_FORMAT)
+
     def _parse_exif_location(self, exif_data, exif_dict: dict) -> Optional[tuple[float, float]]:
         """
         Parse GPS location from EXIF data.
@@ -126,8 +230,9 @@ class PhotoOffloader:
             if lat_data is None or lon_data is None:
                 return None
 
-            latitude = PhotoOffloader._dms_to_decimal(lat_data, lat_ref)
-            longitude = PhotoOffloader._dms_to_decimal(lon_data, lon_ref)
+            # Coordinates must be hashable tuples for the conversion cache
+            latitude = PhotoOffloader._dms_to_decimal(tuple(lat_data), lat_ref)
+            longitude = PhotoOffloader._dms_to_decimal(tuple(lon_data), lon_ref)
 
             return (latitude, longitude)
         except (KeyError, TypeError, ValueError, IndexError, AttributeError):
@@ -155,22 +260,176 @@ class PhotoOffloader:
     def _get_file_creation_date(file_path: Path) -> Optional[datetime]:
         """Get file creation date from filesystem metadata."""
         try:
-            stat = file_path.stat()
+            file_stat = file_path.stat()
             # Try st_birthtime (available on macOS and some BSD systems)
-            if hasattr(stat, 'st_birthtime'):
-                return datetime.fromtimestamp(stat.st_birthtime)
+            if hasattr(file_stat, 'st_birthtime'):
+                return datetime.fromtimestamp(file_stat.st_birthtime)
             # Fallback to st_mtime (modification time) on systems without birthtime
-            return datetime.fromtimestamp(stat.st_mtime)
+            return datetime.fromtimestamp(file_stat.st_mtime)
         except (OSError, ValueError) as e:
             return None
 
-    def _extract_metadata(self, file_path: Path, use_file_date: bool = False) -> PhotoMetadata:
+    @staticmethod
+    def _find_jpeg_exif(data: bytes) -> Optional[memoryview]:
+        """
+        Find the TIFF-formatted EXIF payload of the APP1 segment in the start of a JPEG file.
+
+        Returns:
+            The EXIF payload, an empty memoryview if the JPEG has no EXIF segment,
+            or None if the segment could not be found in the data that was read
+        """
+        offset = len(PhotoOffloader.JPEG_SIGNATURE)
+        while offset + 4 <= len(data):
+            if data[offset] != 0xFF:
+                return None
+            marker = data[offset + 1]
+            if marker == 0xFF:
+                # Fill byte before the actual marker
+                offset += 1
+                continue
+            if marker in PhotoOffloader.JPEG_END_OF_HEADER_MARKERS:
+                # Image data starts, so there is no EXIF segment
+                return memoryview(b'')
+
+            (length,) = struct.unpack_from('>H', data, offset + 2)
+            segment_start = offset + 4
+            segment_end = offset + 2 + length
+            if (marker == PhotoOffloader.JPEG_APP1_MARKER
+                    and data[segment_start:segment_start + len(PhotoOffloader.EXIF_HEADER)]
+                    == PhotoOffloader.EXIF_HEADER):
+                if segment_end > len(data):
+                    return None
+                return memoryview(data)[segment_start + len(PhotoOffloader.EXIF_HEADER):segment_end]
+            offset = segment_end
+        return None
+
+    @staticmethod
+    def _read_tiff_ascii_tags(tiff: memoryview, byte_order: str, ifd_offset: int, tags: dict) -> Optional[int]:
+        """
+        Read the ASCII tags listed in FAST_EXIF_TAGS from one IFD of a TIFF structure into tags.
+
+        Returns:
+            Offset of the Exif IFD if the IFD points to one, otherwise None
+        """
+        exif_ifd_offset = None
+        (entry_count,) = struct.unpack_from(byte_order + 'H', tiff, ifd_offset)
+        for entry_offset in range(ifd_offset + 2, ifd_offset + 2 + entry_count * 12, 12):
+            tag_id, tag_type, count = struct.unpack_from(byte_order + 'HHI', tiff, entry_offset)
+            if tag_id == PhotoOffloader.EXIF_IFD_POINTER_TAG_ID:
+                (exif_ifd_offset,) = struct.unpack_from(byte_order + 'I', tiff, entry_offset + 8)
+            elif tag_id in PhotoOffloader.FAST_EXIF_TAGS and tag_type == PhotoOffloader.TIFF_ASCII_TYPE:
+                # Values of up to 4 bytes are stored inline, longer values are stored at an offset
+                if count <= 4:
+                    value_offset = entry_offset + 8
+                else:
+                    (value_offset,) = struct.unpack_from(byte_order + 'I', tiff, entry_offset + 8)
+                if value_offset + count > len(tiff):
+                    raise ValueError("EXIF tag value is out of bounds")
+                value = bytes(tiff[value_offset:value_offset + count]).split(b'\x00', 1)[0]
+                tags[PhotoOffloader.FAST_EXIF_TAGS[tag_id]] = value.decode('latin-1')
+        return exif_ifd_offset
+
+    @staticmethod
+    def _find_png_exif(f) -> Optional[memoryview]:
+        """
+        Find the TIFF-formatted EXIF payload of the eXIf chunk in an open PNG file.
+
+        Chunks are skipped by seeking, so image data is never read.
+
+        Returns:
+            The EXIF payload, an empty memoryview if the PNG has no EXIF data,
+            or None if the EXIF data is stored in a text chunk that only Pillow can read
+        """
+        f.seek(len(PhotoOffloader.PNG_SIGNATURE))
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return memoryview(b'')
+            length, chunk_type = struct.unpack('>I4s', header)
+            if chunk_type == PhotoOffloader.PNG_EXIF_CHUNK:
+                return memoryview(f.read(length))
+            if chunk_type == PhotoOffloader.PNG_END_CHUNK:
+                return memoryview(b'')
+            if chunk_type in PhotoOffloader.PNG_TEXT_CHUNKS:
+                keyword = f.read(min(length, len(PhotoOffloader.PNG_RAW_EXIF_KEYWORD)))
+                if keyword == PhotoOffloader.PNG_RAW_EXIF_KEYWORD:
+                    return None
+                length -= len(keyword)
+            # Skip the rest of the chunk data and its CRC
+            f.seek(length + 4, os.SEEK_CUR)
+
+    @staticmethod
+    def _read_exif_fast(file_path: Path) -> Optional[dict]:
+        """
+        Read the date and camera EXIF tags of a JPEG or PNG file without opening it in Pillow.
+
+        The file type is detected from its first bytes and only the EXIF segment or chunk is
+        read and parsed; the image itself is never decoded.
+
+        Returns:
+            Dictionary of EXIF tag names to values, or None if the file is neither a JPEG nor a PNG,
+            whatever its extension, or its EXIF data could not be parsed and Pillow should be used instead
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read(PhotoOffloader.EXIF_READ_SIZE)
+
+            try:
+                if data.startswith(PhotoOffloader.JPEG_SIGNATURE):
+                    tiff = PhotoOffloader._find_jpeg_exif(data)
+                elif data.startswith(PhotoOffloader.PNG_SIGNATURE):
+                    tiff = PhotoOffloader._find_png_exif(f)
+                else:
+                    tiff = None
+            except struct.error:
+                # Malformed file, let Pillow deal with it
+                return None
+
+        if tiff is None:
+            # Other formats, including HEIC or TIFF data saved with a .jpg extension, are read by Pillow
+            return None
+        if not tiff:
+            return {}
+
+        try:
+            byte_order = PhotoOffloader.TIFF_BYTE_ORDERS.get(bytes(tiff[:2]))
+            if byte_order is None:
+                return None
+            magic, ifd0_offset = struct.unpack_from(byte_order + 'HI', tiff, 2)
+            if magic != PhotoOffloader.TIFF_MAGIC:
+                return None
+
+            tags = {}
+            exif_ifd_offset = PhotoOffloader._read_tiff_ascii_tags(tiff, byte_order, ifd0_offset, tags)
+            if exif_ifd_offset:
+                PhotoOffloader._read_tiff_ascii_tags(tiff, byte_order, exif_ifd_offset, tags)
+            return tags
+        except (struct.error, ValueError):
+            # Malformed EXIF data, let Pillow deal with it
+            return None
+
+    @staticmethod
+    def _exif_to_dict(exif_data: Image.Exif) -> dict:
+        """
+        Convert Pillow EXIF data to a dict keyed by tag name.
+
+        Tags from the Exif sub-IFD take precedence over IFD0, matching _read_exif_fast.
+        """
+        exif_dict = {TAGS.get(tag_id, tag_id): value for tag_id, value in exif_data.items()}
+        exif_ifd = exif_data.get_ifd(PhotoOffloader.EXIF_IFD_POINTER_TAG_ID)
+        exif_dict.update((TAGS.get(tag_id, tag_id), value) for tag_id, value in exif_ifd.items())
+        return exif_dict
+
+    def _extract_metadata(
+        self, file_path: Path, use_file_date: bool = False,
+        fields_needed: AbstractSet[str] = ALL_METADATA_FIELDS
+    ) -> PhotoMetadata:
         """
         Extract metadata from a photo file.
 
         Args:
             file_path: Path to the photo file
             use_file_date: If True and EXIF date is not available, use file creation date as fallback
+            fields_needed: Names of the metadata fields to parse; fields not in the set are left as None
         """
         date_taken = None
         location = None
@@ -179,24 +438,32 @@ class PhotoOffloader:
         software = None
 
         try:
-            with Image.open(file_path) as img:
-                exif_data = img.getexif()
-                if exif_data:
-                    # Convert EXIF to a more usable format
-                    exif_dict = {}
-                    for tag_id, value in exif_data.items():
-                        tag = TAGS.get(tag_id, tag_id)
-                        exif_dict[tag] = value
-
+            exif_dict = None
+            if LOCATION_FIELD not in fields_needed:
+                # Without GPS data, the tags can be read straight from the file without opening it in Pillow
+                exif_dict = PhotoOffloader._read_exif_fast(file_path)
+            if exif_dict is None:
+                with Image.open(file_path) as img:
+                    # Decode the EXIF data once; the date and camera parsers share the resulting dict
+                    exif_data = img.getexif()
+                    if exif_data:
+                        exif_dict = PhotoOffloader._exif_to_dict(exif_data)
+
+                        if LOCATION_FIELD in fields_needed:
+                            location = self._parse_exif_location(exif_data, exif_dict)
+
+            # Only parse the fields the caller asked for
+            if exif_dict:
+                if DATE_FIELD in fields_needed:
                     date_taken = self._parse_exif_date(exif_dict)
-                    location = self._parse_exif_location(exif_data, exif_dict)
+                if not PhotoOffloader.CAMERA_INFO_FIELDS.isdisjoint(fields_needed):
                     camera_make, camera_model, software = self._parse_exif_camera_info(exif_dict)
         except Exception as e:
             # If we can't read the image or extract metadata, continue with None values
             self.logger.warning("Failed to extract metadata from %s: %s", file_path, e)
 
         # Use file creation date as fallback if EXIF date is not available
-        if date_taken is None and use_file_date:
+        if date_taken is None and use_file_date and DATE_FIELD in fields_needed:
             date_taken = PhotoOffloader._get_file_creation_date(file_path)
             if date_taken is not None:
                 self.logger.debug("Using file creation date for %s: %s", file_path, date_taken)
@@ -210,103 +477,256 @@ class PhotoOffloader:
             software=software
         )
 
-    def read_photos(self, source_dir: str | Path, use_file_date: bool = False) -> list[PhotoMetadata]:
+    @staticmethod
+    def _iter_photo_entries(photos_dir: str | Path) -> Iterator[os.DirEntry]:
+        """
+        Yield the directory entries of photo files directly inside a directory.
+
+        Entries are filtered by name first, and is_file() uses the file type cached by os.scandir,
+        so non-photo entries cost no extra system calls. Symlinks to photo files are followed.
         """
-        Read all photo files from the source directory and extract their metadata.
+        with os.scandir(photos_dir) as entries:
+            for entry in entries:
+                if (os.path.splitext(entry.name)[1].lower() in PhotoOffloader.PHOTO_EXTENSIONS
+                        and entry.is_file()):
+                    yield entry
+
+    @staticmethod
+    def _iter_photo_paths(photos_dir: Path) -> Iterator[Path]:
+        """Yield the paths of photo files directly inside a directory."""
+        for entry in PhotoOffloader._iter_photo_entries(photos_dir):
+            yield Path(entry.path)
+
+    def iter_photos(
+        self, source_dir: str | Path, use_file_date: bool = False,
+        fields_needed: AbstractSet[str] = ALL_METADATA_FIELDS, workers: int = 1
+    ) -> Iterator[PhotoMetadata]:
+        """
+        Iterate over the photo files in the source directory, extracting their metadata one at a time.
+
+        The source directory is checked immediately, but photos are only read as the iterator is consumed,
+        so the metadata of a whole library never has to be held in memory at once.
 
         Args:
             source_dir: Path to the directory where photos are stored
             use_file_date: If True and EXIF date is not available, use file creation date as fallback
+            fields_needed: Names of the metadata fields to parse; fields not in the set are left as None
+            workers: Number of processes used to extract metadata; 1 extracts it in the current process
 
         Returns:
-            List of PhotoMetadata objects containing path, date_taken, location,
+            Iterator of PhotoMetadata objects containing path, date_taken, location,
             camera_make, camera_model, and software
         """
         photos_dir = Path(source_dir)
-        if not photos_dir.exists():
+        # A single stat call answers both the existence and the directory checks. Like Path.exists, any
+        # error reading the path, such as a permission error or a symlink loop, counts as missing.
+        try:
+            dir_stat = os.stat(photos_dir)
+        except OSError:
             raise ValueError(f"Directory does not exist: {source_dir}")
-        if not photos_dir.is_dir():
+        if not stat.S_ISDIR(dir_stat.st_mode):
             raise ValueError(f"Path is not a directory: {source_dir}")
 
         self.logger.debug("Reading photos from %s", source_dir)
-        photos = []
-        for file_path in photos_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in PhotoOffloader.PHOTO_EXTENSIONS:
-                photo_metadata = self._extract_metadata(file_path, use_file_date=use_file_date)
-                photos.append(photo_metadata)
+        extract = partial(self._extract_metadata, use_file_date=use_file_date, fields_needed=fields_needed)
+        if workers > 1:
+            return self._iter_photos_in_processes(photos_dir, extract, workers, self.logger)
+        return map(extract, PhotoOffloader._iter_photo_paths(photos_dir))
 
+    @staticmethod
+    def _init_worker_logging(logger_name: str, level: int, formatter: Optional[logging.Formatter]) -> None:
+        """
+        Set up the logger in a worker process like the parent's, as processes that are not forked
+        do not inherit its level or handlers.
+
+        Args:
+            logger_name: Name of the logger used by the offloader
+            level: Effective logging level of the logger in the parent process
+            formatter: Formatter of the logger's first handler in the parent process, if it has one
+        """
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(level)
+        if formatter is not None and not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+
+    @staticmethod
+    def _iter_photos_in_processes(
+        photos_dir: Path, extract: Callable[[Path], PhotoMetadata], workers: int, logger: logging.Logger
+    ) -> Iterator[PhotoMetadata]:
+        """Extract the metadata of the photos in a directory across a pool of worker processes."""
+        photo_paths = list(PhotoOffloader._iter_photo_paths(photos_dir))
+        if len(photo_paths) <= 1:
+            yield from map(extract, photo_paths)
+            return
+        formatter = logger.handlers[0].formatter if logger.handlers else None
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(PhotoOffloader.PROCESS_START_METHOD),
+            initializer=PhotoOffloader._init_worker_logging,
+            initargs=(logger.name, logger.getEffectiveLevel(), formatter)
+        ) as executor:
+            yield from executor.map(extract, photo_paths, chunksize=PhotoOffloader.METADATA_CHUNK_SIZE)
+
+    def read_photos(
+        self, source_dir: str | Path, use_file_date: bool = False,
+        fields_needed: AbstractSet[str] = ALL_METADATA_FIELDS, workers: int = 1
+    ) -> list[PhotoMetadata]:
+        """
+        Read all photo files from the source directory and extract their metadata.
+
+        Args:
+            source_dir: Path to the directory where photos are stored
+            use_file_date: If True and EXIF date is not available, use file creation date as fallback
+            fields_needed: Names of the metadata fields to parse; fields not in the set are left as None
+            workers: Number of processes used to extract metadata; 1 extracts it in the current process
+
+        Returns:
+            List of PhotoMetadata objects containing path, date_taken, location,
+            camera_make, camera_model, and software
+        """
+        photos = list(self.iter_photos(
+            source_dir, use_file_date=use_file_date, fields_needed=fields_needed, workers=workers))
         self.logger.info("Read photos from %s, found %d photo(s)", source_dir, len(photos))
         return photos
 
+    @staticmethod
+    def _get_software_bucket_key(photo: PhotoMetadata) -> str:
+        """Get the bucket key for a photo grouped by software."""
+        return photo.software if photo.software is not None else UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_camera_make_bucket_key(photo: PhotoMetadata) -> str:
+        """Get the bucket key for a photo grouped by camera make."""
+        return photo.camera_make if photo.camera_make is not None else UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_camera_model_bucket_key(photo: PhotoMetadata) -> str:
+        """Get the bucket key for a photo grouped by camera model."""
+        return photo.camera_model if photo.camera_model is not None else UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_year_bucket_key(photo: PhotoMetadata) -> str:
+        """Get the bucket key for a photo grouped by year taken."""
+        return str(photo.date_taken.year) if photo.date_taken is not None else UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_year_month_bucket_key(photo: PhotoMetadata) -> str:
+        """Get the bucket key for a photo grouped by year and month taken."""
+        if photo.date_taken is not None:
+            return f"{photo.date_taken.year}{YEAR_MONTH_SEPARATOR}{photo.date_taken.month:02d}"
+        return UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_year_month_day_bucket_key(photo: PhotoMetadata) -> str:
+        """Get the bucket key for a photo grouped by date taken."""
+        if photo.date_taken is not None:
+            day = photo.date_taken.day
+            return (f"{photo.date_taken.year}{YEAR_MONTH_SEPARATOR}"
+                    f"{photo.date_taken.month:02d}{YEAR_MONTH_SEPARATOR}{day:02d}")
+        return UNKNOWN_BUCKET_KEY
+
+    # Bucket key function for each group_by parameter, so the dispatch happens once per call
+    # instead of once per photo
+    BUCKET_KEY_FUNCTIONS: dict[GroupBy, Callable[[PhotoMetadata], str]] = {
+        GroupBy.SOFTWARE: _get_software_bucket_key,
+        GroupBy.CAMERA_MAKE: _get_camera_make_bucket_key,
+        GroupBy.CAMERA_MODEL: _get_camera_model_bucket_key,
+        GroupBy.YEAR: _get_year_bucket_key,
+        GroupBy.YEAR_MONTH: _get_year_month_bucket_key,
+        GroupBy.YEAR_MONTH_DAY: _get_year_month_day_bucket_key,
+    }
+
+    # Date components that identify a bucket for each date-based group_by parameter
+    DATE_BUCKET_COMPONENTS = {
+        GroupBy.YEAR: operator.attrgetter('year'),
+        GroupBy.YEAR_MONTH: operator.attrgetter('year', 'month'),
+        GroupBy.YEAR_MONTH_DAY: operator.attrgetter('year', 'month', 'day'),
+    }
+
+    def _get_bucket_key_function(self, group_by: GroupBy) -> Callable[[PhotoMetadata], str]:
+        """Get the function that computes the bucket key of a photo for the group_by parameter."""
+        try:
+            return PhotoOffloader.BUCKET_KEY_FUNCTIONS[group_by]
+        except KeyError:
+            raise ValueError(f"Unsupported group_by parameter: {group_by}") from None
+
     def _get_bucket_key(self, photo: PhotoMetadata, group_by: GroupBy) -> str:
         """Get the bucket key for a photo based on the group_by parameter."""
-        if group_by == GroupBy.SOFTWARE:
-            return photo.software if photo.software is not None else UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.CAMERA_MAKE:
-            return photo.camera_make if photo.camera_make is not None else UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.CAMERA_MODEL:
-            return photo.camera_model if photo.camera_model is not None else UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.YEAR:
-            return str(photo.date_taken.year) if photo.date_taken is not None else UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.YEAR_MONTH:
-            if photo.date_taken is not None:
-                return f"{photo.date_taken.year}{YEAR_MONTH_SEPARATOR}{photo.date_taken.month:02d}"
-            return UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.YEAR_MONTH_DAY:
-            if photo.date_taken is not None:
-                day = photo.date_taken.day
-                return (f"{photo.date_taken.year}{YEAR_MONTH_SEPARATOR}"
-                        f"{photo.date_taken.month:02d}{YEAR_MONTH_SEPARATOR}{day:02d}")
-            return UNKNOWN_BUCKET_KEY
-        else:
-            raise ValueError(f"Unsupported group_by parameter: {group_by}")
+        return self._get_bucket_key_function(group_by)(photo)
 
-    def bucket_photos(self, photos: list[PhotoMetadata], group_by: GroupBy) -> dict[str, list[PhotoMetadata]]:
+    def bucket_photos(
+        self, photos: Iterable[PhotoMetadata], group_by: GroupBy
+    ) -> dict[str, list[PhotoMetadata]]:
         """
         Group photos by a specified parameter.
 
         Args:
-            photos: List of PhotoMetadata objects to bucket
+            photos: PhotoMetadata objects to bucket; any iterable is consumed in a single pass
             group_by: Enum specifying which parameter to bucket by
 
         Returns:
             Dictionary where keys are the bucket values and values are lists of PhotoMetadata
         """
-        self.logger.debug("Bucketing %d photo(s) by %s", len(photos), group_by.value)
-        buckets: dict[str, list[PhotoMetadata]] = {}
-
-        for photo in photos:
-            key = self._get_bucket_key(photo, group_by)
-            buckets.setdefault(key, []).append(photo)
+        self.logger.debug("Bucketing photos by %s", group_by.value)
+        key_function = self._get_bucket_key_function(group_by)
+        get_date_components = PhotoOffloader.DATE_BUCKET_COMPONENTS.get(group_by)
+
+        if get_date_components is not None:
+            # Group on the date components first and format each distinct bucket key once,
+            # instead of formatting a key string for every photo
+            date_buckets: defaultdict[Optional[int | tuple[int, ...]], list[PhotoMetadata]] = defaultdict(list)
+            for photo in photos:
+                date_taken = photo.date_taken
+                date_buckets[get_date_components(date_taken) if date_taken is not None else None].append(photo)
+            buckets = {key_function(bucket[0]): bucket for bucket in date_buckets.values()}
+        else:
+            key_buckets: defaultdict[str, list[PhotoMetadata]] = defaultdict(list)
+            for photo in photos:
+                key_buckets[key_function(photo)].append(photo)
+            buckets = dict(key_buckets)
 
-        self.logger.info("Bucketed %d photo(s), created %d bucket(s)", len(photos), len(buckets))
+        photo_count = sum(len(bucket) for bucket in buckets.values())
+        self.logger.info("Bucketed %d photo(s), created %d bucket(s)", photo_count, len(buckets))
         return buckets
 
-    def _get_sort_key(self, photo: PhotoMetadata, group_by: GroupBy) -> tuple:
-        """
-        Get a sort key for a photo based on the group_by parameter.
-        Returns a tuple that can be used for sorting, with Unknown values sorting last.
-        """
-        if group_by == GroupBy.SOFTWARE:
-            return (0, photo.software) if photo.software is not None else (1, UNKNOWN_BUCKET_KEY)
-        elif group_by == GroupBy.CAMERA_MAKE:
-            return (0, photo.camera_make) if photo.camera_make is not None else (1, UNKNOWN_BUCKET_KEY)
-        elif group_by == GroupBy.CAMERA_MODEL:
-            return (0, photo.camera_model) if photo.camera_model is not None else (1, UNKNOWN_BUCKET_KEY)
-        elif group_by == GroupBy.YEAR:
-            if photo.date_taken is not None:
-                return (0, photo.date_taken.year)
-            return (1, datetime.max)
-        elif group_by == GroupBy.YEAR_MONTH:
-            if photo.date_taken is not None:
-                return (0, photo.date_taken.year, photo.date_taken.month)
-            return (1, datetime.max)
-        elif group_by == GroupBy.YEAR_MONTH_DAY:
-            if photo.date_taken is not None:
-                return (0, photo.date_taken)
-            return (1, datetime.max)
-        else:
-            raise ValueError(f"Unsupported group_by parameter: {group_by}")
+    @staticmethod
+    def _get_year_sort_value(photo: PhotoMetadata) -> int | float:
+        """Get a scalar sort value for a photo sorted by year taken."""
+        if photo.date_taken is None:
+            return PhotoOffloader.UNKNOWN_DATE_SORT_VALUE
+        return photo.date_taken.year
+
+    @staticmethod
+    def _get_year_month_sort_value(photo: PhotoMetadata) -> int | float:
+        """Get a scalar sort value for a photo sorted by year and month taken."""
+        date_taken = photo.date_taken
+        if date_taken is None:
+            return PhotoOffloader.UNKNOWN_DATE_SORT_VALUE
+        return date_taken.year * PhotoOffloader.MONTHS_PER_YEAR + date_taken.month
+
+    @staticmethod
+    def _get_year_month_day_sort_value(photo: PhotoMetadata) -> int | float:
+        """Get a scalar sort value for a photo sorted by date taken."""
+        if photo.date_taken is None:
+            return PhotoOffloader.UNKNOWN_DATE_SORT_VALUE
+        # Microseconds since datetime.min keeps the full date and time ordering
+        return (photo.date_taken - datetime.min) // PhotoOffloader.ONE_MICROSECOND
+
+    # Scalar sort value function for each date-based group_by parameter, with unknown dates sorting last.
+    # A single number avoids building a (flag, value) tuple per photo.
+    DATE_SORT_VALUE_FUNCTIONS = {
+        GroupBy.YEAR: _get_year_sort_value,
+        GroupBy.YEAR_MONTH: _get_year_month_sort_value,
+        GroupBy.YEAR_MONTH_DAY: _get_year_month_day_sort_value,
+    }
+
+    # PhotoMetadata attribute sorted on for each group_by parameter that is not date-based
+    SORT_ATTRIBUTES = {
+        GroupBy.SOFTWARE: 'software',
+        GroupBy.CAMERA_MAKE: 'camera_make',
+        GroupBy.CAMERA_MODEL: 'camera_model',
+    }
 
     def sort_photos(self, photos: list[PhotoMetadata], group_by: GroupBy) -> list[PhotoMetadata]:
         """
@@ -320,17 +740,69 @@ class PhotoOffloader:
             Sorted list of PhotoMetadata objects
         """
         self.logger.debug("Sorting %d photo(s) by %s", len(photos), group_by.value)
-        sorted_photos = sorted(photos, key=lambda photo: self._get_sort_key(photo, group_by))
+        date_sort_value = PhotoOffloader.DATE_SORT_VALUE_FUNCTIONS.get(group_by)
+        if date_sort_value is not None:
+            # Dates can be sorted on a single number instead of a (flag, value) tuple
+            sorted_photos = sorted(photos, key=date_sort_value)
+        else:
+            attribute = PhotoOffloader.SORT_ATTRIBUTES.get(group_by)
+            if attribute is None:
+                raise ValueError(f"Unsupported group_by parameter: {group_by}")
+            # Photos with unknown values sort last in their original order, so only the known values
+            # need sorting, keyed directly on the attribute
+            get_value = operator.attrgetter(attribute)
+            sorted_photos = [photo for photo in photos if get_value(photo) is not None]
+            sorted_photos.sort(key=get_value)
+            sorted_photos.extend(photo for photo in photos if get_value(photo) is None)
         self.logger.info("Sorted %d photo(s)", len(photos))
         return sorted_photos
 
-    def copy_photos(self, photos: list[PhotoMetadata], destination: str | Path) -> None:
+    @staticmethod
+    def _link_or_copy(source: str | Path, target: str | Path) -> None:
+        """
+        Hard link a file to the target path, copying it when a link cannot be created,
+        e.g. because the target is on a different filesystem.
+        """
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def _copy_photo(self, photo: PhotoMetadata, dest_path: Path, hardlink: bool, debug_enabled: bool) -> None:
+        """
+        Copy a single photo to a destination directory, preserving the filename.
+
+        Args:
+            photo: PhotoMetadata of the photo to copy
+            dest_path: Path to the destination directory
+            hardlink: If True, hard link the photo instead of copying its data when possible
+            debug_enabled: Whether debug logging is enabled, checked once by the caller instead of per photo
+
+        Raises:
+            RuntimeError: If the photo could not be copied
+        """
+        try:
+            # Join the target as a string, as building a Path per photo is comparatively expensive
+            target = os.path.join(dest_path, photo.path.name)
+            if hardlink:
+                PhotoOffloader._link_or_copy(photo.path, target)
+            else:
+                shutil.copy2(photo.path, target)
+            if debug_enabled:
+                self.logger.debug("Copied %s to %s", photo.path.name, dest_path)
+        except Exception as e:
+            self.logger.error("Failed to copy %s to %s: %s", photo.path, dest_path, e)
+            raise RuntimeError(f"Failed to copy {photo.path} to {dest_path}: {e}") from e
+
+    def copy_photos(self, photos: list[PhotoMetadata], destination: str | Path, hardlink: bool = False) -> None:
         """
         Copy photos to a destination directory.
 
         Args:
             photos: List of PhotoMetadata objects to copy
             destination: Path to the destination directory
+            hardlink: If True, hard link photos into the destination instead of copying their data
+                      when the destination is on the same filesystem
         """
         self.logger.debug("Copying %d photo(s) to %s", len(photos), destination)
         dest_path = Path(destination)
@@ -338,16 +810,23 @@ class PhotoOffloader:
         # Create destination directory if it doesn't exist
         dest_path.mkdir(parents=True, exist_ok=True)
 
-        for photo in photos:
-            try:
-                # Copy the file to the destination, preserving the filename
-                shutil.copy2(photo.path, dest_path / photo.path.name)
-                self.logger.debug("Copied %s to %s", photo.path.name, destination)
-            except Exception as e:
-                # Log or handle the error, but continue with other photos
-                # In a production system, you might want to collect errors and return them
-                self.logger.error("Failed to copy %s to %s: %s", photo.path, destination, e)
-                raise RuntimeError(f"Failed to copy {photo.path} to {destination}: {e}") from e
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        # Copies are bound by I/O latency, so overlap them across threads
+        max_workers = min(PhotoOffloader.COPY_MAX_WORKERS, len(photos))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._copy_photo, photo, dest_path, hardlink, debug_enabled)
+                           for photo in photos]
+                try:
+                    for future in futures:
+                        future.result()
+                except RuntimeError:
+                    # Stop copying the remaining photos as soon as one copy fails
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        else:
+            for photo in photos:
+                self._copy_photo(photo, dest_path, hardlink, debug_enabled)
 
         self.logger.info("Copied %d photo(s) to %s", len(photos), destination)
 
@@ -363,27 +842,34 @@ class PhotoOffloader:
         self.logger.debug("Archiving %d photo(s) to %s", len(photos), destination)
         dest_path = Path(destination)
 
-        # First, copy photos to the destination directory
-        self.copy_photos(photos, destination)
+        # First, stage photos in the destination directory; the staged files are removed once they are
+        # archived, so hard linking them avoids copying the data twice
+        self.copy_photos(photos, destination, hardlink=True)
 
         # Create zip file in the destination directory
         zip_path = dest_path / PhotoOffloader.ARCHIVE_FILENAME
         self.logger.debug("Creating zip archive at %s", zip_path)
 
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add all photo files in the destination directory to the zip
-                for photo_file in dest_path.iterdir():
-                    if photo_file.is_file() and photo_file.suffix.lower() in PhotoOffloader.PHOTO_EXTENSIONS:
-                        zipf.write(photo_file, photo_file.name)
-                        self.logger.debug("Added %s to archive", photo_file.name)
-
-            # Remove the original photo files after archiving
-            removed_count = 0
-            for photo_file in dest_path.iterdir():
-                if photo_file.is_file() and photo_file.suffix.lower() in PhotoOffloader.PHOTO_EXTENSIONS:
-                    photo_file.unlink()
-                    removed_count += 1
+            # Remember which files were archived so they can be removed without walking the directory again
+            archived_files = []
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            with zipfile.ZipFile(zip_path, 'w', PhotoOffloader.ARCHIVE_COMPRESSION, allowZip64=True) as zipf:
+                # Add all photo files in the destination directory to the zip, working with the
+                # directory entries' string paths instead of building a Path per file
+                for entry in PhotoOffloader._iter_photo_entries(dest_path):
+                    # Stream the file into the archive with a large buffer instead of ZipFile.write()'s 8 KiB one
+                    zip_info = zipfile.ZipInfo.from_file(entry.path, entry.name)
+                    zip_info.compress_type = PhotoOffloader.ARCHIVE_COMPRESSION
+                    with open(entry.path, 'rb') as src, zipf.open(zip_info, 'w') as dst:
+                        shutil.copyfileobj(src, dst, PhotoOffloader.ARCHIVE_BUFFER_SIZE)
+                    archived_files.append(entry.path)
+                    if debug_enabled:
+                        self.logger.debug("Added %s to archive", entry.name)
+
+            # Remove the original photo files in one batch once the zip file is closed
+            for file_path in archived_files:
+                os.unlink(file_path)
 
             self.logger.info("Archived %d photo(s) to %s", len(photos), zip_path)
         except Exception as e:
@@ -399,7 +885,7 @@ class PhotoOffloader:
             destination: Path to the destination directory
             to_archive: If True, archive photos into zip files instead of copying them
         """
-        destination.mkdir(parents=True, exist_ok=True)
+        # The destination directory is created by copy_photos, which archive_photos also goes through
         if to_archive:
             self.archive_photos(photos, destination)
         else:
@@ -407,7 +893,7 @@ class PhotoOffloader:
 
     def offload_photos(
         self, source_dir: str | Path, destination_dir: str | Path,
-        to_archive: bool = False, keep_unknown: bool = True, use_file_date: bool = False
+        to_archive: bool = False, keep_unknown: bool = True, use_file_date: bool = False, workers: int = 1
     ) -> None:
         """
         Read photos from source directory, bucket by year-month, and copy or archive to destination
@@ -420,15 +906,35 @@ class PhotoOffloader:
             keep_unknown: If True, save files with unknown bucket key and/or invalid year-month separators
                          to the unknown directory. If False, skip them with a log message.
             use_file_date: If True and EXIF date is not available, use file creation date as fallback
+            workers: Number of processes used to extract metadata from photos
         """
         self.logger.debug("Offloading photos from %s to %s", source_dir, destination_dir)
-        photos = self.read_photos(source_dir, use_file_date=use_file_date)
+        # Only the fields used for bucketing by year-month need to be extracted, and photos are streamed
+        # straight into their buckets
+        photos = self.iter_photos(
+            source_dir, use_file_date=use_file_date, fields_needed=GROUP_BY_FIELDS[GroupBy.YEAR_MONTH],
+            workers=workers)
 
         # Bucket photos by year-month
         buckets = self.bucket_photos(photos, GroupBy.YEAR_MONTH)
 
         dest_path = Path(destination_dir)
         dest_path.mkdir(parents=True, exist_ok=True)
+        unknown_dir = dest_path / UNKNOWN_DIRECTORY
+
+        # Resolve the destination of every bucket first, so all directories are created in one pass
+        # before any photo is copied. Keys that are not in the "YYYY-MM" format have no month directory.
+        month_dirs = {}
+        for year_month in buckets:
+            match = PhotoOffloader.YEAR_MONTH_PATTERN.fullmatch(year_month)
+            if match is not None:
+                # Create directory structure: year=X/month=YY (HDFS format with padded month)
+                year, month = int(match[1]), int(match[2])
+                month_dirs[year_month] = dest_path.joinpath(f"{YEAR_PREFIX}{year}", f"{MONTH_PREFIX}{month:02d}")
+        for month_dir in month_dirs.values():
+            month_dir.mkdir(parents=True, exist_ok=True)
+        if keep_unknown and len(month_dirs) < len(buckets):
+            unknown_dir.mkdir(exist_ok=True)
 
         # Process each bucket
         unknown_count = 0
@@ -438,7 +944,6 @@ class PhotoOffloader:
                 unknown_count += len(bucket_photos)
                 if keep_unknown:
                     # Save photos without date information to unknown directory
-                    unknown_dir = dest_path / UNKNOWN_DIRECTORY
                     self.logger.info("Processing %d photo(s) without date information", len(bucket_photos))
                     self._save_photos(bucket_photos, unknown_dir, to_archive)
                 else:
@@ -447,16 +952,11 @@ class PhotoOffloader:
                         self.logger.info("Skipping photo %s: missing date information", photo.path)
                 continue
 
-            # Parse year-month string (format: "YYYY-MM")
-            try:
-                year, month = year_month.split(YEAR_MONTH_SEPARATOR)
-                year = int(year)
-                month = int(month)
-            except ValueError:
+            month_dir = month_dirs.get(year_month)
+            if month_dir is None:
                 invalid_format_count += len(bucket_photos)
                 if keep_unknown:
                     # Save photos with invalid year-month format to unknown directory
-                    unknown_dir = dest_path / UNKNOWN_DIRECTORY
                     self.logger.info(
                         "Processing %d photo(s) with invalid year-month format (%s) to unknown directory",
                         len(bucket_photos), year_month)
@@ -467,8 +967,6 @@ class PhotoOffloader:
                         self.logger.info("Skipping photo %s: invalid year-month format (%s)", photo.path, year_month)
                 continue
 
-            # Create directory structure: year=X/month=YY (HDFS format with padded month)
-            month_dir = dest_path / f"{YEAR_PREFIX}{year}" / f"{MONTH_PREFIX}{month:02d}"
             self.logger.info("Processing %d photo(s) for %s", len(bucket_photos), year_month)
             self._save_photos(bucket_photos, month_dir, to_archive)
 
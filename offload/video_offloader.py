@@ -1,21 +1,37 @@
 # -*- coding: utf-8 -*-
+import itertools
+import json
 import logging
+import operator
+import os
 import re
 import shutil
+import sqlite3
+import stat
 import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Callable, Iterator, Optional
 
 import exiftool
 
 from offload.constants import (
+    ALL_METADATA_FIELDS,
+    CAMERA_MAKE_FIELD,
+    CAMERA_MODEL_FIELD,
+    DATE_FIELD,
     DEFAULT_LATITUDE_REF,
     DEFAULT_LONGITUDE_REF,
+    GROUP_BY_FIELDS,
     GroupBy,
+    LOCATION_FIELD,
     MONTH_PREFIX,
     NEGATIVE_DIRECTIONS,
+    SOFTWARE_FIELD,
     UNKNOWN_BUCKET_KEY,
     UNKNOWN_DIRECTORY,
     YEAR_MONTH_SEPARATOR,
@@ -23,9 +39,9 @@ from offload.constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoMetadata:
-    """Metadata extracted from a video file."""
+    """Metadata extracted from a video file. Instances are immutable and hashable."""
     path: Path
     date_taken: Optional[datetime] = None
     location: Optional[tuple[float, float]] = None  # (latitude, longitude)
@@ -37,17 +53,36 @@ class VideoMetadata:
 class VideoOffloader:
     # Supported video file extensions
     # TODO: Allow this to be configured via environment variable
-    VIDEO_EXTENSIONS = {'.mov', '.mp4'}
+    VIDEO_EXTENSIONS = frozenset({'.mov', '.mp4'})
+    # Same extensions as a tuple, so a lowercased file name can be checked with a single str.endswith call
+    VIDEO_SUFFIXES = tuple(sorted(VIDEO_EXTENSIONS))
 
     # Regex pattern for timezone offset (e.g., "-07:00", "+05:30")
     TZ_OFFSET_PATTERN = re.compile(r'[+-]\d{2}:\d{2}$')
+    # Pattern of a year-month bucket key (format: "YYYY-MM")
+    YEAR_MONTH_PATTERN = re.compile(rf'(\d+){re.escape(YEAR_MONTH_SEPARATOR)}(\d+)')
+
+    # Regex pattern for the common EXIF/ISO date-time layouts (e.g., "2024:08:04 11:45:26-07:00",
+    # "2023-05-15T14:30:00.123"), capturing year, month, day, hour, minute, second and fraction of a second
+    DATE_PATTERN = re.compile(
+        r'(\d{4})[-:](\d{2})[-:](\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(?:[+-]\d{2}:?\d{2})?')
+
+    # Decimal number with optional sign, fraction and exponent, e.g. "37", "-122.4194", ".5", "5." or "1.2e-3"
+    DECIMAL_NUMBER_REGEX = r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?'
+
+    # Regex pattern for QuickTime GPS coordinates ("lat lon [alt]", e.g. "37.7749 -122.4194 100.0"),
+    # capturing latitude and longitude
+    GPS_COORDINATES_PATTERN = re.compile(rf'\s*({DECIMAL_NUMBER_REGEX})\s+({DECIMAL_NUMBER_REGEX})(?=\s|$)')
+
+    # Regex pattern for a coordinate in decimal degrees (e.g., "-122.4194")
+    DECIMAL_DEGREES_PATTERN = re.compile(DECIMAL_NUMBER_REGEX)
 
     # Regex pattern for DMS (degrees, minutes, seconds) format
     # Matches: "37 deg 46' 26.30\"" or "37 deg 46 26.30" (with or without quotes)
     DMS_PATTERN = re.compile(r"(\d+)\s+deg\s+(\d+)\s*'?\s*([\d.]+)\s*\"?")
 
     # Date field names in order of preference for extraction
-    DATE_FIELDS = [
+    DATE_FIELDS = (
         'QuickTime:CreationDate',
         'QuickTime:CreateDate',
         'QuickTime:MediaCreateDate',
@@ -57,108 +92,269 @@ class VideoOffloader:
         'CreationDate',
         'DateTimeOriginal',
         'MediaCreateDate',
-    ]
+    )
 
     # Date format strings for parsing
-    DATE_FORMATS = [
+    DATE_FORMATS = (
         '%Y:%m:%d %H:%M:%S',  # EXIF format (without timezone)
         '%Y-%m-%d %H:%M:%S',  # ISO format
         '%Y-%m-%dT%H:%M:%S',  # ISO with T separator
         '%Y-%m-%dT%H:%M:%S.%f',  # ISO with microseconds
-    ]
+    )
 
     # GPS coordinate tag names
-    GPS_COORDINATES_TAGS = ['QuickTime:GPSCoordinates', 'Keys:GPSCoordinates']
-    GPS_LATITUDE_TAGS = ['GPSLatitude', 'GPS:GPSLatitude']
-    GPS_LONGITUDE_TAGS = ['GPSLongitude', 'GPS:GPSLongitude']
+    GPS_COORDINATES_TAGS = ('QuickTime:GPSCoordinates', 'Keys:GPSCoordinates')
+    GPS_LATITUDE_TAGS = ('GPSLatitude', 'GPS:GPSLatitude')
+    GPS_LONGITUDE_TAGS = ('GPSLongitude', 'GPS:GPSLongitude')
     GPS_LATITUDE_REF_TAG = 'GPSLatitudeRef'
     GPS_LONGITUDE_REF_TAG = 'GPSLongitudeRef'
 
     # Camera info tag names
-    CAMERA_MAKE_TAGS = ['Make', 'QuickTime:Make', 'Keys:Make']
-    CAMERA_MODEL_TAGS = ['Model', 'QuickTime:Model', 'Keys:Model']
-    CAMERA_SOFTWARE_TAGS = ['Software', 'QuickTime:Software', 'Keys:Software', 'CreatorTool']
+    CAMERA_MAKE_TAGS = ('Make', 'QuickTime:Make', 'Keys:Make')
+    CAMERA_MODEL_TAGS = ('Model', 'QuickTime:Model', 'Keys:Model')
+    CAMERA_SOFTWARE_TAGS = ('Software', 'QuickTime:Software', 'Keys:Software', 'CreatorTool')
+
+    # Tags read for each metadata field, including their groups
+    _FIELD_TAGS_BY_GROUP = {
+        DATE_FIELD: DATE_FIELDS,
+        LOCATION_FIELD: (*GPS_COORDINATES_TAGS, *GPS_LATITUDE_TAGS, *GPS_LONGITUDE_TAGS,
+                         GPS_LATITUDE_REF_TAG, GPS_LONGITUDE_REF_TAG),
+        CAMERA_MAKE_FIELD: CAMERA_MAKE_TAGS,
+        CAMERA_MODEL_FIELD: CAMERA_MODEL_TAGS,
+        SOFTWARE_FIELD: CAMERA_SOFTWARE_TAGS,
+    }
+
+    # Tags exiftool reads for each metadata field, without their group so that every group is read
+    FIELD_TAGS = {
+        field: tuple(sorted({tag.rpartition(':')[2] for tag in tags})) for field, tags in _FIELD_TAGS_BY_GROUP.items()
+    }
+
+    # Tags that may only be found in embedded data, which exiftool extracts with -ee
+    LOCATION_TAGS = frozenset(FIELD_TAGS[LOCATION_FIELD])
+
+    # Metadata fields that are parsed together by _parse_camera_info
+    CAMERA_INFO_FIELDS = frozenset({CAMERA_MAKE_FIELD, CAMERA_MODEL_FIELD, SOFTWARE_FIELD})
 
     # Date parsing constants
     MIN_DATE_STRING_LENGTH = 10
     COLON_REPLACEMENT_COUNT = 2  # Number of colons to replace in date string
 
-    # GPS coordinate parsing constants
-    MIN_GPS_PARTS = 2  # Minimum parts needed for lat/lon coordinates
+    # DMS to decimal conversion constants
+    MINUTES_PER_DEGREE = 60.0
+    SECONDS_PER_DEGREE = 3600.0
 
     # ExifTool parameters
     EXIFTOOL_EMBEDDED_PARAMS = ['-ee']  # Flag to extract embedded GPMF data
+    # Flag to skip scanning for trailers, used when no location is read and embedded data is not needed.
+    # -fast2 is not used because it stops at the mdat box, which comes before the metadata in many videos.
+    EXIFTOOL_FAST_PARAMS = ['-fast']
+    # Number of files read per exiftool call; a failing call only loses the metadata of its own batch
+    METADATA_BATCH_SIZE = 64
+    # MP4 and QuickTime files are a sequence of boxes, each starting with a 4-byte size and a 4-byte type.
+    # Files whose first box is not one of these cannot hold the tags read by exiftool, so they are skipped.
+    VIDEO_HEADER_SIZE = 8
+    VIDEO_BOX_TYPES = frozenset({b'ftyp', b'moov', b'mdat', b'wide', b'free', b'skip', b'pnot', b'uuid'})
+
+    # Maximum number of bytes copied by one os.copy_file_range call
+    COPY_CHUNK_SIZE = 1 << 30
+    # Maximum number of threads used to copy videos concurrently; videos are large, so a few
+    # concurrent copies are enough to keep the storage device's queue busy
+    COPY_MAX_WORKERS = 8
 
     # Archive filename
     ARCHIVE_FILENAME = "videos.zip"
 
-    def __init__(self, logger: logging.Logger):
+    # Every supported video format is already compressed, so deflating it again only costs CPU time
+    ARCHIVE_COMPRESSION = zipfile.ZIP_STORED
+
+    # Buffer size used when streaming videos into an archive, in line with typical SSD readahead
+    ARCHIVE_BUFFER_SIZE = 4 * 1024 * 1024
+
+    # Metadata cache queries; rows are keyed by the file's path, modification time and size, and by the
+    # tags that were read, as an empty string when all of them were
+    CACHE_CREATE_TABLE = (
+        'CREATE TABLE IF NOT EXISTS video_metadata ('
+        'path TEXT, mtime_ns INTEGER, size INTEGER, tags TEXT, json BLOB, PRIMARY KEY (path, mtime_ns, size, tags))'
+    )
+    CACHE_SELECT = 'SELECT json FROM video_metadata WHERE path = ? AND mtime_ns = ? AND size = ? AND tags = ?'
+    CACHE_INSERT = (
+        'INSERT OR REPLACE INTO video_metadata (path, mtime_ns, size, tags, json) VALUES (?, ?, ?, ?, ?)'
+    )
+
+    def __init__(
+        self, logger: logging.Logger, cache_path: Optional[str | Path] = None,
+        exiftool_helper: Optional[exiftool.ExifToolHelper] = None
+    ):
         """
         Initialize the VideoOffloader.
 
         Args:
             logger: Logger instance for logging operations
+            cache_path: Path to a SQLite file caching exiftool results between runs. Caching is disabled if None.
+            exiftool_helper: Already opened exiftool helper to read metadata with. It is left running by close(),
+                as it belongs to the caller. A helper is started on first use if None.
         """
         self.logger = logger
+        self._exiftool = exiftool_helper
+        # exiftool subprocesses reused by all metadata reads, one per worker thread, started on first use
+        self._exiftools: list[exiftool.ExifToolHelper] = []
+        self._cache_path = Path(cache_path) if cache_path is not None else None
+        self._metadata_cache: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> 'VideoOffloader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the exiftool subprocesses started by this instance and close the metadata cache if it was opened."""
+        for et in self._exiftools:
+            if et.running:
+                et.terminate()
+        self._exiftools.clear()
+        if self._metadata_cache is not None:
+            self._metadata_cache.close()
+            self._metadata_cache = None
+
+    def _get_exiftools(self, count: int) -> list[exiftool.ExifToolHelper]:
+        """
+        Return the given number of exiftool helpers, creating the ones that were not used before.
+
+        Args:
+            count: Number of helpers needed, one per worker thread
+
+        Returns:
+            List of exiftool helpers
+        """
+        # The helper given by the caller is used first; the others are started here and stopped by close()
+        given = [self._exiftool] if self._exiftool is not None else []
+        while len(given) + len(self._exiftools) < count:
+            self._exiftools.append(exiftool.ExifToolHelper())
+        return (given + self._exiftools)[:count]
+
+    def _get_exiftool(self) -> exiftool.ExifToolHelper:
+        """Return the exiftool helper used for reading metadata in the current thread."""
+        return self._get_exiftools(1)[0]
+
+    def _get_metadata_cache(self) -> sqlite3.Connection:
+        """Return the metadata cache connection, creating the cache file on first use."""
+        if self._metadata_cache is None:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._metadata_cache = sqlite3.connect(self._cache_path)
+            self._metadata_cache.execute(VideoOffloader.CACHE_CREATE_TABLE)
+        return self._metadata_cache
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _dms_to_decimal(dms: tuple, ref: str) -> float:
-        """Convert degrees, minutes, seconds to decimal degrees."""
-        degrees = float(dms[0])
-        minutes = float(dms[1]) / 60.0
-        seconds = float(dms[2]) / 3600.0
-        decimal = degrees + minutes + seconds
+        """
+        Convert degrees, minutes, seconds to decimal degrees.
+
+        Results are cached, as videos recorded at the same place share their coordinates.
+        """
+        # Dividing by the float constants already yields a float, so the parts are not converted one by one
+        degrees, minutes, seconds = dms
+        decimal = degrees + minutes / VideoOffloader.MINUTES_PER_DEGREE + seconds / VideoOffloader.SECONDS_PER_DEGREE
         return -decimal if ref in NEGATIVE_DIRECTIONS else decimal
 
+    @staticmethod
+    def _parse_iso_date(date_str: str) -> datetime:
+        """
+        Parse a "YYYY-MM-DD" date with the C-implemented datetime.fromisoformat.
+
+        Raises:
+            ValueError: If date_str is not a "YYYY-MM-DD" date
+        """
+        # fromisoformat also accepts other ISO 8601 shapes (e.g., week dates), which are not dates here
+        if date_str[4:5] != '-' or date_str[7:8] != '-':
+            raise ValueError(f"Not a YYYY-MM-DD date: {date_str}")
+        return datetime.fromisoformat(date_str)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_date_str(date_str: str) -> Optional[datetime]:
+        """
+        Parse a date string from video metadata.
+
+        Results are cached, as videos recorded in bursts or by the same camera share their timestamps.
+
+        Returns:
+            Parsed date, or None if date_str is not in any known layout
+        """
+        # Every layout parsed below starts with a 4-digit year and is at least a full date long,
+        # so skip values that cannot match before trying the formats one by one
+        if len(date_str) < VideoOffloader.MIN_DATE_STRING_LENGTH or not date_str[:4].isdigit():
+            return None
+        # Build the datetime straight from the regex groups for the common layouts,
+        # leaving the slower strptime formats below for everything else
+        match = VideoOffloader.DATE_PATTERN.fullmatch(date_str)
+        if match:
+            year, month, day, hour, minute, second, fraction = match.groups()
+            try:
+                return datetime(
+                    int(year), int(month), int(day), int(hour), int(minute), int(second),
+                    int(fraction.ljust(6, '0')) if fraction else 0)
+            except ValueError:
+                pass
+        # Strip timezone offset if present (e.g., "-07:00" or "+05:30")
+        # We'll parse the date/time part and ignore timezone for now
+        if VideoOffloader.TZ_OFFSET_PATTERN.search(date_str):
+            # Remove timezone offset for parsing
+            date_str_no_tz = VideoOffloader.TZ_OFFSET_PATTERN.sub('', date_str)
+        else:
+            date_str_no_tz = date_str
+
+        # Try multiple date formats
+        for fmt in VideoOffloader.DATE_FORMATS:
+            try:
+                return datetime.strptime(date_str_no_tz, fmt)
+            except ValueError:
+                continue
+        # If no format matches, try parsing just the date part
+        # Handle both colon and dash separators
+        if 'T' in date_str_no_tz:
+            date_part = date_str_no_tz.split('T')[0]
+        elif ' ' in date_str_no_tz:
+            date_part = date_str_no_tz.split(' ')[0]
+        else:
+            if len(date_str_no_tz) >= VideoOffloader.MIN_DATE_STRING_LENGTH:
+                date_part = date_str_no_tz[:VideoOffloader.MIN_DATE_STRING_LENGTH]
+            else:
+                date_part = date_str_no_tz
+
+        # Try parsing date part with colon separator (EXIF format)
+        if ':' in date_part and len(date_part) >= VideoOffloader.MIN_DATE_STRING_LENGTH:
+            try:
+                # Replace colons with dashes for date part: "2024:08:04" -> "2024-08-04"
+                date_part_dash = date_part[:VideoOffloader.MIN_DATE_STRING_LENGTH].replace(
+                    ':', '-', VideoOffloader.COLON_REPLACEMENT_COUNT)
+                return VideoOffloader._parse_iso_date(date_part_dash)
+            except ValueError:
+                pass
+        # Try standard date format
+        if len(date_part) >= VideoOffloader.MIN_DATE_STRING_LENGTH:
+            try:
+                return VideoOffloader._parse_iso_date(date_part[:VideoOffloader.MIN_DATE_STRING_LENGTH])
+            except ValueError:
+                pass
+        return None
+
     def _parse_date(self, metadata: dict) -> Optional[datetime]:
         """Parse date taken from video metadata."""
         # Try different date fields in order of preference
         for field in VideoOffloader.DATE_FIELDS:
             if field in metadata:
-                try:
-                    date_str = str(metadata[field])
-                    # Strip timezone offset if present (e.g., "-07:00" or "+05:30")
-                    # We'll parse the date/time part and ignore timezone for now
-                    if VideoOffloader.TZ_OFFSET_PATTERN.search(date_str):
-                        # Remove timezone offset for parsing
-                        date_str_no_tz = VideoOffloader.TZ_OFFSET_PATTERN.sub('', date_str)
-                    else:
-                        date_str_no_tz = date_str
-
-                    # Try multiple date formats
-                    for fmt in VideoOffloader.DATE_FORMATS:
-                        try:
-                            return datetime.strptime(date_str_no_tz, fmt)
-                        except ValueError:
-                            continue
-                    # If no format matches, try parsing just the date part
-                    # Handle both colon and dash separators
-                    if 'T' in date_str_no_tz:
-                        date_part = date_str_no_tz.split('T')[0]
-                    elif ' ' in date_str_no_tz:
-                        date_part = date_str_no_tz.split(' ')[0]
-                    else:
-                        if len(date_str_no_tz) >= VideoOffloader.MIN_DATE_STRING_LENGTH:
-                            date_part = date_str_no_tz[:VideoOffloader.MIN_DATE_STRING_LENGTH]
-                        else:
-                            date_part = date_str_no_tz
-
-                    # Try parsing date part with colon separator (EXIF format)
-                    if ':' in date_part and len(date_part) >= VideoOffloader.MIN_DATE_STRING_LENGTH:
-                        try:
-                            # Replace colons with dashes for date part: "2024:08:04" -> "2024-08-04"
-                            date_part_dash = date_part.replace(':', '-', VideoOffloader.COLON_REPLACEMENT_COUNT)
-                            return datetime.strptime(date_part_dash[:VideoOffloader.MIN_DATE_STRING_LENGTH], '%Y-%m-%d')
-                        except ValueError:
-                            pass
-                    # Try standard date format
-                    if len(date_part) >= VideoOffloader.MIN_DATE_STRING_LENGTH:
-                        try:
-                            return datetime.strptime(date_part[:VideoOffloader.MIN_DATE_STRING_LENGTH], '%Y-%m-%d')
-                        except ValueError:
-                            pass
-                except (ValueError, TypeError, AttributeError):
-                    continue
+                date_str = metadata[field]
+                # exiftool returns dates as strings; other values are converted, skipping the ones that cannot be
+                if not isinstance(date_str, str):
+                    try:
+                        date_str = str(date_str)
+                    except (ValueError, TypeError, AttributeError):
+                        continue
+                date_taken = VideoOffloader._parse_date_str(date_str)
+                if date_taken is not None:
+                    return date_taken
         return None
 
     def _parse_location(self, metadata: dict) -> Optional[tuple[float, float]]:
@@ -172,94 +368,105 @@ class VideoOffloader:
             # Try QuickTime GPSCoordinates format (space-separated "lat lon alt")
             for gps_tag in VideoOffloader.GPS_COORDINATES_TAGS:
                 if gps_tag in metadata:
-                    coords_str = str(metadata[gps_tag])
-                    parts = coords_str.split()
-                    if len(parts) >= VideoOffloader.MIN_GPS_PARTS:
-                        try:
-                            lat = float(parts[0])
-                            lon = float(parts[1])
-                            return (lat, lon)
-                        except (ValueError, IndexError):
-                            pass
+                    match = VideoOffloader.GPS_COORDINATES_PATTERN.match(str(metadata[gps_tag]))
+                    if match:
+                        return (float(match.group(1)), float(match.group(2)))
 
             # Try standard GPSLatitude/GPSLongitude (DMS format)
-            has_lat = any(tag in metadata for tag in VideoOffloader.GPS_LATITUDE_TAGS)
-            has_lon = any(tag in metadata for tag in VideoOffloader.GPS_LONGITUDE_TAGS)
-            if has_lat and has_lon:
-                try:
-                    # Find the first available latitude tag
-                    lat_tag = next(tag for tag in VideoOffloader.GPS_LATITUDE_TAGS if tag in metadata)
-                    lon_tag = next(tag for tag in VideoOffloader.GPS_LONGITUDE_TAGS if tag in metadata)
-                    lat_str = str(metadata[lat_tag])
-                    lon_str = str(metadata[lon_tag])
+            # Find the first available latitude and longitude tags in a single pass each
+            lat_tag = next((tag for tag in VideoOffloader.GPS_LATITUDE_TAGS if tag in metadata), None)
+            lon_tag = next((tag for tag in VideoOffloader.GPS_LONGITUDE_TAGS if tag in metadata), None)
+            if lat_tag is not None and lon_tag is not None:
+                lat_value = metadata[lat_tag]
+                lon_value = metadata[lon_tag]
+                # Numeric values need no parsing at all
+                if isinstance(lat_value, (int, float)) and isinstance(lon_value, (int, float)):
+                    return (float(lat_value), float(lon_value))
+
+                lat_str = str(lat_value)
+                lon_str = str(lon_value)
+
+                # Parse DMS format: "37 deg 46' 26.30\" N"
+                # Extract degrees, minutes, seconds
+                lat_match = VideoOffloader.DMS_PATTERN.match(lat_str)
+                lon_match = VideoOffloader.DMS_PATTERN.match(lon_str)
+                if lat_match and lon_match:
                     lat_ref = metadata.get(VideoOffloader.GPS_LATITUDE_REF_TAG, DEFAULT_LATITUDE_REF)
                     lon_ref = metadata.get(VideoOffloader.GPS_LONGITUDE_REF_TAG, DEFAULT_LONGITUDE_REF)
-
-                    # Parse DMS format: "37 deg 46' 26.30\" N"
-                    # Extract degrees, minutes, seconds
-                    lat_match = VideoOffloader.DMS_PATTERN.match(lat_str)
-                    lon_match = VideoOffloader.DMS_PATTERN.match(lon_str)
-
-                    if lat_match and lon_match:
-                        lat_dms = (int(lat_match.group(1)), int(lat_match.group(2)), float(lat_match.group(3)))
-                        lon_dms = (int(lon_match.group(1)), int(lon_match.group(2)), float(lon_match.group(3)))
-                        latitude = VideoOffloader._dms_to_decimal(lat_dms, lat_ref)
-                        longitude = VideoOffloader._dms_to_decimal(lon_dms, lon_ref)
-                        return (latitude, longitude)
-                    else:
-                        # If DMS format doesn't match, try parsing as decimal format
-                        try:
-                            lat = float(lat_str)
-                            lon = float(lon_str)
-                            return (lat, lon)
-                        except (ValueError, TypeError):
-                            pass
-                except (ValueError, TypeError, AttributeError, KeyError):
-                    pass
+                    lat_dms = (int(lat_match.group(1)), int(lat_match.group(2)), float(lat_match.group(3)))
+                    lon_dms = (int(lon_match.group(1)), int(lon_match.group(2)), float(lon_match.group(3)))
+                    latitude = VideoOffloader._dms_to_decimal(lat_dms, lat_ref)
+                    longitude = VideoOffloader._dms_to_decimal(lon_dms, lon_ref)
+                    return (latitude, longitude)
+
+                # If DMS format doesn't match, accept coordinates written in decimal degrees
+                lat_str = lat_str.strip()
+                lon_str = lon_str.strip()
+                if (VideoOffloader.DECIMAL_DEGREES_PATTERN.fullmatch(lat_str)
+                        and VideoOffloader.DECIMAL_DEGREES_PATTERN.fullmatch(lon_str)):
+                    return (float(lat_str), float(lon_str))
 
         except (KeyError, TypeError, ValueError, AttributeError):
+            # Only values that fail while being read or converted to strings get here
             pass
 
         return None
 
-    def _parse_camera_info(self, metadata: dict) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    @staticmethod
+    def _first_tag_value(metadata: dict, tags: tuple[str, ...]) -> Optional[str]:
         """
-        Parse camera information from video metadata.
+        Return the value of the first of the given tags that is present in the metadata.
 
         Returns:
-            Tuple of (camera_make, camera_model, software)
+            Value of the tag as a string, or None if none of the tags is present
         """
-        camera_make = None
-        camera_model = None
-        software = None
-
-        for tag in VideoOffloader.CAMERA_MAKE_TAGS:
+        # A plain loop returns early without creating the generator that next() would need
+        for tag in tags:
             if tag in metadata:
-                camera_make = str(metadata[tag])
-                break
+                return str(metadata[tag])
+        return None
 
-        for tag in VideoOffloader.CAMERA_MODEL_TAGS:
-            if tag in metadata:
-                camera_model = str(metadata[tag])
-                break
+    def _parse_camera_info(self, metadata: dict) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Parse camera information from video metadata.
 
-        for tag in VideoOffloader.CAMERA_SOFTWARE_TAGS:
-            if tag in metadata:
-                software = str(metadata[tag])
-                break
+        Returns:
+            Tuple of (camera_make, camera_model, software)
+        """
+        # Take the first tag of each preference list that is present
+        camera_make = VideoOffloader._first_tag_value(metadata, VideoOffloader.CAMERA_MAKE_TAGS)
+        camera_model = VideoOffloader._first_tag_value(metadata, VideoOffloader.CAMERA_MODEL_TAGS)
+        software = VideoOffloader._first_tag_value(metadata, VideoOffloader.CAMERA_SOFTWARE_TAGS)
 
         return (camera_make, camera_model, software)
 
     @staticmethod
-    def _get_file_creation_date(file_path: Path) -> Optional[datetime]:
-        """Get file creation date from filesystem metadata."""
+    def _stat_file(file_path: Path) -> Optional[os.stat_result]:
+        """Get the filesystem metadata of a file, or None if it cannot be read."""
+        try:
+            return os.stat(file_path)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _get_file_creation_date(file_path: Path, stat: Optional[os.stat_result] = None) -> Optional[datetime]:
+        """
+        Get file creation date from filesystem metadata.
+
+        Args:
+            file_path: Path to the file
+            stat: Filesystem metadata already read for the file; it is read again if None
+        """
         try:
-            stat = file_path.stat()
-            # Try st_birthtime (available on macOS and some BSD systems)
-            if hasattr(stat, 'st_birthtime'):
-                return datetime.fromtimestamp(stat.st_birthtime)
-            # Fallback to st_mtime (modification time) on systems without birthtime
-            return datetime.fromtimestamp(stat.st_mtime)
+            if stat is None:
+                # os.stat skips the pathlib layer of Path.stat
+                stat = os.stat(file_path)
+            # Prefer st_birthtime (available on macOS and some BSD systems), falling back to
+            # st_mtime (modification time) on systems without birthtime
+            timestamp = getattr(stat, 'st_birthtime', None)
+            if timestamp is None:
+                timestamp = stat.st_mtime
+            return datetime.fromtimestamp(timestamp)
         except (OSError, ValueError) as e:
             return None
 
@@ -271,109 +478,398 @@ class VideoOffloader:
             file_path: Path to the video file
             use_file_date: If True and metadata date is not available, use file creation date as fallback
         """
-        date_taken = None
-        location = None
-        camera_make = None
-        camera_model = None
-        software = None
+        return self._extract_metadata_batch([file_path], use_file_date=use_file_date)[0]
 
+    @staticmethod
+    def _may_be_video(file_path: Path) -> bool:
+        """
+        Check whether a file starts like an MP4 or QuickTime file, without running exiftool.
+
+        Returns:
+            False if the file's first box is not a video box, True otherwise, including for files that
+            cannot be read, so that exiftool reports those
+        """
         try:
-            # Use exiftool to extract metadata
-            # For GoPro videos, use -ee flag to extract embedded GPMF data
-            with exiftool.ExifToolHelper() as et:
-                # Try with -ee flag first (for GoPro GPMF data)
-                try:
-                    metadata_list = et.get_metadata([str(file_path)], params=VideoOffloader.EXIFTOOL_EMBEDDED_PARAMS)
-                    if metadata_list:
-                        metadata = metadata_list[0]
-                    else:
-                        metadata = {}
-                except Exception:
-                    # Fallback to regular extraction if -ee fails
-                    try:
-                        metadata_list = et.get_metadata([str(file_path)])
-                        if metadata_list:
-                            metadata = metadata_list[0]
-                        else:
-                            metadata = {}
-                    except Exception as e:
-                        self.logger.warning("Failed to extract metadata from %s: %s", file_path, e)
-                        metadata = {}
-
-                if metadata:
+            with open(file_path, 'rb') as file:
+                header = file.read(VideoOffloader.VIDEO_HEADER_SIZE)
+        except OSError:
+            return True
+        return len(header) == VideoOffloader.VIDEO_HEADER_SIZE and header[4:] in VideoOffloader.VIDEO_BOX_TYPES
+
+    def _get_metadata_list(
+        self, file_paths: list[Path], et: Optional[exiftool.ExifToolHelper] = None,
+        tags: Optional[tuple[str, ...]] = None
+    ) -> list[dict]:
+        """
+        Read the metadata of several video files, with one exiftool call per batch of files.
+
+        Args:
+            file_paths: Paths to the video files
+            et: exiftool helper to read the metadata with; the default helper is used if None
+            tags: Names of the tags to read; all tags are read if None
+
+        Returns:
+            List of metadata dictionaries in the same order as file_paths; empty for files without metadata
+        """
+        if et is None:
+            et = self._get_exiftool()
+        metadata_list = [{} for _ in file_paths]
+        # Only files that may be videos are passed to exiftool; the others keep empty metadata
+        indexes = [index for index, file_path in enumerate(file_paths) if VideoOffloader._may_be_video(file_path)]
+        batch_size = VideoOffloader.METADATA_BATCH_SIZE
+        for start in range(0, len(indexes), batch_size):
+            batch = indexes[start:start + batch_size]
+            batch_metadata = self._get_metadata_batch_list([file_paths[index] for index in batch], et, tags)
+            for index, metadata in zip(batch, batch_metadata):
+                metadata_list[index] = metadata
+        return metadata_list
+
+    def _get_metadata_batch_list(
+        self, file_paths: list[Path], et: exiftool.ExifToolHelper, tags: Optional[tuple[str, ...]] = None
+    ) -> list[dict]:
+        """
+        Read the metadata of several video files with a single exiftool call.
+
+        Args:
+            file_paths: Paths to the video files
+            et: exiftool helper to read the metadata with
+            tags: Names of the tags to read; all tags are read if None
+
+        Returns:
+            List of metadata dictionaries in the same order as file_paths; empty for files without metadata
+        """
+        file_names = [str(file_path) for file_path in file_paths]
+        # Reading only the needed tags keeps exiftool's output, and the JSON to decode, small
+        if tags is None:
+            read = et.get_metadata
+        else:
+            read = partial(et.get_tags, tags=list(tags))
+        # For GoPro videos, use -ee flag to extract embedded GPMF data, which only holds the location
+        if tags is None or not VideoOffloader.LOCATION_TAGS.isdisjoint(tags):
+            params = VideoOffloader.EXIFTOOL_EMBEDDED_PARAMS
+        else:
+            params = VideoOffloader.EXIFTOOL_FAST_PARAMS
+        try:
+            try:
+                metadata_list = read(file_names, params=params)
+            except Exception:
+                # Fallback to regular extraction if -ee or -fast fails
+                metadata_list = read(file_names)
+        except Exception as e:
+            if len(file_paths) == 1:
+                self.logger.warning("Failed to extract metadata from %s: %s", file_names[0], e)
+                return [{}]
+            # exiftool fails the whole call when a single file cannot be read, so read each file on its own
+            # to keep the metadata of the others
+            self.logger.debug("Failed to extract metadata from a batch of %d file(s), reading them one by one: %s",
+                              len(file_paths), e)
+            return [metadata for file_path in file_paths
+                    for metadata in self._get_metadata_batch_list([file_path], et, tags)]
+
+        # exiftool leaves out files it could not read, so the results are matched to the files by their
+        # SourceFile rather than by position
+        metadata_by_path = {
+            Path(metadata['SourceFile']): metadata for metadata in metadata_list or [] if 'SourceFile' in metadata
+        }
+        return [metadata_by_path.get(file_path, {}) for file_path in file_paths]
+
+    def _get_metadata_list_in_threads(
+        self, file_paths: list[Path], workers: int, tags: Optional[tuple[str, ...]] = None
+    ) -> list[dict]:
+        """
+        Read the metadata of several video files, splitting them between worker threads that each
+        run their own exiftool subprocess.
+
+        Args:
+            file_paths: Paths to the video files
+            workers: Maximum number of worker threads
+            tags: Names of the tags to read; all tags are read if None
+
+        Returns:
+            List of metadata dictionaries in the same order as file_paths; empty for files without metadata
+        """
+        workers = min(workers, len(file_paths))
+        if workers <= 1:
+            return self._get_metadata_list(file_paths, tags=tags)
+
+        # One contiguous chunk per worker, each read in batches by its own exiftool subprocess
+        chunk_size = -(-len(file_paths) // workers)
+        chunks = [file_paths[start:start + chunk_size] for start in range(0, len(file_paths), chunk_size)]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(
+                self._get_metadata_list, chunks, self._get_exiftools(len(chunks)), itertools.repeat(tags))
+            return [metadata for chunk_metadata in results for metadata in chunk_metadata]
+
+    def _get_cached_metadata_list(
+        self, file_paths: list[Path], stats: list[Optional[os.stat_result]], workers: int = 1,
+        tags: Optional[tuple[str, ...]] = None
+    ) -> list[dict]:
+        """
+        Read the metadata of several video files, only running exiftool for files missing from the cache.
+
+        Args:
+            file_paths: Paths to the video files
+            stats: Filesystem metadata of each file, None for files that could not be read; files are
+                   cached by path, modification time and size
+            workers: Maximum number of worker threads running exiftool
+            tags: Names of the tags to read; all tags are read if None. Results are cached separately
+                  for each set of tags.
+
+        Returns:
+            List of metadata dictionaries in the same order as file_paths; empty for files without metadata
+        """
+        cache = self._get_metadata_cache()
+        tags_key = ','.join(tags) if tags is not None else ''
+        cache_keys = []
+        metadata_list: list[Optional[dict]] = []
+        for file_path, stat in zip(file_paths, stats):
+            if stat is None:
+                cache_keys.append(None)
+                metadata_list.append(None)
+                continue
+            cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size, tags_key)
+            row = cache.execute(VideoOffloader.CACHE_SELECT, cache_key).fetchone()
+            cache_keys.append(cache_key)
+            metadata_list.append(json.loads(row[0]) if row is not None else None)
+
+        missing = [index for index, metadata in enumerate(metadata_list) if metadata is None]
+        self.logger.debug("Found metadata of %d video(s) in cache", len(file_paths) - len(missing))
+        if missing:
+            fetched = self._get_metadata_list_in_threads([file_paths[index] for index in missing], workers, tags)
+            with cache:
+                for index, metadata in zip(missing, fetched):
+                    metadata_list[index] = metadata
+                    # Empty results may come from a failed read, so only store what exiftool returned
+                    if metadata and cache_keys[index] is not None:
+                        cache.execute(VideoOffloader.CACHE_INSERT, (*cache_keys[index], json.dumps(metadata)))
+        return metadata_list
+
+    @staticmethod
+    def _get_tags_needed(fields_needed: AbstractSet[str]) -> Optional[tuple[str, ...]]:
+        """
+        Get the names of the exiftool tags holding the given metadata fields.
+
+        Returns:
+            Sorted tag names, or None if all fields are needed, in which case all tags are read
+        """
+        if fields_needed >= ALL_METADATA_FIELDS:
+            return None
+        return tuple(sorted({tag for field in fields_needed for tag in VideoOffloader.FIELD_TAGS[field]}))
+
+    def _extract_metadata_batch(
+        self, file_paths: list[Path], use_file_date: bool = False, workers: int = 1,
+        fields_needed: AbstractSet[str] = ALL_METADATA_FIELDS
+    ) -> list[VideoMetadata]:
+        """
+        Extract metadata from several video files, sharing one exiftool call per worker between them.
+
+        Args:
+            file_paths: Paths to the video files
+            use_file_date: If True and metadata date is not available, use file creation date as fallback
+            workers: Maximum number of worker threads running exiftool
+            fields_needed: Names of the metadata fields to read; fields not in the set are left as None
+
+        Returns:
+            List of VideoMetadata objects in the same order as file_paths
+        """
+        if not file_paths:
+            return []
+        tags = VideoOffloader._get_tags_needed(fields_needed)
+        parse_date = DATE_FIELD in fields_needed
+        parse_location = LOCATION_FIELD in fields_needed
+        parse_camera_info = not VideoOffloader.CAMERA_INFO_FIELDS.isdisjoint(fields_needed)
+
+        # Each file is stat'ed at most once: here for the cache key, or later for the file date fallback
+        stats = [None] * len(file_paths)
+        try:
+            if self._cache_path is not None:
+                stats = [VideoOffloader._stat_file(file_path) for file_path in file_paths]
+                metadata_list = self._get_cached_metadata_list(file_paths, stats, workers=workers, tags=tags)
+            else:
+                metadata_list = self._get_metadata_list_in_threads(file_paths, workers, tags)
+        except Exception as e:
+            # If we can't run exiftool at all, continue with None values
+            self.logger.warning("Failed to extract metadata from %s: %s", ', '.join(map(str, file_paths)), e)
+            metadata_list = [{}] * len(file_paths)
+
+        videos = []
+        for file_path, stat, metadata in zip(file_paths, stats, metadata_list):
+            date_taken = None
+            location = None
+            camera_make = None
+            camera_model = None
+            software = None
+
+            # Only parse the fields the caller asked for
+            if metadata:
+                if parse_date:
                     date_taken = self._parse_date(metadata)
+                if parse_location:
                     location = self._parse_location(metadata)
+                if parse_camera_info:
                     camera_make, camera_model, software = self._parse_camera_info(metadata)
 
-        except Exception as e:
-            # If we can't read the video or extract metadata, continue with None values
-            self.logger.warning("Failed to extract metadata from %s: %s", file_path, e)
-
-        # Use file creation date as fallback if metadata date is not available
-        if date_taken is None and use_file_date:
-            date_taken = VideoOffloader._get_file_creation_date(file_path)
-            if date_taken is not None:
-                self.logger.debug("Using file creation date for %s: %s", file_path, date_taken)
-
-        return VideoMetadata(
-            path=file_path,
-            date_taken=date_taken,
-            location=location,
-            camera_make=camera_make,
-            camera_model=camera_model,
-            software=software
-        )
-
-    def read_videos(self, source_dir: str | Path, use_file_date: bool = False) -> list[VideoMetadata]:
+            # Use file creation date as fallback if metadata date is not available
+            if date_taken is None and use_file_date and parse_date:
+                date_taken = VideoOffloader._get_file_creation_date(file_path, stat)
+                if date_taken is not None:
+                    self.logger.debug("Using file creation date for %s: %s", file_path, date_taken)
+
+            videos.append(VideoMetadata(
+                path=file_path,
+                date_taken=date_taken,
+                location=location,
+                camera_make=camera_make,
+                camera_model=camera_model,
+                software=software
+            ))
+        return videos
+
+    @staticmethod
+    def _iter_video_paths(videos_dir: Path) -> Iterator[Path]:
         """
-        Read all video files from the source directory and extract their metadata.
+        Yield the paths of video files directly inside a directory.
+
+        Entries are filtered by name first, and is_file() uses the file type cached by os.scandir,
+        so non-video entries cost no extra system calls. Symlinks to video files are followed.
+        """
+        video_suffixes = VideoOffloader.VIDEO_SUFFIXES
+        with os.scandir(videos_dir) as entries:
+            for entry in entries:
+                # str.endswith runs in C, unlike os.path.splitext, and only the lowercased name is allocated
+                if entry.name.lower().endswith(video_suffixes) and entry.is_file():
+                    yield Path(entry.path)
+
+    def iter_videos(
+        self, source_dir: str | Path, use_file_date: bool = False, workers: int = 1,
+        fields_needed: AbstractSet[str] = ALL_METADATA_FIELDS
+    ) -> Iterator[VideoMetadata]:
+        """
+        Iterate over the video files in the source directory, extracting their metadata as the directory is listed.
+
+        The source directory is checked immediately. Videos are then listed and read in rounds of one exiftool
+        batch per worker as the iterator is consumed, so exiftool starts on the first videos without waiting
+        for the whole directory to be listed.
 
         Args:
             source_dir: Path to the directory where videos are stored
             use_file_date: If True and metadata date is not available, use file creation date as fallback
+            workers: Number of threads, each with its own exiftool subprocess, used to extract metadata
+            fields_needed: Names of the metadata fields to read; fields not in the set are left as None
 
         Returns:
-            List of VideoMetadata objects containing path, date_taken, location,
+            Iterator of VideoMetadata objects containing path, date_taken, location,
             camera_make, camera_model, and software
         """
         videos_dir = Path(source_dir)
-        if not videos_dir.exists():
+        # A single stat call answers both the existence and the directory checks. Like Path.exists, any
+        # error reading the path, such as a permission error or a symlink loop, counts as missing.
+        try:
+            dir_stat = os.stat(videos_dir)
+        except OSError:
             raise ValueError(f"Directory does not exist: {source_dir}")
-        if not videos_dir.is_dir():
+        if not stat.S_ISDIR(dir_stat.st_mode):
             raise ValueError(f"Path is not a directory: {source_dir}")
 
         self.logger.debug("Reading videos from %s", source_dir)
-        videos = []
-        for file_path in videos_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in VideoOffloader.VIDEO_EXTENSIONS:
-                video_metadata = self._extract_metadata(file_path, use_file_date=use_file_date)
-                videos.append(video_metadata)
+        return self._iter_videos_in_rounds(videos_dir, use_file_date, workers, fields_needed)
+
+    def _iter_videos_in_rounds(
+        self, videos_dir: Path, use_file_date: bool, workers: int, fields_needed: AbstractSet[str]
+    ) -> Iterator[VideoMetadata]:
+        """Extract the metadata of the videos in a directory, one exiftool batch per worker at a time."""
+        round_size = VideoOffloader.METADATA_BATCH_SIZE * workers
+        for video_paths in itertools.batched(VideoOffloader._iter_video_paths(videos_dir), round_size):
+            yield from self._extract_metadata_batch(
+                list(video_paths), use_file_date=use_file_date, workers=workers, fields_needed=fields_needed)
+
+    def read_videos(
+        self, source_dir: str | Path, use_file_date: bool = False, workers: int = 1,
+        fields_needed: AbstractSet[str] = ALL_METADATA_FIELDS
+    ) -> list[VideoMetadata]:
+        """
+        Read all video files from the source directory and extract their metadata.
+
+        Args:
+            source_dir: Path to the directory where videos are stored
+            use_file_date: If True and metadata date is not available, use file creation date as fallback
+            workers: Number of threads, each with its own exiftool subprocess, used to extract metadata
+            fields_needed: Names of the metadata fields to read; fields not in the set are left as None
 
+        Returns:
+            List of VideoMetadata objects containing path, date_taken, location,
+            camera_make, camera_model, and software
+        """
+        videos = list(self.iter_videos(
+            source_dir, use_file_date=use_file_date, workers=workers, fields_needed=fields_needed))
         self.logger.info("Read videos from %s, found %d video(s)", source_dir, len(videos))
         return videos
 
+    @staticmethod
+    def _get_software_bucket_key(video: VideoMetadata) -> str:
+        """Get the bucket key for a video grouped by software."""
+        return video.software if video.software is not None else UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_camera_make_bucket_key(video: VideoMetadata) -> str:
+        """Get the bucket key for a video grouped by camera make."""
+        return video.camera_make if video.camera_make is not None else UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_camera_model_bucket_key(video: VideoMetadata) -> str:
+        """Get the bucket key for a video grouped by camera model."""
+        return video.camera_model if video.camera_model is not None else UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_year_bucket_key(video: VideoMetadata) -> str:
+        """Get the bucket key for a video grouped by year taken."""
+        return str(video.date_taken.year) if video.date_taken is not None else UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_year_month_bucket_key(video: VideoMetadata) -> str:
+        """Get the bucket key for a video grouped by year and month taken."""
+        date_taken = video.date_taken
+        if date_taken is not None:
+            return f"{date_taken.year}{YEAR_MONTH_SEPARATOR}{date_taken.month:02d}"
+        return UNKNOWN_BUCKET_KEY
+
+    @staticmethod
+    def _get_year_month_day_bucket_key(video: VideoMetadata) -> str:
+        """Get the bucket key for a video grouped by date taken."""
+        date_taken = video.date_taken
+        if date_taken is not None:
+            return (f"{date_taken.year}{YEAR_MONTH_SEPARATOR}"
+                    f"{date_taken.month:02d}{YEAR_MONTH_SEPARATOR}{date_taken.day:02d}")
+        return UNKNOWN_BUCKET_KEY
+
+    # Bucket key function for each group_by parameter, so the dispatch happens once per call
+    # instead of once per video
+    BUCKET_KEY_FUNCTIONS: dict[GroupBy, Callable[[VideoMetadata], str]] = {
+        GroupBy.SOFTWARE: _get_software_bucket_key,
+        GroupBy.CAMERA_MAKE: _get_camera_make_bucket_key,
+        GroupBy.CAMERA_MODEL: _get_camera_model_bucket_key,
+        GroupBy.YEAR: _get_year_bucket_key,
+        GroupBy.YEAR_MONTH: _get_year_month_bucket_key,
+        GroupBy.YEAR_MONTH_DAY: _get_year_month_day_bucket_key,
+    }
+
+    def _get_bucket_key_function(self, group_by: GroupBy) -> Callable[[VideoMetadata], str]:
+        """Get the function that computes the bucket key of a video for the group_by parameter."""
+        try:
+            return VideoOffloader.BUCKET_KEY_FUNCTIONS[group_by]
+        except KeyError:
+            raise ValueError(f"Unsupported group_by parameter: {group_by}") from None
+
     def _get_bucket_key(self, video: VideoMetadata, group_by: GroupBy) -> str:
         """Get the bucket key for a video based on the group_by parameter."""
-        if group_by == GroupBy.SOFTWARE:
-            return video.software if video.software is not None else UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.CAMERA_MAKE:
-            return video.camera_make if video.camera_make is not None else UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.CAMERA_MODEL:
-            return video.camera_model if video.camera_model is not None else UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.YEAR:
-            return str(video.date_taken.year) if video.date_taken is not None else UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.YEAR_MONTH:
-            if video.date_taken is not None:
-                return f"{video.date_taken.year}{YEAR_MONTH_SEPARATOR}{video.date_taken.month:02d}"
-            return UNKNOWN_BUCKET_KEY
-        elif group_by == GroupBy.YEAR_MONTH_DAY:
-            if video.date_taken is not None:
-                day = video.date_taken.day
-                return (f"{video.date_taken.year}{YEAR_MONTH_SEPARATOR}"
-                        f"{video.date_taken.month:02d}{YEAR_MONTH_SEPARATOR}{day:02d}")
-            return UNKNOWN_BUCKET_KEY
-        else:
-            raise ValueError(f"Unsupported group_by parameter: {group_by}")
+        return self._get_bucket_key_function(group_by)(video)
+
+    # Date components that identify a bucket for each date-based group_by parameter
+    DATE_BUCKET_COMPONENTS = {
+        GroupBy.YEAR: operator.attrgetter('year'),
+        GroupBy.YEAR_MONTH: operator.attrgetter('year', 'month'),
+        GroupBy.YEAR_MONTH_DAY: operator.attrgetter('year', 'month', 'day'),
+    }
 
     def bucket_videos(self, videos: list[VideoMetadata], group_by: GroupBy) -> dict[str, list[VideoMetadata]]:
         """
@@ -387,40 +883,82 @@ class VideoOffloader:
             Dictionary where keys are the bucket values and values are lists of VideoMetadata
         """
         self.logger.debug("Bucketing %d video(s) by %s", len(videos), group_by.value)
-        buckets: dict[str, list[VideoMetadata]] = {}
-
-        for video in videos:
-            key = self._get_bucket_key(video, group_by)
-            buckets.setdefault(key, []).append(video)
+        key_function = self._get_bucket_key_function(group_by)
+        get_date_components = VideoOffloader.DATE_BUCKET_COMPONENTS.get(group_by)
+
+        if get_date_components is not None:
+            # Group on the date components first and format each distinct bucket key once,
+            # instead of formatting a key string for every video
+            date_buckets: defaultdict[Optional[int | tuple[int, ...]], list[VideoMetadata]] = defaultdict(list)
+            for video in videos:
+                date_taken = video.date_taken
+                date_buckets[get_date_components(date_taken) if date_taken is not None else None].append(video)
+            buckets = {key_function(bucket[0]): bucket for bucket in date_buckets.values()}
+        else:
+            key_buckets: defaultdict[str, list[VideoMetadata]] = defaultdict(list)
+            for video in videos:
+                key_buckets[key_function(video)].append(video)
+            buckets = dict(key_buckets)
 
         self.logger.info("Bucketed %d video(s), created %d bucket(s)", len(videos), len(buckets))
         return buckets
 
-    def _get_sort_key(self, video: VideoMetadata, group_by: GroupBy) -> tuple:
-        """
-        Get a sort key for a video based on the group_by parameter.
-        Returns a tuple that can be used for sorting, with Unknown values sorting last.
-        """
-        if group_by == GroupBy.SOFTWARE:
-            return (0, video.software) if video.software is not None else (1, UNKNOWN_BUCKET_KEY)
-        elif group_by == GroupBy.CAMERA_MAKE:
-            return (0, video.camera_make) if video.camera_make is not None else (1, UNKNOWN_BUCKET_KEY)
-        elif group_by == GroupBy.CAMERA_MODEL:
-            return (0, video.camera_model) if video.camera_model is not None else (1, UNKNOWN_BUCKET_KEY)
-        elif group_by == GroupBy.YEAR:
-            if video.date_taken is not None:
-                return (0, video.date_taken.year)
-            return (1, datetime.max)
-        elif group_by == GroupBy.YEAR_MONTH:
-            if video.date_taken is not None:
-                return (0, video.date_taken.year, video.date_taken.month)
-            return (1, datetime.max)
-        elif group_by == GroupBy.YEAR_MONTH_DAY:
-            if video.date_taken is not None:
-                return (0, video.date_taken)
-            return (1, datetime.max)
-        else:
-            raise ValueError(f"Unsupported group_by parameter: {group_by}")
+    @staticmethod
+    def _get_software_sort_key(video: VideoMetadata) -> tuple:
+        """Get the sort key for a video sorted by software."""
+        return (0, video.software) if video.software is not None else (1, UNKNOWN_BUCKET_KEY)
+
+    @staticmethod
+    def _get_camera_make_sort_key(video: VideoMetadata) -> tuple:
+        """Get the sort key for a video sorted by camera make."""
+        return (0, video.camera_make) if video.camera_make is not None else (1, UNKNOWN_BUCKET_KEY)
+
+    @staticmethod
+    def _get_camera_model_sort_key(video: VideoMetadata) -> tuple:
+        """Get the sort key for a video sorted by camera model."""
+        return (0, video.camera_model) if video.camera_model is not None else (1, UNKNOWN_BUCKET_KEY)
+
+    @staticmethod
+    def _get_year_sort_key(video: VideoMetadata) -> tuple:
+        """Get the sort key for a video sorted by year taken."""
+        if video.date_taken is not None:
+            return (0, video.date_taken.year)
+        return (1, datetime.max)
+
+    @staticmethod
+    def _get_year_month_sort_key(video: VideoMetadata) -> tuple:
+        """Get the sort key for a video sorted by year and month taken."""
+        if video.date_taken is not None:
+            return (0, video.date_taken.year, video.date_taken.month)
+        return (1, datetime.max)
+
+    @staticmethod
+    def _get_year_month_day_sort_key(video: VideoMetadata) -> tuple:
+        """Get the sort key for a video sorted by date taken."""
+        if video.date_taken is not None:
+            return (0, video.date_taken)
+        return (1, datetime.max)
+
+    # Sort key function for each group_by parameter, so the dispatch happens once per call
+    # instead of once per video
+    SORT_KEY_FUNCTIONS: dict[GroupBy, Callable[[VideoMetadata], tuple]] = {
+        GroupBy.SOFTWARE: _get_software_sort_key,
+        GroupBy.CAMERA_MAKE: _get_camera_make_sort_key,
+        GroupBy.CAMERA_MODEL: _get_camera_model_sort_key,
+        GroupBy.YEAR: _get_year_sort_key,
+        GroupBy.YEAR_MONTH: _get_year_month_sort_key,
+        GroupBy.YEAR_MONTH_DAY: _get_year_month_day_sort_key,
+    }
+
+    def _get_sort_key_function(self, group_by: GroupBy) -> Callable[[VideoMetadata], tuple]:
+        """
+        Get the function that computes the sort key of a video for the group_by parameter.
+        The keys are tuples that can be used for sorting, with Unknown values sorting last.
+        """
+        try:
+            return VideoOffloader.SORT_KEY_FUNCTIONS[group_by]
+        except KeyError:
+            raise ValueError(f"Unsupported group_by parameter: {group_by}") from None
 
     def sort_videos(self, videos: list[VideoMetadata], group_by: GroupBy) -> list[VideoMetadata]:
         """
@@ -434,17 +972,91 @@ class VideoOffloader:
             Sorted list of VideoMetadata objects
         """
         self.logger.debug("Sorting %d video(s) by %s", len(videos), group_by.value)
-        sorted_videos = sorted(videos, key=lambda video: self._get_sort_key(video, group_by))
+        # sorted() computes each key once; looking the key function up front also saves a call per video
+        sorted_videos = sorted(videos, key=self._get_sort_key_function(group_by))
         self.logger.info("Sorted %d video(s)", len(videos))
         return sorted_videos
 
-    def copy_videos(self, videos: list[VideoMetadata], destination: str | Path) -> None:
+    @staticmethod
+    def _copy_file(source: Path, target: str | Path) -> None:
+        """
+        Copy a file and its metadata, like shutil.copy2.
+
+        Where available, the data is copied within the kernel with os.copy_file_range, which also lets
+        filesystems such as btrfs and XFS share the blocks instead of writing them again. shutil.copyfile
+        is used when it is not available or fails, e.g. across filesystems on older kernels.
+
+        Raises:
+            shutil.SameFileError: If source and target are the same file
+            OSError: If the file could not be copied
+        """
+        copy_file_range = getattr(os, 'copy_file_range', None)
+        copied = False
+        if copy_file_range is not None:
+            # Opening the target for writing truncates it, so check first that it is not the source itself
+            if os.path.exists(target) and os.path.samefile(source, target):
+                raise shutil.SameFileError(f"{source} and {target} are the same file")
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                try:
+                    total = 0
+                    while count := copy_file_range(src.fileno(), dst.fileno(), VideoOffloader.COPY_CHUNK_SIZE):
+                        total += count
+                    # Some filesystems (procfs, sysfs, some FUSE and network filesystems) return 0 instead of
+                    # raising when they do not support it, so the copy only counts if it has the source's size
+                    copied = total == os.fstat(src.fileno()).st_size
+                except OSError:
+                    pass
+        if not copied:
+            # shutil.copyfile truncates the target again, so a partial copy above is overwritten
+            shutil.copyfile(source, target)
+        shutil.copystat(source, target)
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: str | Path) -> None:
+        """
+        Hard link a file to the target path, copying it when a link cannot be created,
+        e.g. because the target is on a different filesystem.
+        """
+        try:
+            os.link(source, target)
+        except OSError:
+            VideoOffloader._copy_file(source, target)
+
+    def _copy_video(self, video: VideoMetadata, dest_path: Path, hardlink: bool, debug_enabled: bool) -> None:
+        """
+        Copy a single video to a destination directory, preserving the filename.
+
+        Args:
+            video: VideoMetadata of the video to copy
+            dest_path: Path to the destination directory
+            hardlink: If True, hard link the video instead of copying its data when possible
+            debug_enabled: Whether debug logging is enabled, checked once by the caller instead of per video
+
+        Raises:
+            RuntimeError: If the video could not be copied
+        """
+        # os.path.join builds the target as a string, skipping the Path object the / operator would create
+        target = os.path.join(dest_path, video.path.name)
+        try:
+            if hardlink:
+                VideoOffloader._link_or_copy(video.path, target)
+            else:
+                VideoOffloader._copy_file(video.path, target)
+            if debug_enabled:
+                self.logger.debug("Copied %s to %s", video.path.name, dest_path)
+        except Exception as e:
+            self.logger.error("Failed to copy %s to %s: %s", video.path, dest_path, e)
+            raise RuntimeError(f"Failed to copy {video.path} to {dest_path}: {e}") from e
+
+    def copy_videos(self, videos: list[VideoMetadata], destination: str | Path, hardlink: bool = False) -> None:
         """
         Copy videos to a destination directory.
 
         Args:
             videos: List of VideoMetadata objects to copy
             destination: Path to the destination directory
+            hardlink: If True, hard link videos into the destination instead of copying their data
+                      when the destination is on the same filesystem
         """
         self.logger.debug("Copying %d video(s) to %s", len(videos), destination)
         dest_path = Path(destination)
@@ -452,16 +1064,23 @@ class VideoOffloader:
         # Create destination directory if it doesn't exist
         dest_path.mkdir(parents=True, exist_ok=True)
 
-        for video in videos:
-            try:
-                # Copy the file to the destination, preserving the filename
-                shutil.copy2(video.path, dest_path / video.path.name)
-                self.logger.debug("Copied %s to %s", video.path.name, destination)
-            except Exception as e:
-                # Log or handle the error, but continue with other videos
-                # In a production system, you might want to collect errors and return them
-                self.logger.error("Failed to copy %s to %s: %s", video.path, destination, e)
-                raise RuntimeError(f"Failed to copy {video.path} to {destination}: {e}") from e
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        # Copies are bound by I/O, so overlap them across threads
+        max_workers = min(VideoOffloader.COPY_MAX_WORKERS, len(videos))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._copy_video, video, dest_path, hardlink, debug_enabled)
+                           for video in videos]
+                try:
+                    for future in futures:
+                        future.result()
+                except RuntimeError:
+                    # Stop copying the remaining videos as soon as one copy fails
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        else:
+            for video in videos:
+                self._copy_video(video, dest_path, hardlink, debug_enabled)
 
         self.logger.info("Copied %d video(s) to %s", len(videos), destination)
 
@@ -477,34 +1096,42 @@ class VideoOffloader:
         self.logger.debug("Archiving %d video(s) to %s", len(videos), destination)
         dest_path = Path(destination)
 
-        # First, copy videos to the destination directory
-        self.copy_videos(videos, destination)
+        # First, stage videos in the destination directory; the staged files are removed once they are
+        # archived, so hard linking them avoids copying the data twice
+        self.copy_videos(videos, destination, hardlink=True)
 
         # Create zip file in the destination directory
         zip_path = dest_path / VideoOffloader.ARCHIVE_FILENAME
         self.logger.debug("Creating zip archive at %s", zip_path)
 
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Remember which files were archived so they can be removed without walking the directory again
+            archived_files = []
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            with zipfile.ZipFile(zip_path, 'w', VideoOffloader.ARCHIVE_COMPRESSION, allowZip64=True) as zipf:
                 # Add all video files in the destination directory to the zip
-                for video_file in dest_path.iterdir():
-                    if video_file.is_file() and video_file.suffix.lower() in VideoOffloader.VIDEO_EXTENSIONS:
-                        zipf.write(video_file, video_file.name)
+                for video_file in VideoOffloader._iter_video_paths(dest_path):
+                    # Stream the file into the archive with a large buffer instead of ZipFile.write()'s 8 KiB one
+                    zip_info = zipfile.ZipInfo.from_file(video_file, video_file.name)
+                    zip_info.compress_type = VideoOffloader.ARCHIVE_COMPRESSION
+                    with open(video_file, 'rb') as src, zipf.open(zip_info, 'w') as dst:
+                        shutil.copyfileobj(src, dst, VideoOffloader.ARCHIVE_BUFFER_SIZE)
+                    archived_files.append(video_file)
+                    if debug_enabled:
                         self.logger.debug("Added %s to archive", video_file.name)
 
-            # Remove the original video files after archiving
-            removed_count = 0
-            for video_file in dest_path.iterdir():
-                if video_file.is_file() and video_file.suffix.lower() in VideoOffloader.VIDEO_EXTENSIONS:
-                    video_file.unlink()
-                    removed_count += 1
+            # Remove the original video files once the zip file is closed
+            for video_file in archived_files:
+                os.unlink(video_file)
 
             self.logger.info("Archived %d video(s) to %s", len(videos), zip_path)
         except Exception as e:
             self.logger.error("Failed to create archive at %s: %s", zip_path, e)
             raise RuntimeError(f"Failed to create archive at {zip_path}: {e}") from e
 
-    def _save_videos(self, videos: list[VideoMetadata], destination: Path, to_archive: bool) -> None:
+    def _save_videos(
+        self, videos: list[VideoMetadata], destination: Path, to_archive: bool, hardlink: bool = False
+    ) -> None:
         """
         Save videos to a destination directory, either by copying or archiving.
 
@@ -512,16 +1139,18 @@ class VideoOffloader:
             videos: List of VideoMetadata objects to save
             destination: Path to the destination directory
             to_archive: If True, archive videos into zip files instead of copying them
+            hardlink: If True, hard link copied videos instead of copying their data when possible
         """
-        destination.mkdir(parents=True, exist_ok=True)
+        # The destination directory is created by copy_videos, which archive_videos also goes through
         if to_archive:
             self.archive_videos(videos, destination)
         else:
-            self.copy_videos(videos, destination)
+            self.copy_videos(videos, destination, hardlink=hardlink)
 
     def offload_videos(
         self, source_dir: str | Path, destination_dir: str | Path,
-        to_archive: bool = False, keep_unknown: bool = True, use_file_date: bool = False
+        to_archive: bool = False, keep_unknown: bool = True, use_file_date: bool = False, workers: int = 1,
+        hardlink: bool = False
     ) -> None:
         """
         Read videos from source directory, bucket by year-month, and copy or archive to destination
@@ -534,15 +1163,35 @@ class VideoOffloader:
             keep_unknown: If True, save files with unknown bucket key and/or invalid year-month separators
                          to the unknown directory. If False, skip them with a log message.
             use_file_date: If True and metadata date is not available, use file creation date as fallback
+            workers: Number of threads used to extract metadata from videos
+            hardlink: If True, hard link videos into the destination instead of copying their data
+                      when the destination is on the same filesystem
         """
         self.logger.debug("Offloading videos from %s to %s", source_dir, destination_dir)
-        videos = self.read_videos(source_dir, use_file_date=use_file_date)
+        # Only the date is needed to bucket videos by year-month, so exiftool reads nothing else
+        videos = self.read_videos(
+            source_dir, use_file_date=use_file_date, workers=workers, fields_needed=GROUP_BY_FIELDS[GroupBy.YEAR_MONTH])
 
         # Bucket videos by year-month
         buckets = self.bucket_videos(videos, GroupBy.YEAR_MONTH)
 
         dest_path = Path(destination_dir)
         dest_path.mkdir(parents=True, exist_ok=True)
+        unknown_dir = dest_path / UNKNOWN_DIRECTORY
+
+        # Resolve the destination of every bucket first, so all directories are created in one pass
+        # before any video is copied. Keys that are not in the "YYYY-MM" format have no month directory.
+        month_dirs = {}
+        for year_month in buckets:
+            match = VideoOffloader.YEAR_MONTH_PATTERN.fullmatch(year_month)
+            if match is not None:
+                # Create directory structure: year=X/month=YY (HDFS format with padded month)
+                year, month = int(match[1]), int(match[2])
+                month_dirs[year_month] = dest_path.joinpath(f"{YEAR_PREFIX}{year}", f"{MONTH_PREFIX}{month:02d}")
+        for month_dir in month_dirs.values():
+            month_dir.mkdir(parents=True, exist_ok=True)
+        if keep_unknown and len(month_dirs) < len(buckets):
+            unknown_dir.mkdir(exist_ok=True)
 
         # Process each bucket
         unknown_count = 0
@@ -552,39 +1201,31 @@ class VideoOffloader:
                 unknown_count += len(bucket_videos)
                 if keep_unknown:
                     # Save videos without date information to unknown directory
-                    unknown_dir = dest_path / UNKNOWN_DIRECTORY
                     self.logger.info("Processing %d video(s) without date information", len(bucket_videos))
-                    self._save_videos(bucket_videos, unknown_dir, to_archive)
+                    self._save_videos(bucket_videos, unknown_dir, to_archive, hardlink)
                 else:
                     # Skip videos without date information
                     for video in bucket_videos:
                         self.logger.info("Skipping video %s: missing date information", video.path)
                 continue
 
-            # Parse year-month string (format: "YYYY-MM")
-            try:
-                year, month = year_month.split(YEAR_MONTH_SEPARATOR)
-                year = int(year)
-                month = int(month)
-            except ValueError:
+            month_dir = month_dirs.get(year_month)
+            if month_dir is None:
                 invalid_format_count += len(bucket_videos)
                 if keep_unknown:
                     # Save videos with invalid year-month format to unknown directory
-                    unknown_dir = dest_path / UNKNOWN_DIRECTORY
                     self.logger.info(
                         "Processing %d video(s) with invalid year-month format (%s) to unknown directory",
                         len(bucket_videos), year_month)
-                    self._save_videos(bucket_videos, unknown_dir, to_archive)
+                    self._save_videos(bucket_videos, unknown_dir, to_archive, hardlink)
                 else:
                     # Skip videos with invalid year-month format
                     for video in bucket_videos:
                         self.logger.info("Skipping video %s: invalid year-month format (%s)", video.path, year_month)
                 continue
 
-            # Create directory structure: year=X/month=YY (HDFS format with padded month)
-            month_dir = dest_path / f"{YEAR_PREFIX}{year}" / f"{MONTH_PREFIX}{month:02d}"
             self.logger.info("Processing %d video(s) for %s", len(bucket_videos), year_month)
-            self._save_videos(bucket_videos, month_dir, to_archive)
+            self._save_videos(bucket_videos, month_dir, to_archive, hardlink)
 
         # Log photos that were saved to unknown directory or skipped
         if unknown_count > 0:
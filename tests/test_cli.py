@@ -1,483 +1,451 @@
 # -*- coding: utf-8 -*-
 import logging
+import os
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
-from offload.cli import main
+from offload.cli import DEFAULT_METADATA_CACHE, main
+from offload.photo_offloader import PhotoOffloader
+from offload.video_offloader import VideoOffloader
+
+# Logger configured by the CLI
+OFFLOAD_LOGGER = logging.getLogger('offload')
+
+# Memory-backed directory for files the tests need on disk, if the system has one
+MEMORY_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+@pytest.fixture(scope="session")
+def dirs(tmp_path_factory):
+    """
+    Create an empty source directory and a destination path shared by the tests.
+    No test puts files in the source directory, so the destination never receives any.
+
+    Returns:
+        Tuple of (source path, destination path, base arguments passing both to the CLI)
+    """
+    root = tmp_path_factory.mktemp("cli")
+    source_dir = root / "source"
+    source_dir.mkdir()
+    source_str, dest_str = str(source_dir), str(root / "dest")
+    return source_str, dest_str, ('--source', source_str, '--destination', dest_str)
+
+
+@pytest.fixture(autouse=True)
+def clean_logger():
+    """Start each test with no handlers on the offload logger and restore the original ones afterwards."""
+    saved_handlers = OFFLOAD_LOGGER.handlers[:]
+    OFFLOAD_LOGGER.handlers.clear()
+    yield
+    OFFLOAD_LOGGER.handlers = saved_handlers
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Create a CliRunner shared by the tests; each invocation runs in its own isolated context."""
+    return CliRunner()
 
 
 class TestCLI:
     """Test suite for the CLI module."""
 
-    def test_main_with_valid_arguments(self):
+    @pytest.fixture
+    def mock_photo_offloader(self):
+        """Patch the PhotoOffloader used by the CLI, yielding the mocked class and its instance."""
+        with patch('offload.cli.PhotoOffloader') as mock_app_class:
+            mock_app = Mock(spec=PhotoOffloader)
+            mock_app_class.return_value = mock_app
+            yield mock_app_class, mock_app
+
+    @pytest.fixture
+    def mock_video_offloader(self):
+        """Patch the VideoOffloader used by the CLI, yielding the mocked class and its instance."""
+        with patch('offload.cli.VideoOffloader') as mock_app_class:
+            mock_app = Mock(spec=VideoOffloader)
+            mock_app_class.return_value = mock_app
+            yield mock_app_class, mock_app
+
+    def test_main_with_valid_arguments(self, runner, dirs, mock_photo_offloader):
         """Test that main function works with valid arguments."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir)
-                ])
-
-                assert result.exit_code == 0
-                mock_app_class.assert_called_once()
-                mock_app.offload_photos.assert_called_once_with(
-                    str(source_dir),
-                    str(dest_dir),
-                    to_archive=False,
-                    keep_unknown=True,
-                    use_file_date=False
-                )
-
-    def test_main_with_archive_flag(self):
+        source_dir, dest_dir, base_args = dirs
+        mock_app_class, mock_app = mock_photo_offloader
+
+        result = runner.invoke(main, base_args, standalone_mode=False)
+
+        assert result.exit_code == 0
+        mock_app_class.assert_called_once()
+        mock_app.offload_photos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=False,
+            keep_unknown=True,
+            use_file_date=False,
+            workers=1
+        )
+
+    def test_main_with_archive_flag(self, runner, dirs, mock_photo_offloader):
         """Test that archive flag is passed correctly."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir),
-                    '--archive'
-                ])
-
-                assert result.exit_code == 0
-                mock_app.offload_photos.assert_called_once_with(
-                    str(source_dir),
-                    str(dest_dir),
-                    to_archive=True,
-                    keep_unknown=True,
-                    use_file_date=False
-                )
-
-    def test_main_with_short_archive_flag(self):
+        source_dir, dest_dir, base_args = dirs
+        _, mock_app = mock_photo_offloader
+
+        result = runner.invoke(main, [
+            *base_args,
+            '--archive'
+        ], standalone_mode=False)
+
+        assert result.exit_code == 0
+        mock_app.offload_photos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=True,
+            keep_unknown=True,
+            use_file_date=False,
+            workers=1
+        )
+
+    def test_main_with_short_archive_flag(self, runner, dirs, mock_photo_offloader):
         """Test that short archive flag (-a) works."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '-s', str(source_dir),
-                    '-d', str(dest_dir),
-                    '-a'
-                ])
-
-                assert result.exit_code == 0
-                mock_app.offload_photos.assert_called_once_with(
-                    str(source_dir),
-                    str(dest_dir),
-                    to_archive=True,
-                    keep_unknown=True,
-                    use_file_date=False
-                )
-
-    def test_main_with_log_level_debug(self):
-        """Test that log level DEBUG is set correctly."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir),
-                    '--log-level', 'DEBUG'
-                ])
-
-                assert result.exit_code == 0
-                logger = logging.getLogger('offload')
-                assert logger.level == logging.DEBUG
-
-    def test_main_with_log_level_info(self):
-        """Test that log level INFO is set correctly (default)."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir)
-                ])
-
-                assert result.exit_code == 0
-                logger = logging.getLogger('offload')
-                assert logger.level == logging.INFO
-
-    def test_main_with_log_level_warning(self):
-        """Test that log level WARNING is set correctly."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir),
-                    '--log-level', 'WARNING'
-                ])
-
-                assert result.exit_code == 0
-                logger = logging.getLogger('offload')
-                assert logger.level == logging.WARNING
-
-    def test_main_with_log_level_error(self):
-        """Test that log level ERROR is set correctly."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir),
-                    '--log-level', 'ERROR'
-                ])
-
-                assert result.exit_code == 0
-                logger = logging.getLogger('offload')
-                assert logger.level == logging.ERROR
-
-    def test_main_with_log_level_critical(self):
-        """Test that log level CRITICAL is set correctly."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir),
-                    '--log-level', 'CRITICAL'
-                ])
-
-                assert result.exit_code == 0
-                logger = logging.getLogger('offload')
-                assert logger.level == logging.CRITICAL
-
-    def test_main_with_invalid_log_level(self):
-        """Test that invalid log level raises an error."""
-        runner = CliRunner()
+        source_dir, dest_dir, _ = dirs
+        _, mock_app = mock_photo_offloader
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        result = runner.invoke(main, [
+            '-s', source_dir,
+            '-d', dest_dir,
+            '-a'
+        ], standalone_mode=False)
 
-            result = runner.invoke(main, [
-                '--source', str(source_dir),
-                '--destination', str(dest_dir),
-                '--log-level', 'INVALID'
-            ])
+        assert result.exit_code == 0
+        mock_app.offload_photos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=True,
+            keep_unknown=True,
+            use_file_date=False,
+            workers=1
+        )
+
+    @pytest.mark.xdist_group("logger")
+    @pytest.mark.parametrize("log_level_arg,expected_level", [
+        (None, logging.INFO),
+        ('DEBUG', logging.DEBUG),
+        ('INFO', logging.INFO),
+        ('WARNING', logging.WARNING),
+        ('ERROR', logging.ERROR),
+        ('CRITICAL', logging.CRITICAL),
+    ])
+    @pytest.mark.usefixtures('mock_photo_offloader')
+    def test_main_with_log_level(self, runner, dirs, log_level_arg, expected_level):
+        """Test that the log level is set correctly, defaulting to INFO."""
+        _, _, base_args = dirs
+        args = [*base_args, '--log-level', log_level_arg] if log_level_arg is not None else base_args
+
+        result = runner.invoke(main, args, standalone_mode=False)
 
-            assert result.exit_code != 0
-            assert 'invalid' in result.output.lower() or 'choice' in result.output.lower()
+        assert result.exit_code == 0
+        logger = OFFLOAD_LOGGER
+        assert logger.level == expected_level
 
-    def test_main_with_missing_source(self):
-        """Test that missing source directory raises an error."""
-        runner = CliRunner()
+    def test_main_with_invalid_log_level(self, runner, dirs):
+        """Test that invalid log level raises an error."""
+        _, _, base_args = dirs
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dest_dir = Path(tmpdir) / "dest"
-            nonexistent_source = Path(tmpdir) / "nonexistent"
+        result = runner.invoke(main, [
+            *base_args,
+            '--log-level', 'INVALID'
+        ])
 
-            result = runner.invoke(main, [
-                '--source', str(nonexistent_source),
-                '--destination', str(dest_dir)
-            ])
+        assert result.exit_code != 0
+        assert 'invalid' in result.output.lower() or 'choice' in result.output.lower()
 
-            assert result.exit_code != 0
-            assert "does not exist" in result.output.lower() or "path" in result.output.lower()
+    def test_main_with_missing_source(self, runner, dirs):
+        """Test that missing source directory raises an error."""
+        source_dir, dest_dir, _ = dirs
+        nonexistent_source = str(Path(source_dir).parent / "nonexistent")
+
+        result = runner.invoke(main, [
+            '--source', nonexistent_source,
+            '--destination', dest_dir
+        ])
+
+        assert result.exit_code != 0
+        assert "does not exist" in result.output.lower() or "path" in result.output.lower()
 
-    def test_main_with_file_as_source(self):
+    def test_main_with_file_as_source(self, runner, dirs):
         """Test that providing a file as source raises an error."""
-        runner = CliRunner()
+        _, dest_dir, _ = dirs
 
-        with tempfile.TemporaryDirectory() as tmpdir:
+        # Prefer a memory-backed filesystem for the throwaway source file when there is one
+        with tempfile.TemporaryDirectory(dir=MEMORY_TEMP_DIR) as tmpdir:
             source_file = Path(tmpdir) / "source.txt"
-            dest_dir = Path(tmpdir) / "dest"
             source_file.write_text("test")
 
             result = runner.invoke(main, [
                 '--source', str(source_file),
-                '--destination', str(dest_dir)
+                '--destination', dest_dir
             ])
 
             assert result.exit_code != 0
 
-    def test_main_with_missing_required_options(self):
+    def test_main_with_missing_required_options(self, runner):
         """Test that missing required options raises an error."""
-        runner = CliRunner()
-
         result = runner.invoke(main, [])
 
         assert result.exit_code != 0
         assert "missing" in result.output.lower() or "required" in result.output.lower()
 
-    def test_main_help_text(self):
-        """Test that help text is displayed correctly."""
-        runner = CliRunner()
-
-        result = runner.invoke(main, ['--help'])
+    @pytest.mark.parametrize("help_flag", ['--help', '-h'])
+    def test_main_help_text(self, runner, help_flag):
+        """Test that help text is displayed correctly for both help flags."""
+        result = runner.invoke(main, [help_flag])
 
         assert result.exit_code == 0
-        assert 'Source directory' in result.output or 'source' in result.output.lower()
-        assert 'Destination directory' in result.output or 'destination' in result.output.lower()
-        assert 'Archive photos' in result.output or 'archive' in result.output.lower()
-        assert 'log-level' in result.output.lower() or 'logging level' in result.output.lower()
+        output = result.output.lower()
+        for option in ('source', 'destination', 'archive', 'log-level'):
+            assert option in output
+
+    @pytest.mark.xdist_group("logger")
+    @pytest.mark.usefixtures('mock_photo_offloader')
+    def test_logger_handler_setup(self, runner, dirs):
+        """Test that logger handler is set up correctly."""
+        _, _, base_args = dirs
 
-    def test_main_help_with_h_flag(self):
-        """Test that -h flag displays help."""
-        runner = CliRunner()
+        logger = OFFLOAD_LOGGER
 
-        result = runner.invoke(main, ['-h'])
+        result = runner.invoke(main, base_args, standalone_mode=False)
 
         assert result.exit_code == 0
-        assert 'Source directory' in result.output or 'source' in result.output.lower()
+        assert len(logger.handlers) > 0
+        assert isinstance(logger.handlers[0], logging.StreamHandler)
 
-    def test_logger_handler_setup(self):
-        """Test that logger handler is set up correctly."""
-        runner = CliRunner()
+    @pytest.mark.xdist_group("logger")
+    @pytest.mark.usefixtures('mock_photo_offloader')
+    def test_logger_formatter_setup(self, runner, dirs):
+        """Test that logger formatter is set up correctly."""
+        _, _, base_args = dirs
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        logger = OFFLOAD_LOGGER
 
-            # Clear any existing handlers
-            logger = logging.getLogger('offload')
-            logger.handlers.clear()
+        result = runner.invoke(main, base_args, standalone_mode=False)
 
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
+        assert result.exit_code == 0
+        assert len(logger.handlers) > 0
+        handler = logger.handlers[0]
+        assert handler.formatter is not None
+        assert isinstance(handler.formatter, logging.Formatter)
+        expected_format = "%(asctime)s: %(name)s/%(levelname)-9s: %(message)s"
+        assert handler.formatter._fmt == expected_format
+
+    @pytest.mark.xdist_group("logger")
+    @pytest.mark.usefixtures('mock_photo_offloader')
+    def test_logger_handler_not_duplicated(self, runner, dirs):
+        """Test that logger handler is not duplicated on multiple calls."""
+        _, _, base_args = dirs
 
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir)
-                ])
+        logger = OFFLOAD_LOGGER
 
-                assert result.exit_code == 0
-                assert len(logger.handlers) > 0
-                assert isinstance(logger.handlers[0], logging.StreamHandler)
+        # Call main twice; the handler added by the first call must be reused by the second
+        for _ in range(2):
+            result = runner.invoke(main, base_args, standalone_mode=False)
+            assert result.exit_code == 0
+            assert len(logger.handlers) == 1
 
-    def test_logger_formatter_setup(self):
-        """Test that logger formatter is set up correctly."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            # Clear any existing handlers
-            logger = logging.getLogger('offload')
-            logger.handlers.clear()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir)
-                ])
-
-                assert result.exit_code == 0
-                assert len(logger.handlers) > 0
-                handler = logger.handlers[0]
-                assert handler.formatter is not None
-                assert isinstance(handler.formatter, logging.Formatter)
-                expected_format = "%(asctime)s: %(name)s/%(levelname)-9s: %(message)s"
-                assert handler.formatter._fmt == expected_format
-
-    def test_logger_handler_not_duplicated(self):
-        """Test that logger handler is not duplicated on multiple calls."""
-        runner = CliRunner()
+    @pytest.mark.xdist_group("logger")
+    def test_debug_message_not_formatted_below_level(self, runner, dirs):
+        """Test that the offloader's debug messages are not formatted when the log level filters them out."""
+        source_dir, dest_dir, base_args = dirs
+        logger = OFFLOAD_LOGGER
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        with patch.object(logger, 'debug', wraps=logger.debug) as mock_debug:
+            with patch.object(logging.LogRecord, 'getMessage') as mock_get_message:
+                result = runner.invoke(
+                    main, [*base_args, '--media-type', 'photos', '--log-level', 'WARNING'], standalone_mode=False)
 
-            # Clear any existing handlers
-            logger = logging.getLogger('offload')
-            logger.handlers.clear()
+        assert result.exit_code == 0
+        # The arguments are handed to the logger unformatted, and the logger never formats them
+        mock_debug.assert_any_call("Offloading photos from %s to %s", source_dir, dest_dir)
+        mock_get_message.assert_not_called()
 
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
+    @pytest.mark.xdist_group("logger")
+    def test_debug_message_logged_at_debug_level(self, runner, dirs, caplog):
+        """Test that the offloader started by the CLI logs what it offloads at DEBUG level."""
+        source_dir, dest_dir, base_args = dirs
 
-                # Call main twice
-                runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir)
-                ])
+        result = runner.invoke(
+            main, [*base_args, '--media-type', 'photos', '--log-level', 'DEBUG'], standalone_mode=False)
 
-                handler_count_after_first = len(logger.handlers)
+        assert result.exit_code == 0
+        assert f"Offloading photos from {source_dir} to {dest_dir}" in caplog.messages
 
-                runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir)
-                ])
+    def test_application_receives_logger(self, runner, dirs, mock_photo_offloader):
+        """Test that PhotoOffloader is initialized with the logger."""
+        _, _, base_args = dirs
+        mock_app_class, _ = mock_photo_offloader
 
-                # Handler count should not increase
-                assert len(logger.handlers) == handler_count_after_first
+        result = runner.invoke(main, base_args, standalone_mode=False)
 
-    def test_application_receives_logger(self):
-        """Test that PhotoOffloader is initialized with the logger."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_app_class:
-                mock_app = MagicMock()
-                mock_app_class.return_value = mock_app
-
-                result = runner.invoke(main, [
-                    '--source', str(source_dir),
-                    '--destination', str(dest_dir)
-                ])
-
-                assert result.exit_code == 0
-                # Verify PhotoOffloader was called with a logger instance
-                mock_app_class.assert_called_once()
-                call_args = mock_app_class.call_args
-                assert len(call_args[0]) == 1
-                assert isinstance(call_args[0][0], logging.Logger)
-                assert call_args[0][0].name == 'offload'
-
-    def test_main_with_skip_unknown_flag(self):
+        assert result.exit_code == 0
+        # Verify PhotoOffloader was called with a logger instance
+        mock_app_class.assert_called_once()
+        call_args = mock_app_class.call_args
+        assert len(call_args[0]) == 1
+        assert isinstance(call_args[0][0], logging.Logger)
+        assert call_args[0][0].name == 'offload'
+
+    def test_main_with_skip_unknown_flag(self, runner, dirs, mock_photo_offloader, mock_video_offloader):
         """Test that --skip-unknown flag is passed to both PhotoOffloader and VideoOffloader."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_photo_app_class:
-                with patch('offload.cli.VideoOffloader') as mock_video_app_class:
-                    mock_photo_app = MagicMock()
-                    mock_video_app = MagicMock()
-                    mock_photo_app_class.return_value = mock_photo_app
-                    mock_video_app_class.return_value = mock_video_app
-
-                    result = runner.invoke(main, [
-                        '--source', str(source_dir),
-                        '--destination', str(dest_dir),
-                        '--skip-unknown'
-                    ])
-
-                    assert result.exit_code == 0
-                    mock_photo_app.offload_photos.assert_called_once_with(
-                        str(source_dir),
-                        str(dest_dir),
-                        to_archive=False,
-                        keep_unknown=False,
-                        use_file_date=False
-                    )
-                    mock_video_app.offload_videos.assert_called_once_with(
-                        str(source_dir),
-                        str(dest_dir),
-                        to_archive=False,
-                        keep_unknown=False,
-                        use_file_date=False
-                    )
-
-    def test_main_with_use_file_date_flag(self):
+        source_dir, dest_dir, base_args = dirs
+        _, mock_photo_app = mock_photo_offloader
+        _, mock_video_app = mock_video_offloader
+
+        result = runner.invoke(main, [
+            *base_args,
+            '--skip-unknown'
+        ], standalone_mode=False)
+
+        assert result.exit_code == 0
+        mock_photo_app.offload_photos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=False,
+            keep_unknown=False,
+            use_file_date=False,
+            workers=1
+        )
+        mock_video_app.offload_videos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=False,
+            keep_unknown=False,
+            use_file_date=False,
+            workers=1,
+            hardlink=False
+        )
+
+    def test_main_with_use_file_date_flag(self, runner, dirs, mock_photo_offloader, mock_video_offloader):
         """Test that --use-file-date flag is passed to both PhotoOffloader and VideoOffloader."""
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            with patch('offload.cli.PhotoOffloader') as mock_photo_app_class:
-                with patch('offload.cli.VideoOffloader') as mock_video_app_class:
-                    mock_photo_app = MagicMock()
-                    mock_video_app = MagicMock()
-                    mock_photo_app_class.return_value = mock_photo_app
-                    mock_video_app_class.return_value = mock_video_app
-
-                    result = runner.invoke(main, [
-                        '--source', str(source_dir),
-                        '--destination', str(dest_dir),
-                        '--use-file-date'
-                    ])
-
-                    assert result.exit_code == 0
-                    mock_photo_app.offload_photos.assert_called_once_with(
-                        str(source_dir),
-                        str(dest_dir),
-                        to_archive=False,
-                        keep_unknown=True,
-                        use_file_date=True
-                    )
-                    mock_video_app.offload_videos.assert_called_once_with(
-                        str(source_dir),
-                        str(dest_dir),
-                        to_archive=False,
-                        keep_unknown=True,
-                        use_file_date=True
-                    )
+        source_dir, dest_dir, base_args = dirs
+        _, mock_photo_app = mock_photo_offloader
+        _, mock_video_app = mock_video_offloader
+
+        result = runner.invoke(main, [
+            *base_args,
+            '--use-file-date'
+        ], standalone_mode=False)
+
+        assert result.exit_code == 0
+        mock_photo_app.offload_photos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=False,
+            keep_unknown=True,
+            use_file_date=True,
+            workers=1
+        )
+        mock_video_app.offload_videos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=False,
+            keep_unknown=True,
+            use_file_date=True,
+            workers=1,
+            hardlink=False
+        )
+
+    @pytest.mark.usefixtures('mock_photo_offloader')
+    def test_main_closes_video_offloader(self, runner, dirs, mock_video_offloader):
+        """Test that the VideoOffloader is closed even when offloading fails."""
+        _, _, base_args = dirs
+        _, mock_video_app = mock_video_offloader
+        mock_video_app.offload_videos.side_effect = RuntimeError("Failed to copy")
+
+        result = runner.invoke(main, [*base_args, '--media-type', 'videos'])
+
+        assert result.exit_code != 0
+        mock_video_app.close.assert_called_once_with()
+
+    @pytest.mark.usefixtures('mock_photo_offloader')
+    def test_main_with_metadata_cache(self, runner, dirs, mock_video_offloader, tmp_path):
+        """Test that --metadata-cache is passed to VideoOffloader."""
+        _, _, base_args = dirs
+        mock_video_class, _ = mock_video_offloader
+        cache_path = str(tmp_path / "cache.sqlite")
+
+        result = runner.invoke(main, [*base_args, '--metadata-cache', cache_path], standalone_mode=False)
+
+        assert result.exit_code == 0
+        mock_video_class.assert_called_once_with(OFFLOAD_LOGGER, cache_path=cache_path)
+
+    @pytest.mark.usefixtures('mock_photo_offloader')
+    def test_main_with_default_metadata_cache(self, runner, dirs, mock_video_offloader):
+        """Test that --metadata-cache without a path uses the default cache file."""
+        _, _, base_args = dirs
+        mock_video_class, _ = mock_video_offloader
+
+        result = runner.invoke(main, [*base_args, '--metadata-cache'], standalone_mode=False)
+
+        assert result.exit_code == 0
+        mock_video_class.assert_called_once_with(OFFLOAD_LOGGER, cache_path=DEFAULT_METADATA_CACHE)
+        assert DEFAULT_METADATA_CACHE.endswith(os.path.join('offload', 'videos.sqlite'))
+
+    def test_main_with_hardlink_flag(self, runner, dirs, mock_video_offloader):
+        """Test that --hardlink flag is passed to VideoOffloader."""
+        source_dir, dest_dir, base_args = dirs
+        _, mock_video_app = mock_video_offloader
+
+        result = runner.invoke(main, [*base_args, '--media-type', 'videos', '--hardlink'], standalone_mode=False)
+
+        assert result.exit_code == 0
+        mock_video_app.offload_videos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=False,
+            keep_unknown=True,
+            use_file_date=False,
+            workers=1,
+            hardlink=True
+        )
+
+    def test_main_with_workers(self, runner, dirs, mock_photo_offloader, mock_video_offloader):
+        """Test that --workers is passed to both PhotoOffloader and VideoOffloader."""
+        source_dir, dest_dir, base_args = dirs
+        _, mock_photo_app = mock_photo_offloader
+        _, mock_video_app = mock_video_offloader
+
+        result = runner.invoke(main, [
+            *base_args,
+            '--workers', '4'
+        ], standalone_mode=False)
+
+        assert result.exit_code == 0
+        mock_photo_app.offload_photos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=False,
+            keep_unknown=True,
+            use_file_date=False,
+            workers=4
+        )
+        mock_video_app.offload_videos.assert_called_once_with(
+            source_dir,
+            dest_dir,
+            to_archive=False,
+            keep_unknown=True,
+            use_file_date=False,
+            workers=4,
+            hardlink=False
+        )
+
+    def test_main_with_invalid_workers(self, runner, dirs):
+        """Test that --workers must be at least 1."""
+        _, _, base_args = dirs
+
+        result = runner.invoke(main, [
+            *base_args,
+            '--workers', '0'
+        ])
+
+        assert result.exit_code != 0
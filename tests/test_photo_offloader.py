@@ -1,15 +1,18 @@
 # -*- coding: utf-8 -*-
 import logging
+import shutil
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from PIL import Image
 
-from offload.constants import GroupBy
+from offload.constants import DATE_FIELD, GROUP_BY_FIELDS, GroupBy
 from offload.photo_offloader import PhotoOffloader, PhotoMetadata
 
 
@@ -42,6 +45,13 @@ class TestPhotoOffloader:
         app = PhotoOffloader(logger)
         assert app.logger == logger
 
+    def test_photo_metadata_uses_slots(self):
+        """Test PhotoMetadata instances store their fields in slots instead of a __dict__."""
+        photo = PhotoMetadata(path=Path("test.jpg"))
+        assert not hasattr(photo, '__dict__')
+        with pytest.raises(AttributeError):
+            photo.unknown_field = "value"
+
     def test_dms_to_decimal_north_east(self, app):
         """Test DMS to decimal conversion for North/East coordinates."""
         # Test coordinates: 37° 46' 26.2992" N, 122° 25' 52.0176" W
@@ -67,6 +77,19 @@ class TestPhotoOffloader:
         assert lat < 0
         assert lon < 0
 
+    def test_dms_to_decimal_is_cached(self, app):
+        """Test repeated DMS to decimal conversions are served from the cache."""
+        PhotoOffloader._dms_to_decimal.cache_clear()
+        lat_dms = (37, 46, 26.2992)
+
+        first = PhotoOffloader._dms_to_decimal(lat_dms, 'N')
+        second = PhotoOffloader._dms_to_decimal(lat_dms, 'N')
+
+        assert first == second
+        cache_info = PhotoOffloader._dms_to_decimal.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
     def test_parse_exif_date_datetime_original(self, app):
         """Test parsing date from DateTimeOriginal field."""
         exif_data = {'DateTimeOriginal': '2023:05:15 14:30:00'}
@@ -107,6 +130,18 @@ class TestPhotoOffloader:
         date = app._parse_exif_date(exif_data)
         assert date is None
 
+    def test_parse_exif_date_invalid_canonical_values(self, app):
+        """Test parsing a date in the canonical layout with out-of-range values falls through to the next field."""
+        exif_data = {'DateTimeOriginal': '2023:13:15 14:30:00', 'DateTime': '2023:05:15 14:30:00'}
+        date = app._parse_exif_date(exif_data)
+        assert date == datetime(2023, 5, 15, 14, 30, 0)
+
+    def test_parse_exif_date_non_canonical_format(self, app):
+        """Test parsing a date without zero padding falls back to strptime."""
+        exif_data = {'DateTimeOriginal': '2023:5:15 14:30:00'}
+        date = app._parse_exif_date(exif_data)
+        assert date == datetime(2023, 5, 15, 14, 30, 0)
+
     def test_parse_exif_date_no_date_fields(self, app):
         """Test parsing date when no date fields exist."""
         exif_data = {'Make': 'Canon'}
@@ -263,6 +298,152 @@ class TestPhotoOffloader:
             assert metadata.path == photo_path
             # The code path through lines 145-152 should be executed
 
+    def test_extract_metadata_only_parses_fields_needed(self, app):
+        """Test _extract_metadata skips parsing fields that are not in fields_needed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            photo_path = tmp_path / "photo.jpg"
+
+            img = Image.new('RGB', (100, 100), color='red')
+            exif = img.getexif()
+            from PIL.ExifTags import TAGS
+            tag_map = {v: k for k, v in TAGS.items()}
+            exif[tag_map['DateTimeOriginal']] = '2023:05:15 14:30:00'
+            exif[tag_map['Make']] = 'Canon'
+            exif[tag_map['Software']] = 'Test Software'
+            img.save(photo_path, exif=exif)
+
+            # Only the date is needed to bucket by year-month
+            metadata = app._extract_metadata(photo_path, fields_needed=GROUP_BY_FIELDS[GroupBy.YEAR_MONTH])
+            assert metadata.date_taken == datetime(2023, 5, 15, 14, 30, 0)
+            assert metadata.camera_make is None
+            assert metadata.software is None
+
+            # Only camera information is needed to bucket by software
+            metadata = app._extract_metadata(photo_path, fields_needed=GROUP_BY_FIELDS[GroupBy.SOFTWARE])
+            assert metadata.date_taken is None
+            assert metadata.software == 'Test Software'
+
+    def test_read_exif_fast_matches_pillow(self, app):
+        """Test _read_exif_fast reads the same date and camera tags as Pillow."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            photo_path = tmp_path / "photo.jpg"
+
+            img = Image.new('RGB', (100, 100), color='red')
+            exif = img.getexif()
+            from PIL.ExifTags import TAGS, IFD
+            tag_map = {v: k for k, v in TAGS.items()}
+            exif[tag_map['Make']] = 'Canon'
+            exif[tag_map['Model']] = 'EOS 5D'
+            exif[tag_map['Software']] = 'Test Software'
+            exif[tag_map['DateTime']] = '2023:05:16 10:00:00'
+            exif.get_ifd(IFD.Exif)[tag_map['DateTimeOriginal']] = '2023:05:15 14:30:00'
+            img.save(photo_path, exif=exif)
+
+            tags = PhotoOffloader._read_exif_fast(photo_path)
+            with Image.open(photo_path) as opened:
+                pillow_tags = PhotoOffloader._exif_to_dict(opened.getexif())
+            for tag in ('Make', 'Model', 'Software', 'DateTime', 'DateTimeOriginal'):
+                assert tags[tag] == pillow_tags[tag]
+            assert tags['DateTimeOriginal'] == '2023:05:15 14:30:00'
+
+    def test_extract_metadata_paths_agree_on_date(self, app):
+        """Test the fast and Pillow paths both prefer DateTimeOriginal from the Exif IFD over IFD0 DateTime."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            photo_path = Path(tmpdir) / "photo.jpg"
+
+            img = Image.new('RGB', (100, 100), color='red')
+            exif = img.getexif()
+            from PIL.ExifTags import TAGS, IFD
+            tag_map = {v: k for k, v in TAGS.items()}
+            exif[tag_map['DateTime']] = '2020:01:01 00:00:00'
+            exif.get_ifd(IFD.Exif)[tag_map['DateTimeOriginal']] = '2023:05:15 14:30:00'
+            img.save(photo_path, exif=exif)
+
+            fast = app._extract_metadata(photo_path, fields_needed=frozenset({DATE_FIELD}))
+            pillow = app._extract_metadata(photo_path)
+            assert fast.date_taken == pillow.date_taken == datetime(2023, 5, 15, 14, 30, 0)
+
+    def test_read_exif_fast_without_exif(self, app):
+        """Test _read_exif_fast returns an empty dict for a JPEG without EXIF data."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            photo_path = self.create_test_image(Path(tmpdir) / "photo.jpg")
+            assert PhotoOffloader._read_exif_fast(photo_path) == {}
+
+    def test_read_exif_fast_png(self, app):
+        """Test _read_exif_fast reads EXIF tags from the eXIf chunk of a PNG."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            photo_path = tmp_path / "photo.png"
+
+            img = Image.new('RGB', (100, 100), color='red')
+            exif = img.getexif()
+            from PIL.ExifTags import TAGS
+            tag_map = {v: k for k, v in TAGS.items()}
+            exif[tag_map['Software']] = 'Test Software'
+            img.save(photo_path, exif=exif)
+
+            assert PhotoOffloader._read_exif_fast(photo_path) == {'Software': 'Test Software'}
+
+    def test_read_exif_fast_png_without_exif(self, app):
+        """Test _read_exif_fast returns an empty dict for a PNG without EXIF data."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            photo_path = self.create_test_image(Path(tmpdir) / "photo.png")
+            assert PhotoOffloader._read_exif_fast(photo_path) == {}
+
+    def test_read_exif_fast_unsupported_format(self, app):
+        """Test _read_exif_fast returns None for formats it cannot parse, such as HEIC."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            photo_path = Path(tmpdir) / "photo.heic"
+            photo_path.write_bytes(b'\x00\x00\x00\x18ftypheic')
+            assert PhotoOffloader._read_exif_fast(photo_path) is None
+
+    def test_read_exif_fast_content_does_not_match_extension(self, app):
+        """Test _read_exif_fast leaves a .jpg file that does not start with a JPEG signature to Pillow."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            photo_path = Path(tmpdir) / "photo.jpg"
+            photo_path.write_bytes(b"not an image")
+            assert PhotoOffloader._read_exif_fast(photo_path) is None
+
+    def test_extract_metadata_misnamed_file(self, app):
+        """Test _extract_metadata reads the date of TIFF data saved with a .jpg extension through Pillow."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            photo_path = Path(tmpdir) / "photo.jpg"
+            img = Image.new('RGB', (10, 10), color='red')
+            exif = img.getexif()
+            exif[0x0132] = '2023:05:15 14:30:00'  # DateTime
+            img.save(photo_path, format='TIFF', exif=exif)
+
+            metadata = app._extract_metadata(photo_path, fields_needed=GROUP_BY_FIELDS[GroupBy.YEAR_MONTH])
+            assert metadata.date_taken == datetime(2023, 5, 15, 14, 30, 0)
+
+    def test_read_exif_fast_malformed_exif(self, app):
+        """Test _read_exif_fast returns None when the EXIF segment is malformed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            photo_path = Path(tmpdir) / "photo.jpg"
+            photo_path.write_bytes(b'\xff\xd8\xff\xe1\x00\x10Exif\x00\x00MM\x00\x2a\xff\xff')
+            assert PhotoOffloader._read_exif_fast(photo_path) is None
+
+    def test_extract_metadata_skips_pillow_without_location(self, app):
+        """Test _extract_metadata does not open the image in Pillow when location is not needed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            photo_path = tmp_path / "photo.jpg"
+
+            img = Image.new('RGB', (100, 100), color='red')
+            exif = img.getexif()
+            from PIL.ExifTags import TAGS
+            tag_map = {v: k for k, v in TAGS.items()}
+            exif[tag_map['DateTimeOriginal']] = '2023:05:15 14:30:00'
+            img.save(photo_path, exif=exif)
+
+            with patch('offload.photo_offloader.Image.open') as mock_open:
+                metadata = app._extract_metadata(photo_path, fields_needed=GROUP_BY_FIELDS[GroupBy.YEAR_MONTH])
+
+            mock_open.assert_not_called()
+            assert metadata.date_taken == datetime(2023, 5, 15, 14, 30, 0)
+
     def test_extract_metadata_use_file_date_when_exif_missing(self, app):
         """Test _extract_metadata uses file creation date when EXIF date is missing and use_file_date=True."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -376,6 +557,14 @@ class TestPhotoOffloader:
         with pytest.raises(ValueError, match="Directory does not exist"):
             app.read_photos("/nonexistent/directory")
 
+    def test_read_photos_directory_symlink_loop(self, app):
+        """Test read_photos reports a source directory it cannot stat, such as a symlink loop, as missing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            loop = Path(tmpdir) / "loop"
+            loop.symlink_to(loop)
+            with pytest.raises(ValueError, match="Directory does not exist"):
+                app.read_photos(loop)
+
     def test_read_photos_path_not_directory(self, app):
         """Test read_photos with file path instead of directory."""
         with tempfile.NamedTemporaryFile(delete=False) as tmpfile:
@@ -424,6 +613,82 @@ class TestPhotoOffloader:
             assert '.gif' not in extensions
             assert '.bmp' not in extensions
 
+    def test_read_photos_skips_directories_with_photo_extension(self, app):
+        """Test that read_photos ignores directories whose names look like photos."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            self.create_test_image(tmp_path / "photo.JPG")
+            (tmp_path / "album.jpg").mkdir()
+
+            photos = app.read_photos(tmp_path)
+            assert [photo.path.name for photo in photos] == ["photo.JPG"]
+
+    def test_iter_photos_is_lazy(self, app):
+        """Test iter_photos only extracts metadata as the iterator is consumed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            self.create_test_image(tmp_path / "photo1.jpg")
+            self.create_test_image(tmp_path / "photo2.jpg")
+
+            with patch.object(app, '_extract_metadata') as mock_extract:
+                mock_extract.side_effect = lambda path, **kwargs: PhotoMetadata(path=path)
+                photos = app.iter_photos(tmp_path)
+                mock_extract.assert_not_called()
+
+                next(photos)
+                assert mock_extract.call_count == 1
+                assert len(list(photos)) == 1
+
+    def test_iter_photos_directory_not_exists(self, app):
+        """Test iter_photos checks the source directory before it is consumed."""
+        with pytest.raises(ValueError, match="Directory does not exist"):
+            app.iter_photos("/nonexistent/directory")
+
+    def test_read_photos_with_workers(self, app):
+        """Test read_photos extracts the same metadata across a process pool."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            for i in range(3):
+                self.create_test_image(tmp_path / f"photo{i}.jpg")
+
+            serial = app.read_photos(tmp_path)
+            parallel = app.read_photos(tmp_path, workers=2)
+
+            assert sorted(parallel, key=lambda p: p.path) == sorted(serial, key=lambda p: p.path)
+
+    def test_read_photos_with_workers_start_method(self, app):
+        """Test the worker processes are not forked and set up their logger like the parent's."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            for i in range(2):
+                self.create_test_image(tmp_path / f"photo{i}.jpg")
+
+            with patch('offload.photo_offloader.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as mock_executor:
+                app.read_photos(tmp_path, workers=2)
+
+            kwargs = mock_executor.call_args.kwargs
+            assert kwargs['mp_context'].get_start_method() in ('forkserver', 'spawn')
+            assert kwargs['initializer'] == PhotoOffloader._init_worker_logging
+            assert kwargs['initargs'][:2] == (app.logger.name, app.logger.getEffectiveLevel())
+
+    def test_init_worker_logging(self):
+        """Test a worker process logger gets the parent's level and a handler with its formatter."""
+        logger = logging.getLogger(f"test_offload_worker_{uuid4().hex}")
+        formatter = logging.Formatter("%(name)s: %(message)s")
+
+        try:
+            PhotoOffloader._init_worker_logging(logger.name, logging.DEBUG, formatter)
+            PhotoOffloader._init_worker_logging(logger.name, logging.DEBUG, formatter)
+
+            assert logger.level == logging.DEBUG
+            assert len(logger.handlers) == 1
+            assert logger.handlers[0].formatter is formatter
+        finally:
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+                handler.close()
+            logging.Logger.manager.loggerDict.pop(logger.name, None)
+
     def test_get_bucket_key_software(self, app):
         """Test _get_bucket_key with SOFTWARE group_by."""
         photo = PhotoMetadata(path=Path("test.jpg"), software="iOS")
@@ -512,91 +777,61 @@ class TestPhotoOffloader:
         assert len(buckets["2023-06"]) == 1
         assert len(buckets["Unknown"]) == 1
 
+    def test_bucket_photos_by_year_month_day(self, app):
+        """Test bucket_photos groups photos taken on the same day regardless of time, in first-seen order."""
+        photos = [
+            PhotoMetadata(path=Path("1.jpg"), date_taken=datetime(2023, 5, 15, 8, 0, 0)),
+            PhotoMetadata(path=Path("2.jpg"), date_taken=None),
+            PhotoMetadata(path=Path("3.jpg"), date_taken=datetime(2023, 5, 16)),
+            PhotoMetadata(path=Path("4.jpg"), date_taken=datetime(2023, 5, 15, 20, 0, 0)),
+        ]
+        buckets = app.bucket_photos(photos, GroupBy.YEAR_MONTH_DAY)
+        assert list(buckets) == ["2023-05-15", "Unknown", "2023-05-16"]
+        assert [p.path.name for p in buckets["2023-05-15"]] == ["1.jpg", "4.jpg"]
+
+    def test_bucket_photos_invalid_group_by(self, app):
+        """Test bucket_photos raises ValueError for an unsupported group_by."""
+        invalid_group_by = MagicMock()
+        invalid_group_by.value = "invalid"
+        with pytest.raises(ValueError, match="Unsupported group_by parameter"):
+            app.bucket_photos([PhotoMetadata(path=Path("test.jpg"))], invalid_group_by)
+
     def test_bucket_photos_empty_list(self, app):
         """Test bucket_photos with empty photo list."""
         buckets = app.bucket_photos([], GroupBy.YEAR)
         assert buckets == {}
 
-    def test_get_sort_key_software(self, app):
-        """Test _get_sort_key with SOFTWARE group_by."""
-        photo1 = PhotoMetadata(path=Path("1.jpg"), software="iOS")
-        photo2 = PhotoMetadata(path=Path("2.jpg"), software=None)
-
-        key1 = app._get_sort_key(photo1, GroupBy.SOFTWARE)
-        key2 = app._get_sort_key(photo2, GroupBy.SOFTWARE)
-
-        assert key1[0] == 0  # Known values sort first
-        assert key2[0] == 1  # Unknown values sort last
-        assert key1 < key2
-
-    def test_get_sort_key_year(self, app):
-        """Test _get_sort_key with YEAR group_by."""
-        photo1 = PhotoMetadata(path=Path("1.jpg"), date_taken=datetime(2023, 1, 1))
-        photo2 = PhotoMetadata(path=Path("2.jpg"), date_taken=None)
-
-        key1 = app._get_sort_key(photo1, GroupBy.YEAR)
-        key2 = app._get_sort_key(photo2, GroupBy.YEAR)
-
-        assert key1[0] == 0
-        assert key2[0] == 1
-        assert key1 < key2
-
-    def test_get_sort_key_camera_make(self, app):
-        """Test _get_sort_key with CAMERA_MAKE group_by."""
-        photo1 = PhotoMetadata(path=Path("1.jpg"), camera_make="Canon")
-        photo2 = PhotoMetadata(path=Path("2.jpg"), camera_make=None)
-
-        key1 = app._get_sort_key(photo1, GroupBy.CAMERA_MAKE)
-        key2 = app._get_sort_key(photo2, GroupBy.CAMERA_MAKE)
-
-        assert key1[0] == 0  # Known values sort first
-        assert key2[0] == 1  # Unknown values sort last
-        assert key1 < key2
-
-    def test_get_sort_key_camera_model(self, app):
-        """Test _get_sort_key with CAMERA_MODEL group_by."""
-        photo1 = PhotoMetadata(path=Path("1.jpg"), camera_model="EOS 5D")
-        photo2 = PhotoMetadata(path=Path("2.jpg"), camera_model=None)
-
-        key1 = app._get_sort_key(photo1, GroupBy.CAMERA_MODEL)
-        key2 = app._get_sort_key(photo2, GroupBy.CAMERA_MODEL)
-
-        assert key1[0] == 0  # Known values sort first
-        assert key2[0] == 1  # Unknown values sort last
-        assert key1 < key2
-
-    def test_get_sort_key_year_month(self, app):
-        """Test _get_sort_key with YEAR_MONTH group_by."""
-        photo1 = PhotoMetadata(path=Path("1.jpg"), date_taken=datetime(2023, 5, 15))
-        photo2 = PhotoMetadata(path=Path("2.jpg"), date_taken=None)
-
-        key1 = app._get_sort_key(photo1, GroupBy.YEAR_MONTH)
-        key2 = app._get_sort_key(photo2, GroupBy.YEAR_MONTH)
-
-        assert key1[0] == 0
-        assert key1[1] == 2023
-        assert key1[2] == 5
-        assert key2[0] == 1
-        assert key1 < key2
-
-    def test_get_sort_key_year_month_day(self, app):
-        """Test _get_sort_key with YEAR_MONTH_DAY group_by."""
-        photo1 = PhotoMetadata(path=Path("1.jpg"), date_taken=datetime(2023, 5, 15))
-        photo2 = PhotoMetadata(path=Path("2.jpg"), date_taken=None)
-
-        key1 = app._get_sort_key(photo1, GroupBy.YEAR_MONTH_DAY)
-        key2 = app._get_sort_key(photo2, GroupBy.YEAR_MONTH_DAY)
-
-        assert key1[0] == 0
-        assert key1[1] == datetime(2023, 5, 15)
-        assert key2[0] == 1
-        assert key1 < key2
+    @pytest.mark.parametrize("group_by", [GroupBy.YEAR, GroupBy.YEAR_MONTH, GroupBy.YEAR_MONTH_DAY])
+    def test_date_sort_value_unknown_last(self, group_by):
+        """Test the date sort value of a photo without a date is greater than that of any dated photo."""
+        sort_value = PhotoOffloader.DATE_SORT_VALUE_FUNCTIONS[group_by]
+        known = sort_value(PhotoMetadata(path=Path("1.jpg"), date_taken=datetime(9999, 12, 31, 23, 59, 59)))
+        unknown = sort_value(PhotoMetadata(path=Path("2.jpg"), date_taken=None))
+        assert known < unknown
+
+    def test_date_sort_value_year_month(self):
+        """Test the year-month sort value orders months across years and ignores the day."""
+        sort_value = PhotoOffloader.DATE_SORT_VALUE_FUNCTIONS[GroupBy.YEAR_MONTH]
+        values = [sort_value(PhotoMetadata(path=Path("test.jpg"), date_taken=date_taken))
+                  for date_taken in (datetime(2022, 12, 31), datetime(2023, 1, 1), datetime(2023, 1, 31))]
+        assert values[0] < values[1] == values[2]
+
+    def test_sort_photos_by_camera_model(self, app):
+        """Test sort_photos sorting by camera model with unknown values last."""
+        photos = [
+            PhotoMetadata(path=Path("1.jpg"), camera_model=None),
+            PhotoMetadata(path=Path("2.jpg"), camera_model="EOS 5D"),
+            PhotoMetadata(path=Path("3.jpg"), camera_model="A7 III"),
+        ]
+        sorted_photos = app.sort_photos(photos, GroupBy.CAMERA_MODEL)
+        assert [p.camera_model for p in sorted_photos] == ["A7 III", "EOS 5D", None]
 
-    def test_get_sort_key_invalid_group_by(self, app):
-        """Test _get_sort_key with invalid group_by raises error."""
-        photo = PhotoMetadata(path=Path("test.jpg"))
-        with pytest.raises(ValueError, match="Unsupported group_by"):
-            app._get_sort_key(photo, "invalid")
+    def test_sort_photos_invalid_group_by(self, app):
+        """Test sort_photos raises ValueError for an unsupported group_by."""
+        invalid_group_by = MagicMock()
+        invalid_group_by.value = "invalid"
+        with pytest.raises(ValueError, match="Unsupported group_by parameter"):
+            app.sort_photos([PhotoMetadata(path=Path("test.jpg"))], invalid_group_by)
 
     def test_sort_photos_by_year(self, app):
         """Test sort_photos sorting by year."""
@@ -622,6 +857,38 @@ class TestPhotoOffloader:
         assert sorted_photos[-1].date_taken is None
         assert sorted_photos[-2].date_taken is None
 
+    def test_sort_photos_by_year_month_day_uses_time(self, app):
+        """Test sort_photos by year-month-day orders photos on the same day by time."""
+        photos = [
+            PhotoMetadata(path=Path("1.jpg"), date_taken=None),
+            PhotoMetadata(path=Path("2.jpg"), date_taken=datetime(2023, 5, 15, 18, 0, 0)),
+            PhotoMetadata(path=Path("3.jpg"), date_taken=datetime(2023, 5, 15, 9, 30, 0)),
+            PhotoMetadata(path=Path("4.jpg"), date_taken=datetime(2022, 12, 31, 23, 59, 59)),
+        ]
+        sorted_photos = app.sort_photos(photos, GroupBy.YEAR_MONTH_DAY)
+        assert [p.path.name for p in sorted_photos] == ["4.jpg", "3.jpg", "2.jpg", "1.jpg"]
+
+    def test_sort_photos_by_software(self, app):
+        """Test sort_photos sorting by software with unknown values last."""
+        photos = [
+            PhotoMetadata(path=Path("1.jpg"), software=None),
+            PhotoMetadata(path=Path("2.jpg"), software="iOS"),
+            PhotoMetadata(path=Path("3.jpg"), software="Android"),
+        ]
+        sorted_photos = app.sort_photos(photos, GroupBy.SOFTWARE)
+        assert [p.software for p in sorted_photos] == ["Android", "iOS", None]
+
+    def test_sort_photos_by_camera_make_keeps_unknown_order(self, app):
+        """Test sort_photos keeps photos with unknown values in their original order after the rest."""
+        photos = [
+            PhotoMetadata(path=Path("1.jpg"), camera_make=None),
+            PhotoMetadata(path=Path("2.jpg"), camera_make="Sony"),
+            PhotoMetadata(path=Path("3.jpg"), camera_make=None),
+            PhotoMetadata(path=Path("4.jpg"), camera_make="Canon"),
+        ]
+        sorted_photos = app.sort_photos(photos, GroupBy.CAMERA_MAKE)
+        assert [p.path.name for p in sorted_photos] == ["4.jpg", "2.jpg", "1.jpg", "3.jpg"]
+
     def test_copy_photos(self, app):
         """Test copy_photos copies files to destination."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -659,6 +926,59 @@ class TestPhotoOffloader:
             assert dest_dir.exists()
             assert (dest_dir / "photo.jpg").exists()
 
+    def test_copy_photos_nonexistent_source_among_many(self, app):
+        """Test copy_photos raises error when one of several concurrently copied photos doesn't exist."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            photos = [PhotoMetadata(path=self.create_test_image(tmp_path / f"photo{i}.jpg")) for i in range(3)]
+            photos.append(PhotoMetadata(path=tmp_path / "nonexistent.jpg"))
+            dest_dir = tmp_path / "dest"
+
+            with pytest.raises(RuntimeError, match="Failed to copy"):
+                app.copy_photos(photos, dest_dir)
+
+    def test_copy_photos_recreates_removed_destination(self, app):
+        """Test copy_photos creates its destination again after it was removed following an offload."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            source_dir = tmp_path / "source"
+            source_dir.mkdir()
+            photo = self.create_test_image(source_dir / "photo.jpg")
+            dest_dir = tmp_path / "dest"
+
+            with patch.object(app, 'iter_photos', return_value=[PhotoMetadata(path=photo)]):
+                app.offload_photos(source_dir, dest_dir)
+            shutil.rmtree(dest_dir)
+
+            app.copy_photos([PhotoMetadata(path=photo)], dest_dir / "unknown")
+            assert (dest_dir / "unknown" / "photo.jpg").exists()
+
+    def test_copy_photos_hardlink(self, app):
+        """Test copy_photos hard links files to the destination when hardlink=True."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            source_photo = self.create_test_image(tmp_path / "photo.jpg")
+            dest_dir = tmp_path / "dest"
+
+            app.copy_photos([PhotoMetadata(path=source_photo)], dest_dir, hardlink=True)
+
+            assert (dest_dir / "photo.jpg").samefile(source_photo)
+
+    def test_copy_photos_hardlink_falls_back_to_copy(self, app):
+        """Test copy_photos copies files when a hard link cannot be created."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            source_photo = self.create_test_image(tmp_path / "photo.jpg")
+            dest_dir = tmp_path / "dest"
+
+            with patch('offload.photo_offloader.os.link', side_effect=OSError("Cross-device link")):
+                app.copy_photos([PhotoMetadata(path=source_photo)], dest_dir, hardlink=True)
+
+            dest_photo = dest_dir / "photo.jpg"
+            assert dest_photo.exists()
+            assert not dest_photo.samefile(source_photo)
+            assert dest_photo.stat().st_size == source_photo.stat().st_size
+
     def test_copy_photos_nonexistent_source(self, app):
         """Test copy_photos raises error when source file doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -699,6 +1019,9 @@ class TestPhotoOffloader:
                 names = zipf.namelist()
                 assert "photo1.jpg" in names
                 assert "photo2.png" in names
+                # Photos are already compressed, so they are stored as-is
+                assert all(info.compress_type == zipfile.ZIP_STORED for info in zipf.infolist())
+                assert zipf.read("photo1.jpg") == photo1_path.read_bytes()
 
     def test_archive_photos_zip_creation_error(self, app):
         """Test archive_photos handles zip creation errors."""
@@ -830,6 +1153,31 @@ class TestPhotoOffloader:
                 assert (dest_dir / "year=2023" / "month=05" / "photo1.jpg").exists()
                 assert (dest_dir / "year=2023" / "month=06" / "photo2.jpg").exists()
 
+    def test_offload_photos_creates_directories_before_copying(self, app):
+        """Test offload_photos creates every bucket directory before copying any photo."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            dest_dir = Path(tmpdir) / "dest"
+            source_dir.mkdir()
+
+            photo = self.create_test_image(source_dir / "photo.jpg")
+            month_dirs = [dest_dir / "year=2023" / "month=05", dest_dir / "year=2024" / "month=01"]
+
+            def check_directories(photos, destination, to_archive):
+                assert all(month_dir.is_dir() for month_dir in month_dirs)
+                assert (dest_dir / "unknown").is_dir()
+
+            with patch.object(app, 'iter_photos') as mock_iter:
+                mock_iter.return_value = [
+                    PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15)),
+                    PhotoMetadata(path=photo, date_taken=datetime(2024, 1, 1)),
+                    PhotoMetadata(path=photo, date_taken=None),
+                ]
+                with patch.object(app, '_save_photos', side_effect=check_directories) as mock_save:
+                    app.offload_photos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
+
+            assert mock_save.call_count == 3
+
     def test_offload_photos_invalid_year_month_format(self, app):
         """Test offload_photos handles invalid year-month format."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -840,8 +1188,8 @@ class TestPhotoOffloader:
             photo = self.create_test_image(source_dir / "photo.jpg")
 
             # Mock bucket_photos to return an invalid year-month format
-            with patch.object(app, 'read_photos') as mock_read:
-                mock_read.return_value = [PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15))]
+            with patch.object(app, 'iter_photos') as mock_iter:
+                mock_iter.return_value = [PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15))]
 
                 with patch.object(app, 'bucket_photos') as mock_bucket:
                     # Return a bucket with invalid format
@@ -854,6 +1202,27 @@ class TestPhotoOffloader:
                     assert (dest_dir / "unknown").exists()
                     assert (dest_dir / "unknown" / "photo.jpg").exists()
 
+    def test_offload_photos_non_numeric_year_month(self, app):
+        """Test offload_photos routes year-month keys with non-numeric parts to the unknown directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            dest_dir = Path(tmpdir) / "dest"
+            source_dir.mkdir()
+
+            photo = self.create_test_image(source_dir / "photo.jpg")
+
+            with patch.object(app, 'iter_photos') as mock_iter:
+                mock_iter.return_value = [PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15))]
+
+                with patch.object(app, 'bucket_photos') as mock_bucket:
+                    mock_bucket.return_value = {
+                        "2023-May": [PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15))]}
+
+                    app.offload_photos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
+
+                    assert (dest_dir / "unknown" / "photo.jpg").exists()
+                    assert not (dest_dir / "year=2023").exists()
+
     def test_offload_photos_unknown_date_archive_mode(self, app):
         """Test offload_photos archives photos without dates to unknown directory when keep_unknown=True."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -882,8 +1251,8 @@ class TestPhotoOffloader:
             photo = self.create_test_image(source_dir / "photo.jpg")
 
             # Mock bucket_photos to return an invalid year-month format
-            with patch.object(app, 'read_photos') as mock_read:
-                mock_read.return_value = [PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15))]
+            with patch.object(app, 'iter_photos') as mock_iter:
+                mock_iter.return_value = [PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15))]
 
                 with patch.object(app, 'bucket_photos') as mock_bucket:
                     # Return a bucket with invalid format
@@ -925,8 +1294,8 @@ class TestPhotoOffloader:
             photo = self.create_test_image(source_dir / "photo.jpg")
 
             # Mock bucket_photos to return an invalid year-month format
-            with patch.object(app, 'read_photos') as mock_read:
-                mock_read.return_value = [PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15))]
+            with patch.object(app, 'iter_photos') as mock_iter:
+                mock_iter.return_value = [PhotoMetadata(path=photo, date_taken=datetime(2023, 5, 15))]
 
                 with patch.object(app, 'bucket_photos') as mock_bucket:
                     # Return a bucket with invalid format
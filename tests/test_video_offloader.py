@@ -1,17 +1,104 @@
 # -*- coding: utf-8 -*-
 import logging
+import os
+import shutil
 import tempfile
 import zipfile
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
+from uuid import uuid4
 
+import exiftool
 import pytest
 
-from offload.constants import GroupBy
+from offload.constants import ALL_METADATA_FIELDS, CAMERA_MAKE_FIELD, DATE_FIELD, GroupBy, LOCATION_FIELD
 from offload.video_offloader import VideoOffloader, VideoMetadata
 
 
+# Content of the fake video files created by the tests; starts with an MP4 "ftyp" box header so that
+# the files are passed to exiftool
+FAKE_VIDEO_CONTENT = b"\x00\x00\x00\x18ftypfake video file content"
+
+
+def link_fake_video(fake_video: Path, path: Path) -> Path:
+    """
+    Create a fake video file by hard linking the shared one, writing its content where links are not supported.
+    Tests that change a file's content must replace the file rather than write into it.
+
+    Returns:
+        Path of the created file
+    """
+    try:
+        os.link(fake_video, path)
+    except OSError:
+        path.write_bytes(FAKE_VIDEO_CONTENT)
+    return path
+
+
+def list_partitions(dest_dir: Path) -> dict[str, set[str]]:
+    """
+    List the directories of an offload destination with a single scandir per level, instead of a stat per path.
+
+    Returns:
+        Dictionary mapping each top-level directory name to the names of the entries in it
+    """
+    with os.scandir(dest_dir) as entries:
+        return {entry.name: {child.name for child in os.scandir(entry.path)} for entry in entries if entry.is_dir()}
+
+
+def exiftool_answer(*metadata: dict):
+    """
+    Return a side effect for a mocked exiftool read that answers like exiftool, with one dictionary per file
+    holding its SourceFile. The files get the given metadata in order, across calls, and the last metadata
+    once the others are used up.
+
+    Returns:
+        Function taking the file names and keyword arguments of get_metadata or get_tags
+    """
+    remaining = list(metadata)
+
+    def read(file_names, **kwargs):
+        return [{'SourceFile': file_name, **(remaining.pop(0) if len(remaining) > 1 else remaining[0])}
+                for file_name in file_names]
+    return read
+
+
+@pytest.fixture(scope="session")
+def fake_video(tmp_path_factory):
+    """Write the fake video file that the test files are linked to, once per session."""
+    path = tmp_path_factory.mktemp("fake_video") / "video.mp4"
+    path.write_bytes(FAKE_VIDEO_CONTENT)
+    return path
+
+
+@pytest.fixture(scope="session")
+def video_dir(tmp_path_factory):
+    """Create a directory shared by the tests for fake video files."""
+    return tmp_path_factory.mktemp("videos")
+
+
+@pytest.fixture
+def make_video(video_dir, fake_video):
+    """
+    Return a function creating a fake video file with a unique name in the shared video directory.
+
+    Returns:
+        Function taking an optional file name and returning the path of the created file
+    """
+    def _make_video(name: str = "video.mp4") -> Path:
+        return link_fake_video(fake_video, video_dir / f"{uuid4().hex}_{name}")
+    return _make_video
+
+
+@pytest.fixture(scope="module")
+def mock_exiftool_class():
+    """Patch ExifToolHelper once for all the tests of the module that use mock_exiftool."""
+    with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
+        yield mock_exiftool_class
+
+
 class TestVideoOffloader:
     """Test suite for the VideoOffloader class."""
 
@@ -24,20 +111,63 @@ class TestVideoOffloader:
 
     @pytest.fixture
     def app(self, logger):
-        """Create a VideoOffloader instance for testing."""
-        return VideoOffloader(logger)
+        """Create a VideoOffloader instance for testing, closing its exiftool helper afterwards."""
+        with VideoOffloader(logger) as app:
+            yield app
+
+    @pytest.fixture
+    def mock_exiftool(self, mock_exiftool_class):
+        """
+        Yield a fresh mocked helper for the VideoOffloader to use, so no test sees another test's configuration.
+
+        Tests set the return value or side effect of its get_metadata rather than replacing it with a new mock.
+        """
+        mock_exiftool_class.reset_mock()
+        mock_exiftool = MagicMock(spec=exiftool.helper.ExifToolHelper)
+        mock_exiftool_class.return_value = mock_exiftool
+        yield mock_exiftool
+
+    @pytest.fixture
+    def exiftool_helper(self):
+        """
+        Create a stand-in for an already running exiftool helper, to be passed to VideoOffloader.
+
+        Tests set what its get_tags or get_metadata return with monkeypatch.
+        """
+        return MagicMock(spec=exiftool.helper.ExifToolHelper)
+
+    @pytest.fixture(autouse=True)
+    def _use_fake_video(self, fake_video):
+        """Make the shared fake video available to create_test_video_file."""
+        self.fake_video = fake_video
 
     def create_test_video_file(self, path: Path) -> Path:
         """Create a test video file (dummy file with correct extension)."""
         # Create a minimal file that looks like a video (just for testing file operations)
-        path.write_bytes(b"fake video file content")
-        return path
+        return link_fake_video(self.fake_video, path)
 
     def test_init(self, logger):
         """Test VideoOffloader initialization."""
         app = VideoOffloader(logger)
         assert app.logger == logger
 
+    def test_video_metadata_uses_slots(self):
+        """Test VideoMetadata instances store their fields in slots instead of a __dict__."""
+        video = VideoMetadata(path=Path("test.mp4"))
+        assert not hasattr(video, '__dict__')
+        # Frozen slots dataclasses raise TypeError instead of FrozenInstanceError for unknown fields on some
+        # Python versions; either way the attribute is not set
+        with pytest.raises((AttributeError, TypeError)):
+            video.unknown_field = "value"
+
+    def test_video_metadata_is_frozen(self):
+        """Test VideoMetadata instances cannot be modified and can be used in sets."""
+        video = VideoMetadata(path=Path("test.mp4"), date_taken=datetime(2023, 5, 15), location=(37.7, -122.4))
+        with pytest.raises(FrozenInstanceError):
+            video.software = "iOS"
+        assert {video, VideoMetadata(path=Path("test.mp4"), date_taken=datetime(2023, 5, 15),
+                                     location=(37.7, -122.4))} == {video}
+
     def test_dms_to_decimal_north_east(self, app):
         """Test DMS to decimal conversion for North/East coordinates."""
         # Test coordinates: 37° 46' 26.2992" N, 122° 25' 52.0176" W
@@ -63,6 +193,32 @@ class TestVideoOffloader:
         assert lat < 0
         assert lon < 0
 
+    def test_dms_to_decimal_is_cached(self, app):
+        """Test repeated DMS to decimal conversions are served from the cache."""
+        VideoOffloader._dms_to_decimal.cache_clear()
+        lat_dms = (37, 46, 26.2992)
+
+        first = VideoOffloader._dms_to_decimal(lat_dms, 'N')
+        second = VideoOffloader._dms_to_decimal(lat_dms, 'N')
+
+        assert first == second
+        cache_info = VideoOffloader._dms_to_decimal.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
+    def test_parse_date_cached(self, app):
+        """Test repeated date strings are parsed once and then served from the cache."""
+        VideoOffloader._parse_date_str.cache_clear()
+        metadata = {'QuickTime:CreateDate': '2023:05:15 14:30:00'}
+
+        first = app._parse_date(metadata)
+        second = app._parse_date(metadata)
+
+        assert first == second == datetime(2023, 5, 15, 14, 30, 0)
+        cache_info = VideoOffloader._parse_date_str.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
     def test_parse_date_quicktime_creation_date(self, app):
         """Test parsing date from QuickTime:CreationDate field."""
         metadata = {'QuickTime:CreationDate': '2023:05:15 14:30:00'}
@@ -103,6 +259,18 @@ class TestVideoOffloader:
         date = app._parse_date(metadata)
         assert date is None
 
+    def test_parse_date_skips_malformed_field(self, app):
+        """Test that a malformed date does not stop the next field from being used."""
+        metadata = {
+            'QuickTime:CreationDate': '0000',
+            'CreateDate': '2023:05:15 14:30:00',
+        }
+        with patch('offload.video_offloader.datetime') as mock_datetime:
+            mock_datetime.side_effect = datetime
+            app._parse_date(metadata)
+            mock_datetime.strptime.assert_not_called()
+        assert app._parse_date(metadata) == datetime(2023, 5, 15, 14, 30)
+
     def test_parse_date_no_date_fields(self, app):
         """Test parsing date when no date fields exist."""
         metadata = {'Make': 'GoPro'}
@@ -127,6 +295,24 @@ class TestVideoOffloader:
         assert date.month == 5
         assert date.day == 15
 
+    def test_parse_date_with_fraction_of_second(self, app):
+        """Test parsing an ISO date with a fraction of a second and a timezone offset."""
+        metadata = {'CreateDate': '2023-05-15T14:30:00.25+05:30'}
+        date = app._parse_date(metadata)
+        assert date == datetime(2023, 5, 15, 14, 30, 0, 250000)
+
+    def test_parse_date_keeps_time(self, app):
+        """Test that the time of day is kept when parsing an EXIF date-time."""
+        metadata = {'QuickTime:CreationDate': '2024:08:04 11:45:26-07:00'}
+        date = app._parse_date(metadata)
+        assert date == datetime(2024, 8, 4, 11, 45, 26)
+
+    def test_parse_date_invalid_time_falls_back_to_date(self, app):
+        """Test that an out-of-range time still yields the date part."""
+        metadata = {'QuickTime:CreationDate': '2024:08:04 25:45:26'}
+        date = app._parse_date(metadata)
+        assert date == datetime(2024, 8, 4)
+
     def test_parse_date_fallback_with_colon_separator(self, app):
         """Test fallback date parsing with colon separator that needs conversion."""
         # Date format that doesn't match standard formats but has colon separator
@@ -179,6 +365,12 @@ class TestVideoOffloader:
         assert date.month == 5
         assert date.day == 15
 
+    def test_parse_date_fallback_rejects_iso_week_date(self, app):
+        """Test that ISO week dates are not taken as calendar dates by the fallback."""
+        metadata = {'CreateDate': '2023-W20-1'}
+        date = app._parse_date(metadata)
+        assert date is None
+
     def test_parse_date_fallback_colon_value_error(self, app):
         """Test fallback date parsing with colon separator that raises ValueError."""
         # Date with colon separator that fails to parse after conversion
@@ -282,6 +474,15 @@ class TestVideoOffloader:
         assert abs(location[0] - 37.7749) < 0.001
         assert abs(location[1] - (-122.4194)) < 0.001
 
+    def test_parse_location_gps_numeric_small_values(self, app):
+        """Test that numeric coordinates are used as they are, even when they print in exponent notation."""
+        metadata = {
+            'GPSLatitude': 1e-05,
+            'GPSLongitude': -122.4194
+        }
+        location = app._parse_location(metadata)
+        assert location == (1e-05, -122.4194)
+
     def test_parse_location_no_gps(self, app):
         """Test parsing location when GPS data is not present."""
         metadata = {'Make': 'GoPro'}
@@ -308,6 +509,35 @@ class TestVideoOffloader:
         location = app._parse_location(metadata)
         assert location is None
 
+    @pytest.mark.parametrize("coordinates,expected", [
+        ('.5 -.25', (0.5, -0.25)),
+        ('37. -122.', (37.0, -122.0)),
+        ('3.77749e1 -1.224194E+2 1e2', (37.7749, -122.4194)),
+    ])
+    def test_parse_location_gps_coordinates_number_forms(self, app, coordinates, expected):
+        """Test GPS coordinates written without leading or trailing digits, or with an exponent."""
+        assert app._parse_location({'QuickTime:GPSCoordinates': coordinates}) == pytest.approx(expected)
+
+    def test_parse_location_gps_latitude_longitude_decimal_number_forms(self, app):
+        """Test decimal GPSLatitude/GPSLongitude values without a leading digit or with an exponent."""
+        metadata = {'GPSLatitude': '.5', 'GPSLongitude': '-1.224194e2'}
+        assert app._parse_location(metadata) == pytest.approx((0.5, -122.4194))
+
+    def test_parse_location_gps_coordinates_trailing_garbage(self, app):
+        """Test that GPS coordinates with a malformed longitude are rejected."""
+        metadata = {'QuickTime:GPSCoordinates': '37.7749 -122.4194abc'}
+        location = app._parse_location(metadata)
+        assert location is None
+
+    def test_parse_location_gps_coordinates_falls_through_to_next_tag(self, app):
+        """Test that an invalid QuickTime value does not hide a valid Keys value."""
+        metadata = {
+            'QuickTime:GPSCoordinates': 'invalid',
+            'Keys:GPSCoordinates': '+37.7749 -122.4194',
+        }
+        location = app._parse_location(metadata)
+        assert location == (37.7749, -122.4194)
+
     def test_parse_location_gps_latitude_longitude_decimal_fallback(self, app):
         """Test parsing GPS location from GPSLatitude/GPSLongitude as decimal when DMS doesn't match."""
         metadata = {
@@ -467,284 +697,503 @@ class TestVideoOffloader:
         assert model is None
         assert software is None
 
-    def test_extract_metadata_with_exiftool(self, app):
+    def test_extract_metadata_with_exiftool(self, app, make_video, mock_exiftool):
         """Test _extract_metadata extracts metadata using exiftool."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            # Mock exiftool to return metadata
-            mock_metadata = {
-                'QuickTime:CreationDate': '2023:05:15 14:30:00',
-                'Make': 'GoPro',
-                'Model': 'HERO9',
-                'Software': 'GoPro Firmware',
-                'QuickTime:GPSCoordinates': '37.7749 -122.4194 100.0'
-            }
-
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                mock_exiftool.get_metadata = MagicMock(return_value=[mock_metadata])
-                mock_exiftool_class.return_value = mock_exiftool
-
-                metadata = app._extract_metadata(video_path)
-                assert metadata.path == video_path
-                assert metadata.date_taken is not None
-                assert metadata.camera_make == 'GoPro'
-                assert metadata.camera_model == 'HERO9'
-                assert metadata.location is not None
-
-    def test_extract_metadata_use_file_date_when_metadata_missing(self, app):
+        video_path = make_video()
+
+        # Mock exiftool to return metadata
+        mock_metadata = {
+            'QuickTime:CreationDate': '2023:05:15 14:30:00',
+            'Make': 'GoPro',
+            'Model': 'HERO9',
+            'Software': 'GoPro Firmware',
+            'QuickTime:GPSCoordinates': '37.7749 -122.4194 100.0'
+        }
+
+        mock_exiftool.get_metadata.side_effect = exiftool_answer(mock_metadata)
+
+        metadata = app._extract_metadata(video_path)
+        assert metadata.path == video_path
+        assert metadata.date_taken is not None
+        assert metadata.camera_make == 'GoPro'
+        assert metadata.camera_model == 'HERO9'
+        assert metadata.location is not None
+
+    def test_extract_metadata_use_file_date_when_metadata_missing(self, app, make_video, mock_exiftool):
         """Test _extract_metadata uses file creation date when metadata date is missing and use_file_date=True."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            # Mock exiftool to return no date
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                mock_exiftool.get_metadata = MagicMock(return_value=[{}])
-                mock_exiftool_class.return_value = mock_exiftool
-
-                # Extract metadata with use_file_date - should have file date
-                metadata_with_file_date = app._extract_metadata(video_path, use_file_date=True)
-                assert metadata_with_file_date.date_taken is not None
-                assert isinstance(metadata_with_file_date.date_taken, datetime)
-                assert metadata_with_file_date.date_taken.date() == datetime.now().date()  # Should be today
-
-    def test_extract_metadata_use_file_date_does_not_override_metadata(self, app):
+        video_path = make_video()
+
+        # Mock exiftool to return no date
+        mock_exiftool.get_metadata.return_value = [{}]
+
+        # Extract metadata with use_file_date - should have file date
+        metadata_with_file_date = app._extract_metadata(video_path, use_file_date=True)
+        assert metadata_with_file_date.date_taken is not None
+        assert isinstance(metadata_with_file_date.date_taken, datetime)
+        assert metadata_with_file_date.date_taken.date() == datetime.now().date()  # Should be today
+
+    def test_extract_metadata_use_file_date_does_not_override_metadata(self, app, make_video, mock_exiftool):
         """Test _extract_metadata does not override metadata date when use_file_date=True."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            mock_metadata = {
-                'QuickTime:CreationDate': '2023:05:15 14:30:00',
-                'Make': 'GoPro'
-            }
-
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                mock_exiftool.get_metadata = MagicMock(return_value=[mock_metadata])
-                mock_exiftool_class.return_value = mock_exiftool
-
-                # Extract metadata with use_file_date=True
-                metadata = app._extract_metadata(video_path, use_file_date=True)
-                # Should use metadata date, not file date
-                assert metadata.date_taken is not None
-                assert metadata.date_taken.year == 2023
-                assert metadata.date_taken.month == 5
-                assert metadata.date_taken.day == 15
+        video_path = make_video()
 
-    def test_get_file_creation_date_fallback_to_mtime(self, app):
-        """Test _get_file_creation_date falls back to st_mtime when st_birthtime is not available."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            # Mock stat to not have st_birthtime (simulate Linux/Windows systems)
-            original_stat = video_path.stat()
-            # Create a mock stat object without st_birthtime attribute
-
-            class MockStat:
-                def __init__(self, original_stat):
-                    self.st_mtime = original_stat.st_mtime
-                    # Copy other common stat attributes
-                    for attr in [
-                        'st_mode', 'st_ino', 'st_dev', 'st_nlink',
-                        'st_uid', 'st_gid', 'st_size', 'st_atime', 'st_ctime'
-                    ]:
-                        if hasattr(original_stat, attr):
-                            setattr(self, attr, getattr(original_stat, attr))
-
-                # Explicitly don't have st_birthtime
-                def __hasattr__(self, name):
-                    if name == 'st_birthtime':
-                        return False
-                    return hasattr(self, name)
-
-            mock_stat = MockStat(original_stat)
-
-            with patch.object(Path, 'stat', return_value=mock_stat):
-                date = VideoOffloader._get_file_creation_date(video_path)
-                assert date is not None
-                assert isinstance(date, datetime)
-                # Should use st_mtime
-                assert date == datetime.fromtimestamp(original_stat.st_mtime)
+        mock_metadata = {
+            'QuickTime:CreationDate': '2023:05:15 14:30:00',
+            'Make': 'GoPro'
+        }
+
+        mock_exiftool.get_metadata.side_effect = exiftool_answer(mock_metadata)
+
+        # Extract metadata with use_file_date=True
+        metadata = app._extract_metadata(video_path, use_file_date=True)
+        # Should use metadata date, not file date
+        assert metadata.date_taken is not None
+        assert metadata.date_taken.year == 2023
+        assert metadata.date_taken.month == 5
+        assert metadata.date_taken.day == 15
 
-    def test_get_file_creation_date_handles_oserror(self, app):
+    def test_get_file_creation_date_fallback_to_mtime(self, app, make_video):
+        """Test _get_file_creation_date falls back to st_mtime when st_birthtime is not available."""
+        video_path = make_video()
+
+        # Mock stat to not have st_birthtime (simulate Linux/Windows systems)
+        original_stat = video_path.stat()
+        # Create a mock stat object without st_birthtime attribute
+
+        class MockStat:
+            def __init__(self, original_stat):
+                self.st_mtime = original_stat.st_mtime
+                # Copy other common stat attributes
+                for attr in [
+                    'st_mode', 'st_ino', 'st_dev', 'st_nlink',
+                    'st_uid', 'st_gid', 'st_size', 'st_atime', 'st_ctime'
+                ]:
+                    if hasattr(original_stat, attr):
+                        setattr(self, attr, getattr(original_stat, attr))
+
+            # Explicitly don't have st_birthtime
+            def __hasattr__(self, name):
+                if name == 'st_birthtime':
+                    return False
+                return hasattr(self, name)
+
+        mock_stat = MockStat(original_stat)
+
+        with patch('offload.video_offloader.os.stat', return_value=mock_stat):
+            date = VideoOffloader._get_file_creation_date(video_path)
+            assert date is not None
+            assert isinstance(date, datetime)
+            # Should use st_mtime
+            assert date == datetime.fromtimestamp(original_stat.st_mtime)
+
+    def test_get_file_creation_date_handles_oserror(self, app, make_video):
         """Test _get_file_creation_date handles OSError gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
+        video_path = make_video()
+
+        # Mock stat to raise OSError
+        with patch('offload.video_offloader.os.stat', side_effect=OSError("File not found")):
+            date = VideoOffloader._get_file_creation_date(video_path)
+            assert date is None
+
+    def test_get_file_creation_date_handles_valueerror(self, app, make_video):
+        """Test _get_file_creation_date handles ValueError gracefully."""
+        video_path = make_video()
 
-            # Mock stat to raise OSError
-            with patch.object(Path, 'stat', side_effect=OSError("File not found")):
+        # Mock stat to return invalid timestamp
+        mock_stat = type('MockStat', (), {
+            'st_birthtime': -1,  # Invalid timestamp that will cause ValueError
+        })()
+
+        with patch('offload.video_offloader.os.stat', return_value=mock_stat):
+            # Mock fromtimestamp to raise ValueError
+            with patch('offload.video_offloader.datetime') as mock_datetime:
+                mock_datetime.fromtimestamp.side_effect = ValueError("Invalid timestamp")
                 date = VideoOffloader._get_file_creation_date(video_path)
                 assert date is None
 
-    def test_get_file_creation_date_handles_valueerror(self, app):
-        """Test _get_file_creation_date handles ValueError gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            # Mock stat to return invalid timestamp
-            mock_stat = type('MockStat', (), {
-                'st_birthtime': -1,  # Invalid timestamp that will cause ValueError
-            })()
-
-            with patch.object(Path, 'stat', return_value=mock_stat):
-                # Mock fromtimestamp to raise ValueError
-                with patch('offload.video_offloader.datetime') as mock_datetime:
-                    mock_datetime.fromtimestamp.side_effect = ValueError("Invalid timestamp")
-                    date = VideoOffloader._get_file_creation_date(video_path)
-                    assert date is None
-
-    def test_extract_metadata_exiftool_error(self, app):
+    def test_get_file_creation_date_uses_given_stat(self, app):
+        """Test _get_file_creation_date uses a pre-fetched stat instead of reading it again."""
+        stat = type('MockStat', (), {'st_mtime': datetime(2023, 5, 15).timestamp()})()
+
+        with patch('offload.video_offloader.os.stat') as mock_stat:
+            date = VideoOffloader._get_file_creation_date(Path("video.mp4"), stat)
+
+        mock_stat.assert_not_called()
+        assert date == datetime(2023, 5, 15)
+
+    def test_extract_metadata_stats_file_once(self, logger, mock_exiftool, tmp_path):
+        """Test that a file is stat'ed once for both the cache key and the file date fallback."""
+        video_path = self.create_test_video_file(tmp_path / "video.mp4")
+        mock_exiftool.get_metadata.side_effect = exiftool_answer({'Make': 'GoPro'})
+
+        with VideoOffloader(logger, cache_path=tmp_path / "cache.sqlite") as app:
+            with patch('offload.video_offloader.os.stat', side_effect=os.stat) as mock_stat:
+                metadata = app._extract_metadata(video_path, use_file_date=True)
+
+        assert metadata.date_taken is not None
+        # Opening the cache may stat its directory, so only the calls for the video are counted
+        video_stat_calls = [stat_call for stat_call in mock_stat.call_args_list if stat_call.args[0] == video_path]
+        assert video_stat_calls == [call(video_path)]
+
+    def test_extract_metadata_cache_unreadable_stat(self, logger, mock_exiftool, tmp_path):
+        """Test that files whose stat cannot be read are passed to exiftool and not cached."""
+        video_path = tmp_path / "missing.mp4"
+        mock_exiftool.get_metadata.side_effect = exiftool_answer({'Make': 'GoPro'})
+
+        with VideoOffloader(logger, cache_path=tmp_path / "cache.sqlite") as app:
+            assert app._extract_metadata(video_path).camera_make == 'GoPro'
+            assert app._extract_metadata(video_path).camera_make == 'GoPro'
+        assert mock_exiftool.get_metadata.call_count == 2
+
+    def test_extract_metadata_exiftool_error(self, app, make_video, mock_exiftool):
         """Test _extract_metadata handles exiftool errors gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                mock_exiftool.get_metadata = MagicMock(side_effect=Exception("ExifTool error"))
-                mock_exiftool_class.return_value = mock_exiftool
-
-                # Should not raise exception, but return metadata with None values
-                metadata = app._extract_metadata(video_path)
-                assert metadata.path == video_path
-                assert metadata.date_taken is None
-                assert metadata.location is None
-
-    def test_extract_metadata_empty_metadata_list(self, app):
+        video_path = make_video()
+
+        mock_exiftool.get_metadata.side_effect = Exception("ExifTool error")
+
+        # Should not raise exception, but return metadata with None values
+        metadata = app._extract_metadata(video_path)
+        assert metadata.path == video_path
+        assert metadata.date_taken is None
+        assert metadata.location is None
+
+    def test_extract_metadata_empty_metadata_list(self, app, make_video, mock_exiftool):
         """Test _extract_metadata handles empty metadata list from exiftool."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                # Return empty list (no metadata found)
-                mock_exiftool.get_metadata = MagicMock(return_value=[])
-                mock_exiftool_class.return_value = mock_exiftool
-
-                metadata = app._extract_metadata(video_path)
-                assert metadata.path == video_path
-                assert metadata.date_taken is None
-                assert metadata.location is None
-
-    def test_extract_metadata_fallback_extraction(self, app):
+        video_path = make_video()
+
+        # Return empty list (no metadata found)
+        mock_exiftool.get_metadata.return_value = []
+
+        metadata = app._extract_metadata(video_path)
+        assert metadata.path == video_path
+        assert metadata.date_taken is None
+        assert metadata.location is None
+
+    def test_extract_metadata_fallback_extraction(self, app, make_video, mock_exiftool):
         """Test _extract_metadata falls back to regular extraction when -ee flag fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            mock_metadata = {
-                'CreateDate': '2023:05:15 14:30:00',
-                'Make': 'GoPro'
-            }
-
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                # First call (with -ee) raises exception, second call (fallback) succeeds
-                mock_exiftool.get_metadata = MagicMock(side_effect=[
-                    Exception("Embedded extraction failed"),
-                    [mock_metadata]
-                ])
-                mock_exiftool_class.return_value = mock_exiftool
-
-                metadata = app._extract_metadata(video_path)
-                assert metadata.path == video_path
-                assert metadata.date_taken is not None
-                assert metadata.camera_make == 'GoPro'
-
-    def test_extract_metadata_fallback_empty_list(self, app):
+        video_path = make_video()
+
+        mock_metadata = {
+            'CreateDate': '2023:05:15 14:30:00',
+            'Make': 'GoPro'
+        }
+
+        # First call (with -ee) raises exception, second call (fallback) succeeds
+        mock_exiftool.get_metadata.side_effect = [
+            Exception("Embedded extraction failed"),
+            [{'SourceFile': str(video_path), **mock_metadata}]
+        ]
+
+        metadata = app._extract_metadata(video_path)
+        assert metadata.path == video_path
+        assert metadata.date_taken is not None
+        assert metadata.camera_make == 'GoPro'
+
+    def test_extract_metadata_fallback_empty_list(self, app, make_video, mock_exiftool):
         """Test _extract_metadata handles empty metadata list in fallback extraction."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                # First call (with -ee) raises exception, second call returns empty list
-                mock_exiftool.get_metadata = MagicMock(side_effect=[
-                    Exception("Embedded extraction failed"),
-                    []
-                ])
-                mock_exiftool_class.return_value = mock_exiftool
-
-                metadata = app._extract_metadata(video_path)
-                assert metadata.path == video_path
-                assert metadata.date_taken is None
-                assert metadata.location is None
-
-    def test_extract_metadata_fallback_exception(self, app):
+        video_path = make_video()
+
+        # First call (with -ee) raises exception, second call returns empty list
+        mock_exiftool.get_metadata.side_effect = [
+            Exception("Embedded extraction failed"),
+            []
+        ]
+
+        metadata = app._extract_metadata(video_path)
+        assert metadata.path == video_path
+        assert metadata.date_taken is None
+        assert metadata.location is None
+
+    def test_extract_metadata_fallback_exception(self, app, make_video, mock_exiftool):
         """Test _extract_metadata handles exception in fallback extraction."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
-
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                # Both calls raise exceptions
-                mock_exiftool.get_metadata = MagicMock(side_effect=Exception("ExifTool error"))
-                mock_exiftool_class.return_value = mock_exiftool
-
-                metadata = app._extract_metadata(video_path)
-                assert metadata.path == video_path
-                assert metadata.date_taken is None
-                assert metadata.location is None
-
-    def test_extract_metadata_outer_exception(self, app):
+        video_path = make_video()
+
+        # Both calls raise exceptions
+        mock_exiftool.get_metadata.side_effect = Exception("ExifTool error")
+
+        metadata = app._extract_metadata(video_path)
+        assert metadata.path == video_path
+        assert metadata.date_taken is None
+        assert metadata.location is None
+
+    def test_extract_metadata_outer_exception(self, app, make_video):
         """Test _extract_metadata handles outer exception (e.g., context manager failure)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            video_path = tmp_path / "video.mp4"
-            self.create_test_video_file(video_path)
+        video_path = make_video()
+
+        with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
+            # Context manager raises exception
+            mock_exiftool_class.side_effect = Exception("Context manager error")
+
+            metadata = app._extract_metadata(video_path)
+            assert metadata.path == video_path
+            assert metadata.date_taken is None
+            assert metadata.location is None
+
+    def test_extract_metadata_batch_single_exiftool_call(self, app, mock_exiftool):
+        """Test _extract_metadata_batch reads all files with one exiftool call, keeping their order."""
+        video_paths = [Path("video1.mp4"), Path("video2.mov")]
+        mock_exiftool.get_metadata.side_effect = exiftool_answer({'Make': 'GoPro'}, {'Make': 'Apple'})
+
+        videos = app._extract_metadata_batch(video_paths)
+
+        mock_exiftool.get_metadata.assert_called_once_with(
+            ['video1.mp4', 'video2.mov'], params=VideoOffloader.EXIFTOOL_EMBEDDED_PARAMS)
+        assert [video.path for video in videos] == video_paths
+        assert [video.camera_make for video in videos] == ['GoPro', 'Apple']
+
+    def test_extract_metadata_batch_split_into_exiftool_batches(self, app, mock_exiftool):
+        """Test that exiftool is called once per batch of files."""
+        file_paths = [Path(f"video{index}.mp4") for index in range(5)]
+        mock_exiftool.get_metadata.side_effect = exiftool_answer(
+            {'Make': 'GoPro'}, {'Make': 'GoPro'}, {'Make': 'Apple'}, {'Make': 'Apple'}, {'Make': 'Sony'})
+
+        with patch.object(VideoOffloader, 'METADATA_BATCH_SIZE', 2):
+            videos = app._extract_metadata_batch(file_paths)
+
+        assert [video.camera_make for video in videos] == ['GoPro', 'GoPro', 'Apple', 'Apple', 'Sony']
+        assert [call_args.args[0] for call_args in mock_exiftool.get_metadata.call_args_list] == [
+            ['video0.mp4', 'video1.mp4'], ['video2.mp4', 'video3.mp4'], ['video4.mp4'],
+        ]
+
+    def test_extract_metadata_batch_unreadable_file_only_loses_its_own_metadata(self, app, mock_exiftool):
+        """Test that when exiftool fails on one file of a batch, the other files are read one by one."""
+        file_paths = [Path(f"video{index}.mp4") for index in range(3)]
+
+        def get_metadata(file_names, params=None):
+            # exiftool exits with an error for the whole call when any of its files cannot be read
+            if 'video1.mp4' in file_names:
+                raise exiftool.exceptions.ExifToolExecuteError(1, '', 'Error: File format error', [])
+            return [{'SourceFile': file_name, 'Make': 'GoPro'} for file_name in file_names]
+        mock_exiftool.get_metadata.side_effect = get_metadata
+
+        videos = app._extract_metadata_batch(file_paths)
+
+        assert [video.camera_make for video in videos] == ['GoPro', None, 'GoPro']
+        file_names_read = [call_args.args[0] for call_args in mock_exiftool.get_metadata.call_args_list]
+        assert file_names_read[0] == ['video0.mp4', 'video1.mp4', 'video2.mp4']
+        assert ['video0.mp4'] in file_names_read and ['video2.mp4'] in file_names_read
+
+    def test_extract_metadata_batch_matches_results_by_source_file(self, app, mock_exiftool):
+        """Test that results are matched to files by SourceFile when exiftool leaves a file out of its output."""
+        file_paths = [Path(f"video{index}.mp4") for index in range(3)]
+        mock_exiftool.get_metadata.return_value = [
+            {'SourceFile': 'video2.mp4', 'Make': 'Apple'},
+            {'SourceFile': 'video0.mp4', 'Make': 'GoPro'},
+        ]
+
+        videos = app._extract_metadata_batch(file_paths)
+
+        assert [video.camera_make for video in videos] == ['GoPro', None, 'Apple']
+
+    def test_extract_metadata_skips_files_that_are_not_videos(self, app, mock_exiftool, tmp_path, make_video):
+        """Test that files not starting with a video box are not passed to exiftool."""
+        video_path = make_video()
+        not_video_path = tmp_path / "not_video.mp4"
+        not_video_path.write_bytes(b"not a video file at all")
+        empty_path = tmp_path / "empty.mov"
+        empty_path.touch()
+        mock_exiftool.get_metadata.side_effect = exiftool_answer({'Make': 'GoPro'})
+
+        videos = app._extract_metadata_batch([not_video_path, video_path, empty_path])
+
+        assert [video.camera_make for video in videos] == [None, 'GoPro', None]
+        mock_exiftool.get_metadata.assert_called_once_with(
+            [str(video_path)], params=VideoOffloader.EXIFTOOL_EMBEDDED_PARAMS)
+
+    def test_may_be_video(self, tmp_path):
+        """Test the video header check for MP4 and QuickTime box types, unreadable and short files."""
+        mov_path = tmp_path / "video.mov"
+        mov_path.write_bytes(b"\x00\x00\x00\x08wide\x00\x00\x00\x10mdat")
+        short_path = tmp_path / "short.mp4"
+        short_path.write_bytes(b"\x00\x00")
+
+        assert VideoOffloader._may_be_video(mov_path)
+        assert not VideoOffloader._may_be_video(short_path)
+        assert VideoOffloader._may_be_video(tmp_path / "missing.mp4")
+
+    def test_extract_metadata_batch_reads_only_needed_tags(self, app, mock_exiftool):
+        """Test that only the tags of the needed fields are read, and the other fields are left as None."""
+        mock_exiftool.get_tags.side_effect = exiftool_answer({
+            'QuickTime:CreateDate': '2023:05:15 14:30:00',
+            'QuickTime:Make': 'Apple',
+        })
+
+        videos = app._extract_metadata_batch([Path("video.mp4")], fields_needed={DATE_FIELD})
+
+        assert videos[0].date_taken == datetime(2023, 5, 15, 14, 30, 0)
+        assert videos[0].camera_make is None
+        mock_exiftool.get_metadata.assert_not_called()
+        tags = mock_exiftool.get_tags.call_args.kwargs['tags']
+        assert 'CreateDate' in tags and 'CreationDate' in tags
+        assert 'Make' not in tags
+        # Without the location, embedded data is not extracted
+        assert mock_exiftool.get_tags.call_args.kwargs['params'] == VideoOffloader.EXIFTOOL_FAST_PARAMS
+
+    def test_extract_metadata_batch_location_reads_embedded_data(self, app, mock_exiftool):
+        """Test that embedded data is extracted when the location is needed."""
+        mock_exiftool.get_tags.side_effect = exiftool_answer({'QuickTime:GPSCoordinates': '37.7749 -122.4194 100.0'})
+
+        videos = app._extract_metadata_batch([Path("video.mp4")], fields_needed={DATE_FIELD, LOCATION_FIELD})
+
+        assert videos[0].location is not None
+        assert mock_exiftool.get_tags.call_args.kwargs['params'] == VideoOffloader.EXIFTOOL_EMBEDDED_PARAMS
+
+    def test_get_tags_needed(self):
+        """Test the tags read for a set of fields, and that all tags are read when all fields are needed."""
+        assert VideoOffloader._get_tags_needed(ALL_METADATA_FIELDS) is None
+        assert VideoOffloader._get_tags_needed({CAMERA_MAKE_FIELD}) == ('Make',)
+        assert VideoOffloader._get_tags_needed({LOCATION_FIELD}) == (
+            'GPSCoordinates', 'GPSLatitude', 'GPSLatitudeRef', 'GPSLongitude', 'GPSLongitudeRef')
+
+    def test_extract_metadata_cache_keyed_by_tags(self, logger, mock_exiftool, tmp_path):
+        """Test that metadata read for some fields is not served from the cache when all fields are needed."""
+        video_path = self.create_test_video_file(tmp_path / "video.mp4")
+        mock_exiftool.get_tags.side_effect = exiftool_answer({'QuickTime:CreateDate': '2023:05:15 14:30:00'})
+        mock_exiftool.get_metadata.side_effect = exiftool_answer(
+            {'QuickTime:CreateDate': '2023:05:15 14:30:00', 'Make': 'GoPro'})
+
+        with VideoOffloader(logger, cache_path=tmp_path / "cache.sqlite") as app:
+            assert app._extract_metadata_batch([video_path], fields_needed={DATE_FIELD})[0].camera_make is None
+            assert app._extract_metadata_batch([video_path])[0].camera_make == 'GoPro'
+            assert app._extract_metadata_batch([video_path], fields_needed={DATE_FIELD})[0].date_taken is not None
+
+        assert mock_exiftool.get_tags.call_count == 1
+        assert mock_exiftool.get_metadata.call_count == 1
+
+    def test_extract_metadata_batch_empty(self, app, mock_exiftool):
+        """Test _extract_metadata_batch does not start exiftool when there are no files."""
+        assert app._extract_metadata_batch([]) == []
+        mock_exiftool.get_metadata.assert_not_called()
+
+    def test_extract_metadata_reuses_exiftool(self, app, mock_exiftool):
+        """Test that consecutive extractions share a single exiftool helper."""
+        mock_exiftool.get_metadata.return_value = [{}]
+
+        app._extract_metadata(Path("video1.mp4"))
+        app._extract_metadata(Path("video2.mp4"))
+
+        assert mock_exiftool.get_metadata.call_count == 2
+        assert exiftool.ExifToolHelper.call_count == 1
+
+    def test_extract_metadata_batch_in_threads(self, app, mock_exiftool):
+        """Test that videos are split between workers, each with its own exiftool helper, keeping their order."""
+        video_paths = [Path(f"video{index}.mp4") for index in range(8)]
+        mock_exiftool.get_metadata.side_effect = (
+            lambda file_names, params=None: [
+                {'SourceFile': file_name, 'Model': file_name} for file_name in file_names])
+
+        videos = app._extract_metadata_batch(video_paths, workers=4)
+
+        assert [video.camera_model for video in videos] == [str(video_path) for video_path in video_paths]
+        assert mock_exiftool.get_metadata.call_count == 4
+        assert exiftool.ExifToolHelper.call_count == 4
+
+        # The helpers are kept for later reads
+        app._extract_metadata_batch(video_paths, workers=4)
+        assert exiftool.ExifToolHelper.call_count == 4
 
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                # Context manager raises exception
-                mock_exiftool_class.side_effect = Exception("Context manager error")
+    def test_extract_metadata_batch_more_workers_than_videos(self, app, mock_exiftool):
+        """Test that no more workers than videos are used."""
+        mock_exiftool.get_metadata.return_value = [{}]
 
-                metadata = app._extract_metadata(video_path)
-                assert metadata.path == video_path
-                assert metadata.date_taken is None
-                assert metadata.location is None
+        videos = app._extract_metadata_batch([Path("video.mp4")], workers=4)
+
+        assert len(videos) == 1
+        assert exiftool.ExifToolHelper.call_count == 1
+
+    def test_close_terminates_exiftool(self, logger, mock_exiftool):
+        """Test that leaving the context terminates the running exiftool helper."""
+        mock_exiftool.get_metadata.return_value = [{}]
+        mock_exiftool.running = True
+
+        with VideoOffloader(logger) as app:
+            app._extract_metadata(Path("video.mp4"))
+
+        mock_exiftool.terminate.assert_called_once_with()
+        assert app._exiftools == []
+
+    def test_close_without_exiftool(self, logger):
+        """Test that close does nothing when exiftool was never started."""
+        app = VideoOffloader(logger)
+        app.close()
+        assert app._exiftools == []
+
+    def test_init_accepts_preopened_exiftool(self, logger):
+        """Test that a given exiftool helper is used for reading metadata and left running by close."""
+        with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
+            helper = MagicMock(spec=exiftool.helper.ExifToolHelper)
+            helper.get_metadata.side_effect = exiftool_answer({'Make': 'GoPro'})
+            app = VideoOffloader(logger, exiftool_helper=helper)
+            assert app._exiftool is helper
+
+            assert app._extract_metadata(Path("video.mp4")).camera_make == 'GoPro'
+            app.close()
+
+        mock_exiftool_class.assert_not_called()
+        helper.get_metadata.assert_called_once()
+        helper.__enter__.assert_not_called()
+        helper.terminate.assert_not_called()
+
+    def test_preopened_exiftool_shared_with_worker_helpers(self, logger, mock_exiftool):
+        """Test that the given exiftool helper serves the first worker and only the others are started."""
+        helper = MagicMock(spec=exiftool.helper.ExifToolHelper)
+        app = VideoOffloader(logger, exiftool_helper=helper)
+
+        assert app._get_exiftools(2) == [helper, mock_exiftool]
+        assert app._exiftools == [mock_exiftool]
+
+    def test_extract_metadata_cache_miss_and_hit(self, logger, mock_exiftool, tmp_path):
+        """Test that cached metadata is reused by a later VideoOffloader instead of running exiftool."""
+        video_path = self.create_test_video_file(tmp_path / "video.mp4")
+        cache_path = tmp_path / "cache" / "cache.sqlite"
+        mock_exiftool.get_metadata.side_effect = exiftool_answer({'Make': 'GoPro'})
+
+        with VideoOffloader(logger, cache_path=cache_path) as app:
+            assert app._extract_metadata(video_path).camera_make == 'GoPro'
+        assert mock_exiftool.get_metadata.call_count == 1
+        assert cache_path.exists()
+
+        with VideoOffloader(logger, cache_path=cache_path) as app:
+            assert app._extract_metadata(video_path).camera_make == 'GoPro'
+        assert mock_exiftool.get_metadata.call_count == 1
+
+    def test_extract_metadata_cache_modified_file(self, logger, mock_exiftool, tmp_path):
+        """Test that a cached entry is ignored once the file changes."""
+        video_path = self.create_test_video_file(tmp_path / "video.mp4")
+        cache_path = tmp_path / "cache.sqlite"
+        mock_exiftool.get_metadata.side_effect = exiftool_answer({'Make': 'GoPro'}, {'Make': 'Apple'})
+
+        with VideoOffloader(logger, cache_path=cache_path) as app:
+            app._extract_metadata(video_path)
+            # Replace the file instead of writing into it, as it shares its content with the other fake videos
+            video_path.unlink()
+            video_path.write_bytes(FAKE_VIDEO_CONTENT + b" changed")
+            assert app._extract_metadata(video_path).camera_make == 'Apple'
+        assert mock_exiftool.get_metadata.call_count == 2
+
+    def test_extract_metadata_cache_skips_empty_metadata(self, logger, mock_exiftool, tmp_path):
+        """Test that empty exiftool results are not cached."""
+        video_path = self.create_test_video_file(tmp_path / "video.mp4")
+        cache_path = tmp_path / "cache.sqlite"
+        mock_exiftool.get_metadata.return_value = [{}]
+
+        with VideoOffloader(logger, cache_path=cache_path) as app:
+            app._extract_metadata(video_path)
+            app._extract_metadata(video_path)
+        assert mock_exiftool.get_metadata.call_count == 2
 
     def test_read_videos_directory_not_exists(self, app):
         """Test read_videos with non-existent directory."""
         with pytest.raises(ValueError, match="Directory does not exist"):
             app.read_videos("/nonexistent/directory")
 
+    def test_read_videos_directory_symlink_loop(self, app):
+        """Test read_videos reports a source directory it cannot stat, such as a symlink loop, as missing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            loop = Path(tmpdir) / "loop"
+            loop.symlink_to(loop)
+            with pytest.raises(ValueError, match="Directory does not exist"):
+                app.read_videos(loop)
+
     def test_read_videos_path_not_directory(self, app):
         """Test read_videos with file path instead of directory."""
         with tempfile.NamedTemporaryFile(delete=False) as tmpfile:
@@ -756,53 +1205,83 @@ class TestVideoOffloader:
             finally:
                 tmp_path.unlink()
 
-    def test_read_videos_empty_directory(self, app):
+    def test_read_videos_empty_directory(self, app, tmp_path):
         """Test read_videos with empty directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            videos = app.read_videos(tmpdir)
-            assert videos == []
+        videos = app.read_videos(str(tmp_path))
+        assert videos == []
 
-    def test_read_videos_with_video_files(self, app):
+    def test_read_videos_with_video_files(self, app, tmp_path):
         """Test read_videos with actual video files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            # Create test video files
-            self.create_test_video_file(tmp_path / "video1.mp4")
-            self.create_test_video_file(tmp_path / "video2.mov")
-            # Create non-video file
-            (tmp_path / "document.txt").write_text("not a video")
-
-            with patch.object(app, '_extract_metadata') as mock_extract:
-                mock_extract.side_effect = [
-                    VideoMetadata(path=tmp_path / "video1.mp4"),
-                    VideoMetadata(path=tmp_path / "video2.mov"),
-                ]
-
-                videos = app.read_videos(tmpdir)
-                assert len(videos) == 2
-                assert all(isinstance(v, VideoMetadata) for v in videos)
-                assert all(v.path.suffix.lower() in ['.mp4', '.mov'] for v in videos)
-
-    def test_read_videos_filters_by_extension(self, app):
+        # Create test video files
+        self.create_test_video_file(tmp_path / "video1.mp4")
+        self.create_test_video_file(tmp_path / "video2.mov")
+        # Create non-video file
+        (tmp_path / "document.txt").write_text("not a video")
+
+        with patch.object(app, '_extract_metadata_batch') as mock_extract:
+            mock_extract.side_effect = lambda file_paths, **kwargs: [
+                VideoMetadata(path=file_path) for file_path in file_paths
+            ]
+
+            videos = app.read_videos(str(tmp_path))
+            assert len(videos) == 2
+            assert all(isinstance(v, VideoMetadata) for v in videos)
+            assert all(v.path.suffix.lower() in ['.mp4', '.mov'] for v in videos)
+
+    def test_read_videos_filters_by_extension(self, app, tmp_path):
         """Test that read_videos only includes supported video extensions."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            self.create_test_video_file(tmp_path / "video.mp4")
-            self.create_test_video_file(tmp_path / "video.mov")
-            (tmp_path / "video.avi").write_bytes(b"fake video")
-            (tmp_path / "video.mkv").write_bytes(b"fake video")
-
-            with patch.object(app, '_extract_metadata') as mock_extract:
-                def mock_extract_side_effect(file_path, use_file_date=False):
-                    return VideoMetadata(path=file_path)
-                mock_extract.side_effect = mock_extract_side_effect
-
-                videos = app.read_videos(tmpdir)
-                extensions = {v.path.suffix.lower() for v in videos}
-                assert '.mp4' in extensions
-                assert '.mov' in extensions
-                assert '.avi' not in extensions
-                assert '.mkv' not in extensions
+        self.create_test_video_file(tmp_path / "video.mp4")
+        self.create_test_video_file(tmp_path / "video.mov")
+        (tmp_path / "video.avi").write_bytes(b"fake video")
+        (tmp_path / "video.mkv").write_bytes(b"fake video")
+
+        with patch.object(app, '_extract_metadata_batch') as mock_extract:
+            def mock_extract_side_effect(file_paths, **kwargs):
+                return [VideoMetadata(path=file_path) for file_path in file_paths]
+            mock_extract.side_effect = mock_extract_side_effect
+
+            videos = app.read_videos(str(tmp_path))
+            extensions = {v.path.suffix.lower() for v in videos}
+            assert '.mp4' in extensions
+            assert '.mov' in extensions
+            assert '.avi' not in extensions
+            assert '.mkv' not in extensions
+
+    def test_iter_videos_checks_directory_immediately(self, app):
+        """Test iter_videos raises for a missing directory before the iterator is consumed."""
+        with pytest.raises(ValueError, match="Directory does not exist"):
+            app.iter_videos("/nonexistent/directory")
+
+    def test_iter_videos_reads_in_rounds(self, app, tmp_path):
+        """Test iter_videos extracts metadata one exiftool batch per worker at a time, as it is consumed."""
+        for index in range(3):
+            self.create_test_video_file(tmp_path / f"video{index}.mp4")
+
+        with patch.object(VideoOffloader, 'METADATA_BATCH_SIZE', 1), \
+                patch.object(app, '_extract_metadata_batch') as mock_extract:
+            mock_extract.side_effect = lambda file_paths, **kwargs: [
+                VideoMetadata(path=file_path) for file_path in file_paths
+            ]
+            videos = app.iter_videos(tmp_path, workers=2)
+            mock_extract.assert_not_called()
+
+            first = next(videos)
+            assert mock_extract.call_count == 1
+            assert len(mock_extract.call_args.args[0]) == 2
+            rest = list(videos)
+
+        assert mock_extract.call_count == 2
+        assert sorted(video.path.name for video in [first, *rest]) == ["video0.mp4", "video1.mp4", "video2.mp4"]
+
+    def test_iter_video_paths(self, tmp_path):
+        """Test that only video files directly inside the directory are yielded, following symlinks."""
+        video_path = self.create_test_video_file(tmp_path / "video.MP4")
+        (tmp_path / "document.txt").write_text("not a video")
+        (tmp_path / "directory.mov").mkdir()
+        (tmp_path / "link.mov").symlink_to(video_path)
+        (tmp_path / "broken.mov").symlink_to(tmp_path / "missing.mov")
+
+        assert sorted(VideoOffloader._iter_video_paths(tmp_path)) == [tmp_path / "link.mov", video_path]
 
     def test_get_bucket_key_software(self, app):
         """Test _get_bucket_key with SOFTWARE group_by."""
@@ -892,66 +1371,87 @@ class TestVideoOffloader:
         assert len(buckets["2023-06"]) == 1
         assert len(buckets["Unknown"]) == 1
 
+    def test_bucket_videos_formats_date_keys_once(self, app):
+        """Test that date bucket keys are formatted once per bucket rather than once per video."""
+        videos = [VideoMetadata(path=Path(f"{day}.mp4"), date_taken=datetime(2023, 5, day)) for day in range(1, 11)]
+        videos.append(VideoMetadata(path=Path("unknown.mp4"), date_taken=None))
+
+        key_function = MagicMock(wraps=VideoOffloader._get_year_month_bucket_key)
+        with patch.dict(VideoOffloader.BUCKET_KEY_FUNCTIONS, {GroupBy.YEAR_MONTH: key_function}):
+            buckets = app.bucket_videos(videos, GroupBy.YEAR_MONTH)
+
+        assert list(buckets) == ["2023-05", "Unknown"]
+        assert buckets["2023-05"] == videos[:10]
+        assert key_function.call_count == 2
+
+    def test_bucket_videos_invalid_group_by(self, app):
+        """Test bucket_videos with a group_by parameter that has no bucket key function raises error."""
+        videos = [VideoMetadata(path=Path("1.mp4"), software="App")]
+        with patch.dict(VideoOffloader.BUCKET_KEY_FUNCTIONS):
+            del VideoOffloader.BUCKET_KEY_FUNCTIONS[GroupBy.SOFTWARE]
+            with pytest.raises(ValueError, match="Unsupported group_by"):
+                app.bucket_videos(videos, GroupBy.SOFTWARE)
+
     def test_bucket_videos_empty_list(self, app):
         """Test bucket_videos with empty video list."""
         buckets = app.bucket_videos([], GroupBy.YEAR)
         assert buckets == {}
 
-    def test_get_sort_key_software(self, app):
-        """Test _get_sort_key with SOFTWARE group_by."""
+    def test_get_sort_key_function_software(self, app):
+        """Test _get_sort_key_function with SOFTWARE group_by."""
         video1 = VideoMetadata(path=Path("1.mp4"), software="iOS")
         video2 = VideoMetadata(path=Path("2.mp4"), software=None)
 
-        key1 = app._get_sort_key(video1, GroupBy.SOFTWARE)
-        key2 = app._get_sort_key(video2, GroupBy.SOFTWARE)
+        key1 = app._get_sort_key_function(GroupBy.SOFTWARE)(video1)
+        key2 = app._get_sort_key_function(GroupBy.SOFTWARE)(video2)
 
         assert key1[0] == 0  # Known values sort first
         assert key2[0] == 1  # Unknown values sort last
         assert key1 < key2
 
-    def test_get_sort_key_year(self, app):
-        """Test _get_sort_key with YEAR group_by."""
+    def test_get_sort_key_function_year(self, app):
+        """Test _get_sort_key_function with YEAR group_by."""
         video1 = VideoMetadata(path=Path("1.mp4"), date_taken=datetime(2023, 1, 1))
         video2 = VideoMetadata(path=Path("2.mp4"), date_taken=None)
 
-        key1 = app._get_sort_key(video1, GroupBy.YEAR)
-        key2 = app._get_sort_key(video2, GroupBy.YEAR)
+        key1 = app._get_sort_key_function(GroupBy.YEAR)(video1)
+        key2 = app._get_sort_key_function(GroupBy.YEAR)(video2)
 
         assert key1[0] == 0
         assert key2[0] == 1
         assert key1 < key2
 
-    def test_get_sort_key_camera_make(self, app):
-        """Test _get_sort_key with CAMERA_MAKE group_by."""
+    def test_get_sort_key_function_camera_make(self, app):
+        """Test _get_sort_key_function with CAMERA_MAKE group_by."""
         video1 = VideoMetadata(path=Path("1.mp4"), camera_make="GoPro")
         video2 = VideoMetadata(path=Path("2.mp4"), camera_make=None)
 
-        key1 = app._get_sort_key(video1, GroupBy.CAMERA_MAKE)
-        key2 = app._get_sort_key(video2, GroupBy.CAMERA_MAKE)
+        key1 = app._get_sort_key_function(GroupBy.CAMERA_MAKE)(video1)
+        key2 = app._get_sort_key_function(GroupBy.CAMERA_MAKE)(video2)
 
         assert key1[0] == 0  # Known values sort first
         assert key2[0] == 1  # Unknown values sort last
         assert key1 < key2
 
-    def test_get_sort_key_camera_model(self, app):
-        """Test _get_sort_key with CAMERA_MODEL group_by."""
+    def test_get_sort_key_function_camera_model(self, app):
+        """Test _get_sort_key_function with CAMERA_MODEL group_by."""
         video1 = VideoMetadata(path=Path("1.mp4"), camera_model="HERO9")
         video2 = VideoMetadata(path=Path("2.mp4"), camera_model=None)
 
-        key1 = app._get_sort_key(video1, GroupBy.CAMERA_MODEL)
-        key2 = app._get_sort_key(video2, GroupBy.CAMERA_MODEL)
+        key1 = app._get_sort_key_function(GroupBy.CAMERA_MODEL)(video1)
+        key2 = app._get_sort_key_function(GroupBy.CAMERA_MODEL)(video2)
 
         assert key1[0] == 0  # Known values sort first
         assert key2[0] == 1  # Unknown values sort last
         assert key1 < key2
 
-    def test_get_sort_key_year_month(self, app):
-        """Test _get_sort_key with YEAR_MONTH group_by."""
+    def test_get_sort_key_function_year_month(self, app):
+        """Test _get_sort_key_function with YEAR_MONTH group_by."""
         video1 = VideoMetadata(path=Path("1.mp4"), date_taken=datetime(2023, 5, 15))
         video2 = VideoMetadata(path=Path("2.mp4"), date_taken=None)
 
-        key1 = app._get_sort_key(video1, GroupBy.YEAR_MONTH)
-        key2 = app._get_sort_key(video2, GroupBy.YEAR_MONTH)
+        key1 = app._get_sort_key_function(GroupBy.YEAR_MONTH)(video1)
+        key2 = app._get_sort_key_function(GroupBy.YEAR_MONTH)(video2)
 
         assert key1[0] == 0
         assert key1[1] == 2023
@@ -959,24 +1459,23 @@ class TestVideoOffloader:
         assert key2[0] == 1
         assert key1 < key2
 
-    def test_get_sort_key_year_month_day(self, app):
-        """Test _get_sort_key with YEAR_MONTH_DAY group_by."""
+    def test_get_sort_key_function_year_month_day(self, app):
+        """Test _get_sort_key_function with YEAR_MONTH_DAY group_by."""
         video1 = VideoMetadata(path=Path("1.mp4"), date_taken=datetime(2023, 5, 15))
         video2 = VideoMetadata(path=Path("2.mp4"), date_taken=None)
 
-        key1 = app._get_sort_key(video1, GroupBy.YEAR_MONTH_DAY)
-        key2 = app._get_sort_key(video2, GroupBy.YEAR_MONTH_DAY)
+        key1 = app._get_sort_key_function(GroupBy.YEAR_MONTH_DAY)(video1)
+        key2 = app._get_sort_key_function(GroupBy.YEAR_MONTH_DAY)(video2)
 
         assert key1[0] == 0
         assert key1[1] == datetime(2023, 5, 15)
         assert key2[0] == 1
         assert key1 < key2
 
-    def test_get_sort_key_invalid_group_by(self, app):
-        """Test _get_sort_key with invalid group_by raises error."""
-        video = VideoMetadata(path=Path("test.mp4"))
+    def test_get_sort_key_function_invalid_group_by(self, app):
+        """Test _get_sort_key_function with invalid group_by raises error."""
         with pytest.raises(ValueError, match="Unsupported group_by"):
-            app._get_sort_key(video, "invalid")
+            app._get_sort_key_function("invalid")
 
     def test_sort_videos_by_year(self, app):
         """Test sort_videos sorting by year."""
@@ -1002,378 +1501,499 @@ class TestVideoOffloader:
         assert sorted_videos[-1].date_taken is None
         assert sorted_videos[-2].date_taken is None
 
-    def test_copy_videos(self, app):
+    def test_copy_videos(self, app, tmp_path):
         """Test copy_videos copies files to destination."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            # Create source videos
-            video1_path = self.create_test_video_file(source_dir / "video1.mp4")
-            video2_path = self.create_test_video_file(source_dir / "video2.mov")
+        # Create source videos
+        video1_path = self.create_test_video_file(source_dir / "video1.mp4")
+        video2_path = self.create_test_video_file(source_dir / "video2.mov")
 
-            videos = [
-                VideoMetadata(path=video1_path),
-                VideoMetadata(path=video2_path),
-            ]
+        videos = [
+            VideoMetadata(path=video1_path),
+            VideoMetadata(path=video2_path),
+        ]
 
-            app.copy_videos(videos, dest_dir)
+        app.copy_videos(videos, dest_dir)
 
-            assert (dest_dir / "video1.mp4").exists()
-            assert (dest_dir / "video2.mov").exists()
-            assert (dest_dir / "video1.mp4").stat().st_size == video1_path.stat().st_size
+        assert (dest_dir / "video1.mp4").exists()
+        assert (dest_dir / "video2.mov").exists()
+        assert (dest_dir / "video1.mp4").stat().st_size == video1_path.stat().st_size
 
-    def test_copy_videos_creates_destination(self, app):
+    def test_copy_videos_creates_destination(self, app, tmp_path):
         """Test copy_videos creates destination directory if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest" / "subdir"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest" / "subdir"
+        source_dir.mkdir()
 
-            video_path = self.create_test_video_file(source_dir / "video.mp4")
-            videos = [VideoMetadata(path=video_path)]
+        video_path = self.create_test_video_file(source_dir / "video.mp4")
+        videos = [VideoMetadata(path=video_path)]
 
-            app.copy_videos(videos, dest_dir)
+        app.copy_videos(videos, dest_dir)
 
-            assert dest_dir.exists()
-            assert (dest_dir / "video.mp4").exists()
+        assert dest_dir.exists()
+        assert (dest_dir / "video.mp4").exists()
 
-    def test_copy_videos_nonexistent_source(self, app):
+    def test_copy_videos_nonexistent_source(self, app, tmp_path):
         """Test copy_videos raises error when source file doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dest_dir = Path(tmpdir) / "dest"
-            nonexistent_video = VideoMetadata(path=Path("/nonexistent/video.mp4"))
+        dest_dir = tmp_path / "dest"
+        nonexistent_video = VideoMetadata(path=Path("/nonexistent/video.mp4"))
+
+        with pytest.raises(RuntimeError, match="Failed to copy"):
+            app.copy_videos([nonexistent_video], dest_dir)
+
+    def test_copy_videos_in_threads_stops_on_failure(self, app, tmp_path):
+        """Test copy_videos copies several videos concurrently and raises when one of them fails."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        videos = [VideoMetadata(path=self.create_test_video_file(source_dir / f"video{index}.mp4"))
+                  for index in range(3)]
+
+        app.copy_videos(videos, tmp_path / "dest")
+        assert sorted(path.name for path in (tmp_path / "dest").iterdir()) == [
+            "video0.mp4", "video1.mp4", "video2.mp4"]
+
+        videos.insert(1, VideoMetadata(path=source_dir / "missing.mp4"))
+        with pytest.raises(RuntimeError, match="Failed to copy .*missing.mp4"):
+            app.copy_videos(videos, tmp_path / "other")
+
+    def test_copy_videos_recreates_removed_destination(self, app, tmp_path):
+        """Test copy_videos creates its destination again after it was removed following an offload."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        video = self.create_test_video_file(source_dir / "video.mp4")
+        dest_dir = tmp_path / "dest"
+
+        with patch.object(app, 'read_videos', return_value=[VideoMetadata(path=video)]):
+            app.offload_videos(source_dir, dest_dir)
+        shutil.rmtree(dest_dir)
+
+        app.copy_videos([VideoMetadata(path=video)], dest_dir / "unknown")
+        assert (dest_dir / "unknown" / "video.mp4").exists()
+
+    def test_offload_videos_creates_directories_before_copying(self, app, tmp_path):
+        """Test offload_videos creates every destination directory before copying any video."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        video = self.create_test_video_file(source_dir / "video.mp4")
+        dest_dir = tmp_path / "dest"
+        month_dirs = [dest_dir / "year=2023" / "month=05", dest_dir / "year=2024" / "month=01"]
+
+        def check_directories(videos, destination, to_archive, hardlink):
+            assert all(month_dir.is_dir() for month_dir in month_dirs)
+            assert (dest_dir / "unknown").is_dir()
+
+        videos = [
+            VideoMetadata(path=video, date_taken=datetime(2023, 5, 15)),
+            VideoMetadata(path=video, date_taken=datetime(2024, 1, 1)),
+            VideoMetadata(path=video),
+        ]
+        with patch.object(app, 'read_videos', return_value=videos), \
+                patch.object(app, '_save_videos', side_effect=check_directories) as mock_save:
+            app.offload_videos(source_dir, dest_dir)
+
+        assert mock_save.call_count == 3
+
+    def test_copy_videos_hardlink(self, app, tmp_path):
+        """Test copy_videos hard links files to the destination when hardlink=True."""
+        source_video = self.create_test_video_file(tmp_path / "video.mp4")
+        dest_dir = tmp_path / "dest"
+
+        app.copy_videos([VideoMetadata(path=source_video)], dest_dir, hardlink=True)
+
+        assert (dest_dir / "video.mp4").samefile(source_video)
+
+    def test_copy_videos_hardlink_falls_back_to_copy(self, app, tmp_path):
+        """Test copy_videos copies files when they cannot be hard linked."""
+        source_video = self.create_test_video_file(tmp_path / "video.mp4")
+        dest_dir = tmp_path / "dest"
+
+        with patch('os.link', side_effect=OSError("Invalid cross-device link")):
+            app.copy_videos([VideoMetadata(path=source_video)], dest_dir, hardlink=True)
+
+        assert not (dest_dir / "video.mp4").samefile(source_video)
+        assert (dest_dir / "video.mp4").read_bytes() == source_video.read_bytes()
+
+    def test_copy_file(self, tmp_path):
+        """Test _copy_file copies the content and modification time of a file."""
+        source = tmp_path / "source.mp4"
+        source.write_bytes(b"video content" * 1000)
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        target = tmp_path / "target.mp4"
+
+        VideoOffloader._copy_file(source, target)
+
+        assert target.read_bytes() == source.read_bytes()
+        assert target.stat().st_mtime == source.stat().st_mtime
+
+    @pytest.mark.skipif(not hasattr(os, 'copy_file_range'), reason="os.copy_file_range is not available")
+    def test_copy_file_falls_back_when_copy_file_range_fails(self, tmp_path):
+        """Test _copy_file falls back to shutil.copyfile when os.copy_file_range fails."""
+        source = tmp_path / "source.mp4"
+        source.write_bytes(b"video content")
+        target = tmp_path / "target.mp4"
+
+        with patch('os.copy_file_range', side_effect=OSError("Invalid cross-device link")):
+            VideoOffloader._copy_file(source, target)
+
+        assert target.read_bytes() == b"video content"
+
+    @pytest.mark.skipif(not hasattr(os, 'copy_file_range'), reason="os.copy_file_range is not available")
+    def test_copy_file_falls_back_when_copy_file_range_copies_nothing(self, tmp_path):
+        """Test _copy_file falls back to shutil.copyfile when os.copy_file_range returns 0 without copying."""
+        source = tmp_path / "source.mp4"
+        source.write_bytes(b"video content")
+        target = tmp_path / "target.mp4"
+
+        with patch('os.copy_file_range', return_value=0):
+            VideoOffloader._copy_file(source, target)
+
+        assert target.read_bytes() == b"video content"
 
-            with pytest.raises(RuntimeError, match="Failed to copy"):
-                app.copy_videos([nonexistent_video], dest_dir)
+    def test_copy_videos_to_source_directory(self, app, tmp_path):
+        """Test copy_videos refuses to copy a video onto itself and leaves it intact."""
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"video content")
 
-    def test_archive_videos(self, app):
+        with pytest.raises(RuntimeError, match="Failed to copy"):
+            app.copy_videos([VideoMetadata(path=video_path)], tmp_path)
+        assert video_path.read_bytes() == b"video content"
+
+    def test_archive_videos_skips_debug_log_below_debug_level(self, logger, tmp_path):
+        """Test archive_videos does not log each archived video when DEBUG logging is disabled."""
+        video_path = self.create_test_video_file(tmp_path / "video.mp4")
+        app = VideoOffloader(logger)
+
+        with patch.object(logger, 'isEnabledFor', return_value=False), \
+                patch.object(logger, 'debug') as mock_debug:
+            app.archive_videos([VideoMetadata(path=video_path)], tmp_path / "dest")
+
+        assert all("Added %s to archive" not in call_args.args for call_args in mock_debug.call_args_list)
+        assert (tmp_path / "dest" / "videos.zip").exists()
+
+    def test_archive_videos(self, app, tmp_path):
         """Test archive_videos creates zip file and removes originals."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            # Create source videos
-            video1_path = self.create_test_video_file(source_dir / "video1.mp4")
-            video2_path = self.create_test_video_file(source_dir / "video2.mov")
+        # Create source videos
+        video1_path = self.create_test_video_file(source_dir / "video1.mp4")
+        video2_path = self.create_test_video_file(source_dir / "video2.mov")
 
-            videos = [
-                VideoMetadata(path=video1_path),
-                VideoMetadata(path=video2_path),
-            ]
+        videos = [
+            VideoMetadata(path=video1_path),
+            VideoMetadata(path=video2_path),
+        ]
 
-            app.archive_videos(videos, dest_dir)
+        app.archive_videos(videos, dest_dir)
 
-            # Check zip file exists
-            zip_path = dest_dir / "videos.zip"
-            assert zip_path.exists()
+        # Check zip file exists
+        zip_path = dest_dir / "videos.zip"
+        assert zip_path.exists()
 
-            # Check original videos are removed
-            assert not (dest_dir / "video1.mp4").exists()
-            assert not (dest_dir / "video2.mov").exists()
+        # Check original videos are removed
+        assert not (dest_dir / "video1.mp4").exists()
+        assert not (dest_dir / "video2.mov").exists()
 
-            # Verify zip contents
-            with zipfile.ZipFile(zip_path, 'r') as zipf:
-                names = zipf.namelist()
-                assert "video1.mp4" in names
-                assert "video2.mov" in names
+        # Verify zip contents
+        with zipfile.ZipFile(zip_path, 'r') as zipf:
+            names = zipf.namelist()
+            assert "video1.mp4" in names
+            assert "video2.mov" in names
+            # Videos are already compressed, so they are stored as-is
+            assert all(info.compress_type == zipfile.ZIP_STORED for info in zipf.infolist())
+            assert zipf.read("video1.mp4") == video1_path.read_bytes()
 
-    def test_archive_videos_zip_creation_error(self, app):
+    def test_archive_videos_zip_creation_error(self, app, tmp_path):
         """Test archive_videos handles zip creation errors."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video_path = self.create_test_video_file(source_dir / "video.mp4")
-            videos = [VideoMetadata(path=video_path)]
+        video_path = self.create_test_video_file(source_dir / "video.mp4")
+        videos = [VideoMetadata(path=video_path)]
 
-            # Mock zipfile.ZipFile to raise an exception
-            with patch('zipfile.ZipFile', side_effect=Exception("Zip creation failed")):
-                with pytest.raises(RuntimeError, match="Failed to create archive"):
-                    app.archive_videos(videos, dest_dir)
+        # Mock zipfile.ZipFile to raise an exception
+        with patch('zipfile.ZipFile', side_effect=Exception("Zip creation failed")):
+            with pytest.raises(RuntimeError, match="Failed to create archive"):
+                app.archive_videos(videos, dest_dir)
 
-    def test_save_videos_copy(self, app):
+    def test_save_videos_copy(self, app, tmp_path):
         """Test _save_videos with to_archive=False."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video_path = self.create_test_video_file(source_dir / "video.mp4")
-            videos = [VideoMetadata(path=video_path)]
+        video_path = self.create_test_video_file(source_dir / "video.mp4")
+        videos = [VideoMetadata(path=video_path)]
 
-            app._save_videos(videos, dest_dir, to_archive=False)
+        app._save_videos(videos, dest_dir, to_archive=False)
 
-            assert (dest_dir / "video.mp4").exists()
-            assert not (dest_dir / "videos.zip").exists()
+        assert (dest_dir / "video.mp4").exists()
+        assert not (dest_dir / "videos.zip").exists()
 
-    def test_save_videos_archive(self, app):
+    def test_save_videos_archive(self, app, tmp_path):
         """Test _save_videos with to_archive=True."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video_path = self.create_test_video_file(source_dir / "video.mp4")
-            videos = [VideoMetadata(path=video_path)]
+        video_path = self.create_test_video_file(source_dir / "video.mp4")
+        videos = [VideoMetadata(path=video_path)]
 
-            app._save_videos(videos, dest_dir, to_archive=True)
+        app._save_videos(videos, dest_dir, to_archive=True)
 
-            assert (dest_dir / "videos.zip").exists()
-            assert not (dest_dir / "video.mp4").exists()
+        assert (dest_dir / "videos.zip").exists()
+        assert not (dest_dir / "video.mp4").exists()
 
-    def test_offload_videos_copy_mode(self, app):
+    def test_offload_videos_copy_mode(self, app, tmp_path):
         """Test offload_videos in copy mode."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            # Create videos with dates
-            video1 = self.create_test_video_file(source_dir / "video1.mp4")
-            video2 = self.create_test_video_file(source_dir / "video2.mp4")
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
+
+        # Create videos with dates
+        video1 = self.create_test_video_file(source_dir / "video1.mp4")
+        video2 = self.create_test_video_file(source_dir / "video2.mp4")
+
+        # Mock _extract_metadata_batch to return videos with dates
+        with patch.object(app, '_extract_metadata_batch') as mock_extract:
+            mock_extract.return_value = [
+                VideoMetadata(path=video1, date_taken=datetime(2023, 5, 15)),
+                VideoMetadata(path=video2, date_taken=datetime(2023, 5, 20)),
+            ]
 
-            # Mock _extract_metadata to return videos with dates
-            with patch.object(app, '_extract_metadata') as mock_extract:
-                mock_extract.side_effect = [
-                    VideoMetadata(path=video1, date_taken=datetime(2023, 5, 15)),
-                    VideoMetadata(path=video2, date_taken=datetime(2023, 5, 20)),
-                ]
+            app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
 
-                app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
+            # Check directory structure
+            assert (dest_dir / "year=2023" / "month=05").exists()
+            assert (dest_dir / "year=2023" / "month=05" / "video1.mp4").exists()
+            assert (dest_dir / "year=2023" / "month=05" / "video2.mp4").exists()
 
-                # Check directory structure
-                assert (dest_dir / "year=2023" / "month=05").exists()
-                assert (dest_dir / "year=2023" / "month=05" / "video1.mp4").exists()
-                assert (dest_dir / "year=2023" / "month=05" / "video2.mp4").exists()
-
-    def test_offload_videos_archive_mode(self, app):
+    def test_offload_videos_archive_mode(self, app, tmp_path):
         """Test offload_videos in archive mode."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video = self.create_test_video_file(source_dir / "video.mp4")
+        video = self.create_test_video_file(source_dir / "video.mp4")
 
-            with patch.object(app, '_extract_metadata') as mock_extract:
-                mock_extract.return_value = VideoMetadata(
-                    path=video, date_taken=datetime(2023, 5, 15)
-                )
+        with patch.object(app, '_extract_metadata_batch') as mock_extract:
+            mock_extract.return_value = [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]
 
-                app.offload_videos(source_dir, dest_dir, to_archive=True, keep_unknown=True)
+            app.offload_videos(source_dir, dest_dir, to_archive=True, keep_unknown=True)
 
-                # Check zip file exists
-                assert (dest_dir / "year=2023" / "month=05" / "videos.zip").exists()
+            # Check zip file exists
+            assert (dest_dir / "year=2023" / "month=05" / "videos.zip").exists()
 
-    def test_offload_videos_unknown_date(self, app):
+    def test_offload_videos_unknown_date(self, app, tmp_path):
         """Test offload_videos handles videos without dates."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video = self.create_test_video_file(source_dir / "video.mp4")
+        video = self.create_test_video_file(source_dir / "video.mp4")
 
-            with patch.object(app, '_extract_metadata') as mock_extract:
-                mock_extract.return_value = VideoMetadata(path=video, date_taken=None)
+        with patch.object(app, '_extract_metadata_batch') as mock_extract:
+            mock_extract.return_value = [VideoMetadata(path=video, date_taken=None)]
 
-                app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
+            app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
 
-                # Check unknown directory
-                assert (dest_dir / "unknown").exists()
-                assert (dest_dir / "unknown" / "video.mp4").exists()
+            # Check unknown directory
+            assert (dest_dir / "unknown").exists()
+            assert (dest_dir / "unknown" / "video.mp4").exists()
 
-    def test_offload_videos_multiple_months(self, app):
+    def test_offload_videos_multiple_months(self, app, tmp_path):
         """Test offload_videos handles videos from multiple months."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video1 = self.create_test_video_file(source_dir / "video1.mp4")
-            video2 = self.create_test_video_file(source_dir / "video2.mp4")
+        video1 = self.create_test_video_file(source_dir / "video1.mp4")
+        video2 = self.create_test_video_file(source_dir / "video2.mp4")
 
-            with patch.object(app, '_extract_metadata') as mock_extract:
-                mock_extract.side_effect = [
-                    VideoMetadata(path=video1, date_taken=datetime(2023, 5, 15)),
-                    VideoMetadata(path=video2, date_taken=datetime(2023, 6, 10)),
-                ]
+        with patch.object(app, '_extract_metadata_batch') as mock_extract:
+            mock_extract.return_value = [
+                VideoMetadata(path=video1, date_taken=datetime(2023, 5, 15)),
+                VideoMetadata(path=video2, date_taken=datetime(2023, 6, 10)),
+            ]
 
-                app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
+            app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
 
-                assert (dest_dir / "year=2023" / "month=05").exists()
-                assert (dest_dir / "year=2023" / "month=06").exists()
-                assert (dest_dir / "year=2023" / "month=05" / "video1.mp4").exists()
-                assert (dest_dir / "year=2023" / "month=06" / "video2.mp4").exists()
+            assert (dest_dir / "year=2023" / "month=05").exists()
+            assert (dest_dir / "year=2023" / "month=06").exists()
+            assert (dest_dir / "year=2023" / "month=05" / "video1.mp4").exists()
+            assert (dest_dir / "year=2023" / "month=06" / "video2.mp4").exists()
 
-    def test_offload_videos_invalid_year_month_format(self, app):
+    def test_offload_videos_invalid_year_month_format(self, app, tmp_path):
         """Test offload_videos handles invalid year-month format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video = self.create_test_video_file(source_dir / "video.mp4")
+        video = self.create_test_video_file(source_dir / "video.mp4")
 
-            # Mock bucket_videos to return an invalid year-month format
-            with patch.object(app, 'read_videos') as mock_read:
-                mock_read.return_value = [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]
+        # Mock bucket_videos to return an invalid year-month format
+        with patch.object(app, 'read_videos') as mock_read:
+            mock_read.return_value = [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]
 
-                with patch.object(app, 'bucket_videos') as mock_bucket:
-                    # Return a bucket with invalid format
-                    mock_bucket.return_value = {
-                        "invalid-format": [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]}
+            with patch.object(app, 'bucket_videos') as mock_bucket:
+                # Return a bucket with invalid format
+                mock_bucket.return_value = {
+                    "invalid-format": [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]}
 
-                    app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
+                app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
 
-                    # Should save to unknown directory
-                    assert (dest_dir / "unknown").exists()
-                    assert (dest_dir / "unknown" / "video.mp4").exists()
+                # Should save to unknown directory
+                assert (dest_dir / "unknown").exists()
+                assert (dest_dir / "unknown" / "video.mp4").exists()
 
-    def test_offload_videos_unknown_date_archive_mode(self, app):
+    def test_offload_videos_unknown_date_archive_mode(self, app, tmp_path):
         """Test offload_videos archives videos without dates to unknown directory when keep_unknown=True."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video = self.create_test_video_file(source_dir / "video.mp4")
+        video = self.create_test_video_file(source_dir / "video.mp4")
 
-            with patch.object(app, '_extract_metadata') as mock_extract:
-                mock_extract.return_value = VideoMetadata(path=video, date_taken=None)
+        with patch.object(app, '_extract_metadata_batch') as mock_extract:
+            mock_extract.return_value = [VideoMetadata(path=video, date_taken=None)]
 
-                app.offload_videos(source_dir, dest_dir, to_archive=True, keep_unknown=True)
+            app.offload_videos(source_dir, dest_dir, to_archive=True, keep_unknown=True)
 
-                # Check unknown directory has zip file
-                assert (dest_dir / "unknown").exists()
-                assert (dest_dir / "unknown" / "videos.zip").exists()
+            # Check unknown directory has zip file
+            assert (dest_dir / "unknown").exists()
+            assert (dest_dir / "unknown" / "videos.zip").exists()
 
-    def test_offload_videos_invalid_format_archive_mode(self, app):
+    def test_offload_videos_invalid_format_archive_mode(self, app, tmp_path):
         """Test offload_videos archives videos with invalid year-month format to unknown directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video = self.create_test_video_file(source_dir / "video.mp4")
+        video = self.create_test_video_file(source_dir / "video.mp4")
 
-            # Mock bucket_videos to return an invalid year-month format
-            with patch.object(app, 'read_videos') as mock_read:
-                mock_read.return_value = [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]
+        # Mock bucket_videos to return an invalid year-month format
+        with patch.object(app, 'read_videos') as mock_read:
+            mock_read.return_value = [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]
 
-                with patch.object(app, 'bucket_videos') as mock_bucket:
-                    # Return a bucket with invalid format
-                    mock_bucket.return_value = {
-                        "invalid-format": [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]}
+            with patch.object(app, 'bucket_videos') as mock_bucket:
+                # Return a bucket with invalid format
+                mock_bucket.return_value = {
+                    "invalid-format": [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]}
 
-                    app.offload_videos(source_dir, dest_dir, to_archive=True, keep_unknown=True)
+                app.offload_videos(source_dir, dest_dir, to_archive=True, keep_unknown=True)
 
-                    # Should save to unknown directory as zip
-                    assert (dest_dir / "unknown").exists()
-                    assert (dest_dir / "unknown" / "videos.zip").exists()
+                # Should save to unknown directory as zip
+                assert (dest_dir / "unknown").exists()
+                assert (dest_dir / "unknown" / "videos.zip").exists()
 
-    def test_offload_videos_skip_unknown_date(self, app):
+    def test_offload_videos_skip_unknown_date(self, app, tmp_path):
         """Test offload_videos skips videos without dates when keep_unknown=False."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-            video = self.create_test_video_file(source_dir / "video.mp4")
+        video = self.create_test_video_file(source_dir / "video.mp4")
 
-            with patch.object(app, '_extract_metadata') as mock_extract:
-                mock_extract.return_value = VideoMetadata(path=video, date_taken=None)
+        with patch.object(app, '_extract_metadata_batch') as mock_extract:
+            mock_extract.return_value = [VideoMetadata(path=video, date_taken=None)]
 
-                app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=False)
+            app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=False)
 
-                # Check unknown directory does NOT exist
-                assert not (dest_dir / "unknown").exists()
-                # Video should not be copied anywhere
-                assert not (dest_dir / "video.mp4").exists()
+            # Check unknown directory does NOT exist
+            assert not (dest_dir / "unknown").exists()
+            # Video should not be copied anywhere
+            assert not (dest_dir / "video.mp4").exists()
 
-    def test_offload_videos_skip_invalid_format(self, app):
+    def test_offload_videos_skip_invalid_format(self, app, tmp_path):
         """Test offload_videos skips videos with invalid year-month format when keep_unknown=False."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
-
-            video = self.create_test_video_file(source_dir / "video.mp4")
-
-            # Mock bucket_videos to return an invalid year-month format
-            with patch.object(app, 'read_videos') as mock_read:
-                mock_read.return_value = [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
 
-                with patch.object(app, 'bucket_videos') as mock_bucket:
-                    # Return a bucket with invalid format
-                    mock_bucket.return_value = {
-                        "invalid-format": [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]}
+        video = self.create_test_video_file(source_dir / "video.mp4")
 
-                    app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=False)
+        # Mock bucket_videos to return an invalid year-month format
+        with patch.object(app, 'read_videos') as mock_read:
+            mock_read.return_value = [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]
 
-                    # Should NOT save to unknown directory
-                    assert not (dest_dir / "unknown").exists()
-                    # Video should not be copied anywhere
-                    assert not (dest_dir / "video.mp4").exists()
+            with patch.object(app, 'bucket_videos') as mock_bucket:
+                # Return a bucket with invalid format
+                mock_bucket.return_value = {
+                    "invalid-format": [VideoMetadata(path=video, date_taken=datetime(2023, 5, 15))]}
 
-    def test_offload_videos_use_file_date(self, app):
-        """Test offload_videos uses file creation date when metadata date is missing and use_file_date=True."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
-            source_dir.mkdir()
+                app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=False)
 
-            video = self.create_test_video_file(source_dir / "video.mp4")
-            # Get the actual file creation date
-            file_date = VideoOffloader._get_file_creation_date(video)
-            assert file_date is not None
-
-            # Mock exiftool to return no date
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                mock_exiftool.get_metadata = MagicMock(return_value=[{}])
-                mock_exiftool_class.return_value = mock_exiftool
-
-                # Test offload_videos with use_file_date
-                app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True, use_file_date=True)
-
-                # Should be organized by file date, not saved to unknown
-                year = file_date.year
-                month = file_date.month
-                assert (dest_dir / f"year={year}" / f"month={month:02d}").exists()
+                # Should NOT save to unknown directory
                 assert not (dest_dir / "unknown").exists()
+                # Video should not be copied anywhere
+                assert not (dest_dir / "video.mp4").exists()
 
-    def test_offload_videos_use_file_date(self, app):
-        """Test offload_videos uses file creation date when metadata date is missing and use_file_date=True."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir) / "source"
-            dest_dir = Path(tmpdir) / "dest"
+    def test_offload_videos_batches_exiftool_calls(self, app, mock_exiftool, tmp_path):
+        """Test offload_videos reads the metadata of all videos of a batch with a single exiftool call."""
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
+        video_count = 50
+        for index in range(video_count):
+            self.create_test_video_file(source_dir / f"video{index}.mp4")
+        mock_exiftool.get_tags.side_effect = exiftool_answer({'QuickTime:CreateDate': '2023:05:15 14:30:00'})
+
+        app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True)
+
+        assert mock_exiftool.get_tags.call_count == 1
+        assert len(mock_exiftool.get_tags.call_args.args[0]) == video_count
+        assert len(list((dest_dir / "year=2023" / "month=05").iterdir())) == video_count
+
+    def test_offload_videos_reuses_exiftool_across_calls(self, app, mock_exiftool_class, mock_exiftool, tmp_path):
+        """Test repeated offload_videos calls on one VideoOffloader share a single exiftool process."""
+        mock_exiftool.get_tags.side_effect = exiftool_answer({'QuickTime:CreateDate': '2023:05:15 14:30:00'})
+        for name in ("first", "second"):
+            source_dir = tmp_path / name
             source_dir.mkdir()
-
-            video = self.create_test_video_file(source_dir / "video.mp4")
-            # Get the actual file creation date
-            file_date = VideoOffloader._get_file_creation_date(video)
-            assert file_date is not None
-
-            # Mock exiftool to return no date
-            with patch('exiftool.ExifToolHelper') as mock_exiftool_class:
-                mock_exiftool = MagicMock()
-                mock_exiftool.__enter__ = MagicMock(return_value=mock_exiftool)
-                mock_exiftool.__exit__ = MagicMock(return_value=None)
-                mock_exiftool.get_metadata = MagicMock(return_value=[{}])
-                mock_exiftool_class.return_value = mock_exiftool
-
-                # Test offload_videos with use_file_date
-                app.offload_videos(source_dir, dest_dir, to_archive=False, keep_unknown=True, use_file_date=True)
-
-                # Should be organized by file date, not saved to unknown
-                year = file_date.year
-                month = file_date.month
-                assert (dest_dir / f"year={year}" / f"month={month:02d}").exists()
-                assert not (dest_dir / "unknown").exists()
+            self.create_test_video_file(source_dir / "video.mp4")
+
+            app.offload_videos(source_dir, tmp_path / "dest", to_archive=False)
+
+        assert mock_exiftool.get_tags.call_count == 2
+        mock_exiftool_class.assert_called_once()
+
+    @pytest.mark.parametrize("metadata,use_file_date,expect_unknown", [
+        ({}, True, False),
+        ({}, False, True),
+        ({'QuickTime:CreateDate': '2020:01:02 03:04:05'}, False, False),
+    ], ids=["file_date_fallback", "unknown_without_fallback", "metadata_date"])
+    def test_offload_videos_use_file_date(
+        self, logger, exiftool_helper, monkeypatch, tmp_path, metadata, use_file_date, expect_unknown
+    ):
+        """Test offload_videos falls back to the file creation date only when metadata has no date and it is enabled."""
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
+
+        video = self.create_test_video_file(source_dir / "video.mp4")
+        # Get the actual file creation date
+        file_date = VideoOffloader._get_file_creation_date(video)
+        assert file_date is not None
+
+        # Simulate the exiftool helper's answer, passing it in instead of patching the class
+        get_tags = MagicMock(side_effect=exiftool_answer(metadata))
+        monkeypatch.setattr(exiftool_helper, "get_tags", get_tags)
+
+        with VideoOffloader(logger, exiftool_helper=exiftool_helper) as app:
+            app.offload_videos(
+                source_dir, dest_dir, to_archive=False, keep_unknown=True, use_file_date=use_file_date)
+
+        # Only the date tags are read, without extracting embedded data
+        assert get_tags.call_args.kwargs['params'] == VideoOffloader.EXIFTOOL_FAST_PARAMS
+        assert 'GPSCoordinates' not in get_tags.call_args.kwargs['tags']
+
+        partitions = list_partitions(dest_dir)
+        assert ("unknown" in partitions) == expect_unknown
+        if not expect_unknown:
+            expected_date = datetime(2020, 1, 2) if metadata else file_date
+            assert f"month={expected_date.month:02d}" in partitions[f"year={expected_date.year}"]